@@ -391,6 +391,15 @@ class CassetteFile:
         self.file_content.print_code_lines()
         print("*" * 79)
 
+    def create_from_filename_block(self, codepoints):
+        """
+        Take only the meta information, the file content is not parsed.
+        So all file types are supported, e.g.: binary files.
+        """
+        self.filename = codepoints2string(codepoints[:8]).rstrip()
+        self.file_type, self.ascii_flag, self.gap_flag = codepoints[8:11]
+        self.is_tokenized = self.ascii_flag == self.cfg.BASIC_TOKENIZED
+
     def get_filename_block_as_codepoints(self):
         """
         TODO: Support tokenized BASIC. Now we only create ASCII BASIC.
@@ -658,7 +667,7 @@ class Cassette:
 
         def _write(f, codepoint):
             try:
-                f.write(chr(codepoint))
+                f.write(bytes((codepoint,)))
             except ValueError as err:
                 log.error(f"Value error with {repr(codepoint)}: {err}")
                 raise
@@ -705,6 +714,74 @@ class Cassette:
                 )
 
 
+class RawCassette(Cassette):
+    """
+    Holds the blocks as they are on the tape: The file content is not parsed,
+    so all file types are supported. e.g.: for the cassette ROM trap of DragonPy
+
+    >>> from PyDC.PyDC.configs import Dragon32Config
+    >>> c = RawCassette(Dragon32Config())
+    >>> c.buffer_block(0x00, 11, b"HELLO   " + bytes([0x02, 0x00, 0x00]))
+    >>> c.buffer_block(0x01, 3, b"ABC")
+    >>> c.buffer_block(0xff, 0, b"")
+    >>> [(block_type, data) for file_obj, block_type, data in c.blocks]
+    [(0, b'HELLO   \\x02\\x00\\x00'), (1, b'ABC'), (255, b'')]
+    >>> c.files
+    [<BlockFile 'HELLO'>]
+    >>> stream = list(c.codepoint_stream())
+    >>> stream[-13:]
+    [85, 60, 1, 3, (65, 66, 67), 202, 85, 85, 60, 255, 0, 255, 85]
+    """
+
+    def __init__(self, cfg):
+        super().__init__(cfg)
+        self.blocks = []  # (CassetteFile, block type, block data)
+
+    def add_from_wav(self, source_file):
+        bitstream = iter(Wave2Bitstream(source_file, self.cfg))
+        self.feed_all(BitstreamHandler(self, self.cfg), bitstream)
+
+    def add_from_cas(self, source_file):
+        self.feed_all(BytestreamHandler(self, self.cfg), CasStream(source_file))
+
+    def feed_all(self, handler, stream):
+        """
+        The handler stops after the end-of-file block: Feed until no more block was found
+        """
+        while True:
+            block_count = len(self.blocks)
+            try:
+                handler.feed(stream)
+            except StopIteration:  # End of the .cas file
+                break
+            if len(self.blocks) == block_count:
+                break
+
+    def buffer_block(self, block_type, block_length, block_codepoints):
+        data = bytes(itertools.islice(block_codepoints, block_length))
+        if block_type == self.cfg.FILENAME_BLOCK:
+            self.current_file = CassetteFile(self.cfg)
+            self.current_file.create_from_filename_block(data)
+            log.info(f"Add file {repr(self.current_file)}")
+            self.files.append(self.current_file)
+        elif self.current_file is None:
+            # e.g.: a headerless file
+            self.current_file = CassetteFile(self.cfg)
+            self.current_file.filename = ""
+            self.current_file.gap_flag = self.cfg.NO_GAPS
+        self.blocks.append((self.current_file, block_type, data))
+
+    def buffer2file(self):
+        pass  # The blocks are stored as they are
+
+    def codepoint_stream(self):
+        for file_obj, block_type, data in self.blocks:
+            if block_type == self.cfg.FILENAME_BLOCK and file_obj.gap_flag != self.cfg.GAPS:
+                # block2codepoint_stream() yields the leader only for files with gaps
+                yield [self.cfg.LEAD_BYTE_CODEPOINT for _ in range(self.cfg.LEAD_BYTE_LEN)]
+            yield from self.block2codepoint_stream(file_obj, block_type, data)
+
+
 if __name__ == "__main__":
     #     import doctest
     #     print doctest.testmod(
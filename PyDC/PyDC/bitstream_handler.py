@@ -102,7 +102,7 @@ class BitstreamHandlerBase:
 
             try:
                 self.sync_bitstream(bitstream)  # Sync bitstream with SYNC_BYTE
-            except SyncByteNotFoundError as err:
+            except (SyncByteNotFoundError, EOFError) as err:
                 log.error(err)
                 log.info(f"Last wave pos: {bitstream.pformat_pos()}")
                 break
@@ -281,23 +281,21 @@ class CasStream:
     def __next__(self):
         byte = next(self.file_generator)
         if self.yield_ord:
-            return ord(byte)
-        else:
             return byte
+        else:
+            return bytes((byte,))
 
     def __file_generator(self):
         max = self.file_size + 1
         with open(self.source_filepath, "rb") as f:
-            for chunk in iter(functools.partial(f.read, 1024), ""):
+            for chunk in iter(functools.partial(f.read, 1024), b""):
                 for byte in chunk:
                     self.pos += 1
                     assert self.pos < max
                     yield byte
 
     def get_ord(self):
-        byte = next(self)
-        codepoint = ord(byte)
-        return codepoint
+        return next(self)
 
 
 class BytestreamHandler(BitstreamHandlerBase):
@@ -307,6 +305,8 @@ class BytestreamHandler(BitstreamHandlerBase):
 
     def sync_bitstream(self, bitstream):
         leadin_bytes_count, sync_byte = count_the_same(bitstream, self.cfg.LEAD_BYTE_CODEPOINT)
+        if sync_byte is None:
+            raise StopIteration  # No more bytes in the stream
         if leadin_bytes_count == 0:
             log.error("Leadin byte not found in file!")
         else:
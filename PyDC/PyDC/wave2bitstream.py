@@ -9,8 +9,8 @@ import array
 import functools
 import itertools
 import logging
-import math
 import struct
+import sys
 import time
 import wave
 
@@ -32,11 +32,10 @@ from PyDC.PyDC.utils import (
 
 
 try:
-    import audioop
-except ImportError as err:
-    # e.g. PyPy, see: http://bugs.pypy.org/msg4430
-    print("Can't use audioop:", err)
-    audioop = None
+    import numpy
+except ImportError:
+    # Optional: Without NumPy every sample is processed in Python
+    numpy = None
 
 
 log = logging.getLogger("PyDC")
@@ -46,7 +45,12 @@ WAVE_READ_SIZE = 16 * 1024  # How many frames should be read from WAVE file at o
 WAV_ARRAY_TYPECODE = {
     1: "b",  # 8-bit wave file
     2: "h",  # 16-bit wave file
-    4: "l",  # 32-bit wave file TODO: Test it
+    4: "i",  # 32-bit wave file TODO: Test it
+}
+WAV_NUMPY_DTYPE = {
+    1: "u1",  # 8-bit wave file: unsigned samples
+    2: "<i2",  # 16-bit wave file
+    4: "<i4",  # 32-bit wave file
 }
 
 # Maximum volume value in wave files:
@@ -101,10 +105,20 @@ class WaveBase:
 
 class Wave2Bitstream(WaveBase):
 
-    def __init__(self, wave_filename, cfg):
+    def __init__(self, wave_filename, cfg, use_numpy=None):
+        """
+        use_numpy: Process the samples chunk by chunk with NumPy,
+            the default is True if NumPy is installed. The bitstream is the same.
+        """
         self.wave_filename = wave_filename
         self.cfg = cfg
 
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError("NumPy is not installed")
+        self.use_numpy = use_numpy
+
         self.half_sinus = False  # in trigger yield the full cycle
         self.wave_pos = 0  # Absolute position in the frame stream
 
@@ -117,8 +131,7 @@ class Wave2Bitstream(WaveBase):
         except OSError as err:
             msg = f"Error opening {repr(wave_filename)}: {err}"
             log.error(msg)
-            sys.stderr.write(msg)
-            sys.exit(-1)
+            raise
 
         self.set_wave_properties()
 
@@ -131,16 +144,23 @@ class Wave2Bitstream(WaveBase):
         self.half_sinus = False  # in trigger yield the full cycle
         self.frame_no = None
 
-        # create the generator chain:
+        if use_numpy:
+            self.create_numpy_chain()
+        else:
+            self.create_chain()
 
+    def create_chain(self):
+        """
+        create the generator chain
+        """
         # get frame numer + volume value from the WAVE file
         self.wave_values_generator = self.iter_wave_values()
 
-        if cfg.AVG_COUNT > 1:
+        if self.cfg.AVG_COUNT > 1:
             # merge samples to a average sample
-            log.debug(f"Merge {cfg.AVG_COUNT} audio sample to one average sample")
+            log.debug(f"Merge {self.cfg.AVG_COUNT} audio sample to one average sample")
             self.avg_wave_values_generator = self.iter_avg_wave_values(
-                self.wave_values_generator, cfg.AVG_COUNT
+                self.wave_values_generator, self.cfg.AVG_COUNT
             )
             # trigger sinus cycle
             self.iter_trigger_generator = self.iter_trigger(self.avg_wave_values_generator)
@@ -154,11 +174,32 @@ class Wave2Bitstream(WaveBase):
         # build from sinus cycle duration the bit stream
         self.iter_bitstream_generator = self.iter_bitstream(self.iter_duration_generator)
 
+    def create_numpy_chain(self):
+        """
+        create the same generator chain, but every step processes a whole chunk of samples
+        """
+        # get the frame numbers + volume values from the WAVE file
+        wave_arrays = self.iter_wave_arrays()
+
+        if self.cfg.AVG_COUNT > 1:
+            # merge samples to a average sample
+            log.debug(f"Merge {self.cfg.AVG_COUNT} audio sample to one average sample")
+            wave_arrays = self.iter_avg_wave_arrays(wave_arrays, self.cfg.AVG_COUNT)
+
+        # trigger sinus cycle
+        self.iter_trigger_generator = ArrayTrigger(self, self.iter_crossing_arrays(wave_arrays))
+
+        # duration of a complete sinus cycle
+        self.iter_duration_generator = self.iter_duration(self.iter_trigger_generator)
+
+        # build from sinus cycle duration the bit stream
+        self.iter_bitstream_generator = self.iter_bitstream_numpy(self.iter_duration_generator)
+
     def _print_status(self, process_info):
         percent = float(self.wave_pos) / self.frame_count * 100
         rest, eta, rate = process_info.update(self.wave_pos)
         sys.stdout.write(
-            f"\r{percent:.1f}% wav pos:{self.pformat_pos()} - eta: {eta} (rate: {rate:d}Frames/sec)       ")
+            f"\r{percent:.1f}% wav pos:{self.pformat_pos()} - eta: {eta} (rate: {rate:.0f}Frames/sec)       ")
         sys.stdout.flush()
 
     def _get_statistics(self, max=None):
@@ -221,8 +262,7 @@ class Wave2Bitstream(WaveBase):
         try:
             next(self)
         except StopIteration:
-            print("Error: no bits identified!")
-            sys.exit(-1)
+            raise EOFError("Error: no bits identified!")
 
         log.info(f"First bit is at: {self.pformat_pos()}")
         log.debug("enable half sinus scan")
@@ -256,13 +296,10 @@ class Wave2Bitstream(WaveBase):
     def __next__(self):
         return next(self.iter_bitstream_generator)
 
-    def iter_bitstream(self, iter_duration_generator):
+    def _get_bit_durations(self):
         """
-        iterate over self.iter_trigger() and
-        yield the bits
+        returns the min/max durations of bit 0 and bit 1
         """
-        assert self.half_sinus is False  # Allways trigger full sinus cycle
-
         # build min/max Hz values
         bit_nul_min_hz = self.cfg.BIT_NUL_HZ - self.cfg.HZ_VARIATION
         bit_nul_max_hz = self.cfg.BIT_NUL_HZ + self.cfg.HZ_VARIATION
@@ -287,6 +324,43 @@ class Wave2Bitstream(WaveBase):
         ), f"HZ_VARIATION value is {(bit_nul_max_hz - bit_one_min_hz) / 2 + 1}Hz too high!"
         assert bit_one_max_duration < bit_nul_min_duration, "HZ_VARIATION value is too high!"
 
+        return bit_nul_min_duration, bit_nul_max_duration, bit_one_min_duration, bit_one_max_duration
+
+    def _log_bit_statistics(self, bit_one_count, one_hz, bit_nul_count, nul_hz):
+        """
+        one_hz/nul_hz: (min, avg, max) Hz values of the bits
+        """
+        bit_count = bit_one_count + bit_nul_count
+
+        if bit_count == 0:
+            raise EOFError("Error: No information from wave to generate the bits (trigger volume to high?)")
+
+        log.info(f"\n{bit_count:d} Bits: {bit_one_count:d} positive bits and {bit_nul_count:d} negative bits")
+        if bit_one_count > 0:
+            one_hz_min, one_hz_avg, one_hz_max = one_hz
+            log.info(
+                f"Bit 1: {one_hz_min}Hz - {one_hz_max}Hz avg:"
+                f" {one_hz_avg:.1f}Hz variation: {one_hz_max - one_hz_min}Hz"
+            )
+        if bit_nul_count > 0:
+            nul_hz_min, nul_hz_avg, nul_hz_max = nul_hz
+            log.info(
+                f"Bit 0: {nul_hz_min}Hz - {nul_hz_max}Hz avg:"
+                f" {nul_hz_avg:.1f}Hz variation: {nul_hz_max - nul_hz_min}Hz"
+            )
+
+    def iter_bitstream(self, iter_duration_generator):
+        """
+        iterate over self.iter_trigger() and
+        yield the bits
+        """
+        assert self.half_sinus is False  # Allways trigger full sinus cycle
+
+        (
+            bit_nul_min_duration, bit_nul_max_duration,
+            bit_one_min_duration, bit_one_max_duration
+        ) = self._get_bit_durations()
+
         # for end statistics
         bit_one_count = 0
         one_hz_min = sys.maxsize
@@ -330,47 +404,104 @@ class Wave2Bitstream(WaveBase):
                         )
                 continue
 
-        bit_count = bit_one_count + bit_nul_count
+        self._log_bit_statistics(
+            bit_one_count, (one_hz_min, one_hz_avg, one_hz_max),
+            bit_nul_count, (nul_hz_min, nul_hz_avg, nul_hz_max),
+        )
 
-        if bit_count == 0:
-            print("ERROR: No information from wave to generate the bits")
-            print("trigger volume to high?")
-            sys.exit(-1)
+    def iter_bitstream_numpy(self, iter_duration):
+        """
+        yield the bits like self.iter_bitstream(), but the durations of all
+        triggers in the current chunk are classified at once.
 
-        log.info(f"\n{bit_count:d} Bits: {bit_one_count:d} positive bits and {bit_nul_count:d} negative bits")
-        if bit_one_count > 0:
-            log.info(
-                f"Bit 1: {one_hz_min}Hz - {one_hz_max}Hz avg:"
-                f" {one_hz_avg:.1f}Hz variation: {one_hz_max - one_hz_min}Hz"
-            )
-        if bit_nul_count > 0:
-            log.info(
-                f"Bit 0: {nul_hz_min}Hz - {nul_hz_max}Hz avg:"
-                f" {nul_hz_avg:.1f}Hz variation: {nul_hz_max - nul_hz_min}Hz"
-            )
+        sync() consumes triggers between two bits: Then the bits of the
+        rest of the chunk are classified again.
+        """
+        assert self.half_sinus is False  # Allways trigger full sinus cycle
+
+        (
+            bit_nul_min_duration, bit_nul_max_duration,
+            bit_one_min_duration, bit_one_max_duration
+        ) = self._get_bit_durations()
+
+        trigger = iter_duration.iter_trigger
+
+        # for end statistics: [count, min Hz, Hz sum, max Hz]
+        bit_statistics = {
+            0: [0, sys.maxsize, 0, 0],
+            1: [0, sys.maxsize, 0, 0],
+        }
+
+        while True:
+            try:
+                old_pos = iter_duration.get_old_pos()
+            except StopIteration:
+                break
+
+            # The full sinus cycles: the rising triggers in the rest of the chunk
+            indexes = trigger.index + numpy.flatnonzero(trigger.rising[trigger.index:])
+            if len(indexes) == 0:
+                try:
+                    trigger.next_chunk()
+                except StopIteration:
+                    iter_duration.finish()
+                    break
+                continue
+
+            positions = trigger.positions[indexes]
+            durations = numpy.diff(positions, prepend=old_pos)
+
+            is_one = (bit_one_min_duration < durations) & (durations < bit_one_max_duration)
+            is_nul = (bit_nul_min_duration < durations) & (durations < bit_nul_max_duration)
+            bit_indexes = numpy.flatnonzero(is_one | is_nul)  # Skip durations out of frequency range
+            bits = is_one[bit_indexes]
+            log.log(5, f"{len(bits):d} bits in {len(durations):d} durations until {self.pformat_pos()}")
+
+            bit_count = 0
+            read_count = trigger.read_count
+            for bit, index, pos in zip(
+                bits.tolist(), indexes[bit_indexes].tolist(), positions[bit_indexes].tolist()
+            ):
+                trigger.index = index + 1
+                iter_duration.old_pos = pos
+                yield int(bit)
+                bit_count += 1
+                if trigger.read_count != read_count:
+                    # sync() consumed triggers
+                    break
+            else:
+                # The durations after the last bit are out of frequency range
+                trigger.index = int(indexes[-1]) + 1
+                iter_duration.old_pos = int(positions[-1])
+
+            bits = bits[:bit_count]
+            hz_values = numpy.rint(self.framerate / durations[bit_indexes[:bit_count]]).astype(numpy.int64)
+            for bit in (0, 1):
+                bit_hz_values = hz_values[bits == bit]
+                if len(bit_hz_values):
+                    statistics = bit_statistics[bit]
+                    statistics[0] += len(bit_hz_values)
+                    statistics[1] = min(statistics[1], int(bit_hz_values.min()))
+                    statistics[2] += int(bit_hz_values.sum())
+                    statistics[3] = max(statistics[3], int(bit_hz_values.max()))
+
+            iter_duration.update_status()
+
+        hz_info = {}
+        for bit, (count, hz_min, hz_sum, hz_max) in bit_statistics.items():
+            hz_info[bit] = (hz_min, hz_sum / count if count else None, hz_max)
+        self._log_bit_statistics(bit_statistics[1][0], hz_info[1], bit_statistics[0][0], hz_info[0])
 
     def iter_duration(self, iter_trigger):
         """
         yield the duration of two frames in a row.
         """
-        print()
-        process_info = ProcessInfo(self.frame_count, use_last_rates=4)
-        start_time = time.time()
-        next_status = start_time + 0.25
-
-        old_pos = next(iter_trigger)
-        for pos in iter_trigger:
-            duration = pos - old_pos
-#             log.log(5, "Duration: %s" % duration)
-            yield duration
-            old_pos = pos
-
-            if time.time() > next_status:
-                next_status = time.time() + 1
-                self._print_status(process_info)
-
-        self._print_status(process_info)
-        print()
+        return DurationIterator(self, iter_trigger)
+
+    def _get_mid_index(self):
+        if self.cfg.MID_COUNT > 3:
+            return int(round(self.cfg.MID_COUNT / 2.0))
+        return 0
 
     def iter_trigger(self, iter_wave_values):
         """
@@ -384,10 +515,7 @@ class Wave2Bitstream(WaveBase):
         # sinus curve goes from positive into negative:
         neg_null_transit = [(self.cfg.END_COUNT, 0), (0, self.cfg.END_COUNT)]
 
-        if self.cfg.MID_COUNT > 3:
-            mid_index = int(round(self.cfg.MID_COUNT / 2.0))
-        else:
-            mid_index = 0
+        mid_index = self._get_mid_index()
 
         in_pos = False
         for values in iter_window(iter_wave_values, window_size):
@@ -422,6 +550,7 @@ class Wave2Bitstream(WaveBase):
                 in_pos = False
 
     def iter_avg_wave_values(self, wave_values_generator, avg_count):
+        tlm = None
         if log.level >= 5:
             tlm = TextLevelMeter(self.max_value, 79)
 
@@ -438,11 +567,36 @@ class Wave2Bitstream(WaveBase):
                         )
             yield (self.wave_pos, avg_value)
 
+    def iter_wave_blocks(self):
+        """
+        yield the frames from the WAVE file in blocks of complete samples
+        """
+        # Use only a read size which is a quare divider of the samplewidth
+        divider = int(round(float(WAVE_READ_SIZE) / self.samplewidth))
+        read_size = self.samplewidth * divider
+        if read_size != WAVE_READ_SIZE:
+            log.info(f"Real use wave read size: {read_size:d} Bytes")
+
+        get_wave_block_func = functools.partial(self.wavefile.readframes, read_size)
+        for frames in iter(get_wave_block_func, b""):
+            rest = len(frames) % self.samplewidth
+            if rest:
+                # Otherwise array.array will raise: ValueError: string length not a multiple of item size
+                # Work-a-round: Skip the last frames of this block
+                log.error(f"Skip {rest:d} frames of a incomplete sample (use {len(frames) - rest:d} frames)")
+                frames = frames[:-rest]
+            yield frames
+
     def iter_wave_values(self):
         """
         yield frame numer + volume value from the WAVE file
         """
         typecode = self.get_typecode(self.samplewidth)
+        bias = 0
+        if self.samplewidth == 1:
+            # 8 bit samples are unsigned
+            typecode = "B"
+            bias = -128
 
         # if log.level >= 5:
         #     if self.cfg.AVG_COUNT > 1:
@@ -451,62 +605,210 @@ class Wave2Bitstream(WaveBase):
         #     else:
         #         tlm = TextLevelMeter(self.max_value, 79)
 
-        # Use only a read size which is a quare divider of the samplewidth
-        # Otherwise array.array will raise: ValueError: string length not a multiple of item size
-        divider = int(round(float(WAVE_READ_SIZE) / self.samplewidth))
-        read_size = self.samplewidth * divider
-        if read_size != WAVE_READ_SIZE:
-            log.info(f"Real use wave read size: {read_size:d} Bytes")
-
-        get_wave_block_func = functools.partial(self.wavefile.readframes, read_size)
         skip_count = 0
 
-        manually_audioop_bias = self.samplewidth == 1 and audioop is None
-
-        for frames in iter(get_wave_block_func, ""):
-
-            if self.samplewidth == 1:
-                if audioop is None:
-                    log.warning("use audioop.bias() work-a-round for missing audioop.")
-                else:
-                    # 8 bit samples are unsigned, see:
-                    # http://docs.python.org/2/library/audioop.html#audioop.lin2lin
-                    frames = audioop.bias(frames, 1, 128)
-
-            try:
-                values = array.array(typecode, frames)
-            except ValueError as err:
-                # e.g.:
-                #     ValueError: string length not a multiple of item size
-                # Work-a-round: Skip the last frames of this block
-                frame_count = len(frames)
-                divider = int(math.floor(float(frame_count) / self.samplewidth))
-                new_count = self.samplewidth * divider
-                frames = frames[:new_count]  # skip frames
-                log.error(
-                    "Can't make array from %s frames: Value error: %s (Skip %i and use %i frames)" % (
-                        frame_count, err, frame_count - new_count, len(frames)
-                    ))
-                values = array.array(typecode, frames)
-
-            for value in values:
+        for frames in self.iter_wave_blocks():
+            for value in array.array(typecode, frames):
                 self.wave_pos += 1  # Absolute position in the frame stream
 
-                if manually_audioop_bias:
-                    # audioop.bias can't be used.
-                    # See: http://hg.python.org/cpython/file/482590320549/Modules/audioop.c#l957
-                    value = value % 0xff - 128
-
 #                 if abs(value) < self.min_volume:
 # #                     log.log(5, "Ignore to lower amplitude")
 #                     skip_count += 1
 #                     continue
 
-                yield (self.wave_pos, value)
+                yield (self.wave_pos, value + bias)
 
         log.info(f"Skip {skip_count:d} samples that are lower than {self.min_volume:d}")
         log.info(f"Last readed Frame is: {self.pformat_pos()}")
 
+    def iter_wave_arrays(self):
+        """
+        yield the frame numbers + volume values from the WAVE file as arrays, block by block
+        """
+        self.get_typecode(self.samplewidth)  # Raise NotImplementedError for unsupported files
+        dtype = WAV_NUMPY_DTYPE[self.samplewidth]
+
+        for frames in self.iter_wave_blocks():
+            values = numpy.frombuffer(frames, dtype=dtype).astype(numpy.int64)
+            if self.samplewidth == 1:
+                values -= 128  # 8 bit samples are unsigned
+            positions = numpy.arange(self.wave_pos + 1, self.wave_pos + 1 + len(values))
+            self.wave_pos += len(values)  # Absolute position in the frame stream
+            yield positions, values
+
+        log.info(f"Last readed Frame is: {self.pformat_pos()}")
+
+    def iter_avg_wave_arrays(self, wave_arrays, avg_count):
+        """
+        merge avg_count samples to one average sample, like self.iter_avg_wave_values()
+        """
+        # The samples of a incomplete step are merged with the next block:
+        rest_positions = rest_values = numpy.empty(0, dtype=numpy.int64)
+        for positions, values in wave_arrays:
+            positions = numpy.concatenate((rest_positions, positions))
+            values = numpy.concatenate((rest_values, values))
+            count = len(values) - len(values) % avg_count
+            rest_positions, rest_values = positions[count:], values[count:]
+            yield merge_avg_arrays(positions[:count], values[:count], avg_count)
+
+        # The last incomplete step, like iter_steps()
+        yield merge_avg_arrays(rest_positions, rest_values, avg_count)
+
+    def iter_crossing_arrays(self, wave_arrays):
+        """
+        yield the positions of the middle crossings of the wave sinus curve and
+        if they are rising (the curve goes from negative into positive), block by block.
+
+        The same crossings as self.iter_trigger() yields with self.half_sinus:
+        The window of every value is checked at once.
+        """
+        end_count = self.cfg.END_COUNT
+        window_size = (2 * end_count) + self.cfg.MID_COUNT
+        next_start = window_size - end_count  # Start of the next values in the window
+        mid_index = end_count + self._get_mid_index()
+
+        in_pos = False
+        # The values of the last incomplete windows are used with the next block:
+        positions = values = numpy.empty(0, dtype=numpy.int64)
+        for block_positions, block_values in wave_arrays:
+            positions = numpy.concatenate((positions, block_positions))
+            values = numpy.concatenate((values, block_values))
+            window_count = len(values) - window_size + 1
+            if window_count < 1:
+                continue
+
+            # Count sign from previous and next values of all windows, like count_sign()
+            pos_counts = numpy.concatenate(([0], numpy.cumsum(values > 0)))
+            neg_counts = numpy.concatenate(([0], numpy.cumsum(values < 0)))
+
+            def all_values(counts, start):
+                # True for every window, if the end_count values from start on have the sign
+                end = start + end_count
+                return counts[end:end + window_count] - counts[start:start + window_count] == end_count
+
+            # sinus curve goes from negative into positive:
+            rising = all_values(neg_counts, 0) & all_values(pos_counts, next_start)
+            # sinus curve goes from positive into negative:
+            falling = all_values(pos_counts, 0) & all_values(neg_counts, next_start)
+
+            # Only the first transit of every half sinus cycle is a crossing:
+            indexes = numpy.flatnonzero(rising | falling)
+            is_rising = rising[indexes]
+            is_crossing = is_rising != numpy.concatenate(([in_pos], is_rising[:-1]))
+            indexes = indexes[is_crossing]
+            is_rising = is_rising[is_crossing]
+            if len(is_rising):
+                in_pos = bool(is_rising[-1])
+
+            yield positions[indexes + mid_index], is_rising
+
+            positions = positions[window_count:]
+            values = values[window_count:]
+
+
+def merge_avg_arrays(positions, values, avg_count):
+    """
+    Merge avg_count values to the rounded average value at the position of the
+    last value, the last step may be incomplete. Like Wave2Bitstream.iter_avg_wave_values()
+    """
+    starts = numpy.arange(0, len(values), avg_count)
+    if len(starts) == 0:
+        return positions, values
+    avg_values = numpy.rint(numpy.add.reduceat(values, starts) / avg_count).astype(numpy.int64)
+    ends = numpy.minimum(starts + avg_count, len(values)) - 1
+    return positions[ends], avg_values
+
+
+class ArrayTrigger:
+    """
+    yield the trigger positions like Wave2Bitstream.iter_trigger(),
+    from the crossing arrays of Wave2Bitstream.iter_crossing_arrays()
+
+    The index of the next crossing in the current block is shared with
+    Wave2Bitstream.iter_bitstream_numpy()
+    """
+
+    def __init__(self, wave2bitstream, crossing_arrays):
+        self.wave2bitstream = wave2bitstream
+        self.crossing_arrays = crossing_arrays
+
+        self.positions = numpy.empty(0, dtype=numpy.int64)
+        self.rising = numpy.empty(0, dtype=bool)
+        self.index = 0  # Index of the next crossing in the current block
+        self.read_count = 0  # Number of crossings read via next()
+
+    def next_chunk(self):
+        self.positions, self.rising = next(self.crossing_arrays)
+        self.index = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            while self.index >= len(self.positions):
+                self.next_chunk()
+
+            index = self.index
+            self.index += 1
+            self.read_count += 1
+            # Yield the falling crossings only in half sinus mode:
+            if self.rising[index] or self.wave2bitstream.half_sinus:
+                return int(self.positions[index])
+
+
+class DurationIterator:
+    """
+    yield the duration of two triggers in a row, see: Wave2Bitstream.iter_duration()
+    """
+
+    def __init__(self, wave2bitstream, iter_trigger):
+        self.wave2bitstream = wave2bitstream
+        self.iter_trigger = iter_trigger
+
+        self.process_info = None
+        self.next_status = None
+        self.finished = False
+        self.old_pos = None  # Position of the last trigger
+
+    def get_old_pos(self):
+        if self.old_pos is None:
+            print()
+            self.process_info = ProcessInfo(self.wave2bitstream.frame_count, use_last_rates=4)
+            self.next_status = time.time() + 0.25
+            self.old_pos = self.next_trigger()
+        return self.old_pos
+
+    def next_trigger(self):
+        try:
+            return next(self.iter_trigger)
+        except StopIteration:
+            self.finish()
+            raise
+
+    def update_status(self):
+        if time.time() > self.next_status:
+            self.next_status = time.time() + 1
+            self.wave2bitstream._print_status(self.process_info)
+
+    def finish(self):
+        if not self.finished:
+            self.finished = True
+            self.wave2bitstream._print_status(self.process_info)
+            print()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        old_pos = self.get_old_pos()
+        pos = self.next_trigger()
+        duration = pos - old_pos
+#         log.log(5, "Duration: %s" % duration)
+        self.old_pos = pos
+        self.update_status()
+        return duration
+
 
 class Bitstream2Wave(WaveBase):
     def __init__(self, destination_filepath, cfg):
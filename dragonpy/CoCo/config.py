@@ -14,9 +14,8 @@ from dragonlib.api import CoCoAPI
 
 from dragonpy import constants
 from dragonpy.CoCo.CoCo2b_rom import CoCo2b_Basic13_ROM, CoCo2b_ExtendedBasic11_ROM
-from dragonpy.CoCo.mem_info import get_coco_meminfo
 from dragonpy.Dragon32.config import Dragon32Cfg
-from dragonpy.Dragon32.keyboard_map import get_coco_keymatrix_pia_result
+from dragonpy.Dragon32.keyboard_map import COCO_KEYMAP
 
 
 log = logging.getLogger(__name__)
@@ -28,6 +27,11 @@ class CoCo2bCfg(Dragon32Cfg):
 
     # How does the keyboard polling routine starts with?
     PIA0B_KEYBOARD_START = 0xfe
+    KEYMAP = COCO_KEYMAP
+
+    # The keyboard scan address of the Dragon 32 doesn't exist in the CoCo ROMs
+    # and the CoCo address is not verified: No boot state cache and no warp stop
+    STARTUP_END_ADDR = None
 
     RAM_START = 0x0000
 
@@ -58,12 +62,20 @@ class CoCo2bCfg(Dragon32Cfg):
         CoCo2b_Basic13_ROM(address=0xA000, max_size=0x4000),
     )
 
+    # ROM cassette routines, see: dragonpy.Dragon32.cassette_trap
+    CASSETTE_READ_LEADER_ADDR = 0xa77c  # CSRDON
+    CASSETTE_READ_BLOCK_ADDR = 0xa70b  # BLKIN
+    CASSETTE_WRITE_LEADER_ADDR = 0xa7d8  # WRLDR
+    CASSETTE_WRITE_BLOCK_ADDR = 0xa7f4  # BLKOUT
+
     def __init__(self, cmd_args):
         super().__init__(cmd_args)
 
         self.machine_api = CoCoAPI()
 
         if self.verbosity <= logging.ERROR:
+            from dragonpy.CoCo.mem_info import get_coco_meminfo  # Big tables: import only if used
+
             self.mem_info = get_coco_meminfo()
 
         self.periphery_class = None  # Dragon32Periphery
@@ -101,9 +113,6 @@ class CoCo2bCfg(Dragon32Cfg):
         log.critical("%04x| write $%04x to $%04x", last_op_address, word, address)
         return word
 
-    def pia_keymatrix_result(self, inkey, pia0b):
-        return get_coco_keymatrix_pia_result(inkey, pia0b)
-
 
 config = CoCo2bCfg
 
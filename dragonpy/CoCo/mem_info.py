@@ -12,15 +12,14 @@
 
 import logging
 
-from MC6809.core.memory_info import BaseMemoryInfo
-
+from dragonpy.core.mem_info_index import IndexedMemoryInfo
 from dragonpy.Dragon64.mem_info import Dragon64MemInfo
 
 
 log = logging.getLogger(__name__)
 
 
-class CoCoColorBasic1_3MemInfo(BaseMemoryInfo):
+class CoCoColorBasic1_3MemInfo(IndexedMemoryInfo):
     """
     Color Basic v1.3 (1982)(Tandy).rom
     """
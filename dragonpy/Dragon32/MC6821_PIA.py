@@ -23,7 +23,8 @@ import queue
 
 from MC6809.utils.humanize import byte2bit_string
 
-from dragonpy import constants
+from dragonpy.Dragon32.cassette import CassetteDeck
+from dragonpy.Dragon32.keyboard_map import KeyMatrix
 from dragonpy.utils.bits import is_bit_set, set_bit
 
 
@@ -63,6 +64,26 @@ class PIA_register:
         log.error("\t Deselect 'Peripheral Data Register' in %s", self.name)
         self._pdr_selected = False
 
+    def get_state(self):
+        return {
+            "value": self.value,
+            "pdr_selected": self._pdr_selected,
+            "control_register": self.control_register,
+            "direction_register": self.direction_register,
+            "output_register": self.output_register,
+            "interrupt_received": self.interrupt_received,
+            "irq": self.irq,
+        }
+
+    def set_state(self, state):
+        self.value = state["value"]
+        self._pdr_selected = state["pdr_selected"]
+        self.control_register = state["control_register"]
+        self.direction_register = state["direction_register"]
+        self.output_register = state["output_register"]
+        self.interrupt_received = state["interrupt_received"]
+        self.irq = state["irq"]
+
 
 class PIA:
     """
@@ -87,12 +108,24 @@ class PIA:
     $ff23 PIA 1 B side Control register      CB1
     """
 
+    # All PIA_register instances, used for save states:
+    REGISTER_NAMES = (
+        "pia_0_A_register", "pia_0_B_data", "pia_0_B_control",
+        "pia_1_A_register", "pia_1_B_register",
+    )
+
     def __init__(self, cfg, cpu, memory, user_input_queue):
         self.cfg = cfg
         self.cpu = cpu
         self.memory = memory
         self.user_input_queue = user_input_queue
 
+        # Keyboard matrix state and the column mask of the ROM scan start:
+        self.key_matrix = KeyMatrix(cfg.KEYMAP)
+        self.keyboard_start = cfg.PIA0B_KEYBOARD_START
+
+        self.cassette = CassetteDeck()
+
         self.pia_0_A_register = PIA_register("PIA0 A")
         self.pia_0_B_data = PIA_register("PIA0 B data register $ff02")
         self.pia_0_B_control = PIA_register("PIA0 B control register $ff03")
@@ -144,6 +177,7 @@ class PIA:
         self.pia_0_B_control.reset()
         self.pia_1_A_register.reset()
         self.pia_1_B_register.reset()
+        self.cassette.set_motor(self.cassette.last_cycles, 0x00)  # CA2 is low after reset
 
     def internal_reset(self):
         """
@@ -151,19 +185,46 @@ class PIA:
         used e.g. in unittests
         """
         log.critical("PIA internal_reset()")
-        self.empty_key_toggle = True
-        self.current_input_char = None
-        self.input_repead = 0
+        self.key_matrix.release_all()
+        self.typed_key = None  # Key from the user input queue, pressed for one keyboard scan
+        self.pending_key = None  # Next key from the user input queue, waits for a scan without a key
+        self.scan_started = False  # PB was set to keyboard_start, see: write_PIA0_B_data()
+
+    def get_state(self):
+        state = {name: getattr(self, name).get_state() for name in self.REGISTER_NAMES}
+        state["pressed_keys"] = list(self.key_matrix.pressed_keys)
+        state["typed_key"] = self.typed_key
+        state["pending_key"] = self.pending_key
+        state["scan_started"] = self.scan_started
+        state["cassette"] = self.cassette.get_state()
+        return state
+
+    def set_state(self, state):
+        for name in self.REGISTER_NAMES:
+            getattr(self, name).set_state(state[name])
+        self.key_matrix.release_all()
+        for inkey in state["pressed_keys"]:
+            self.key_matrix.key_down(inkey)
+        self.typed_key = state["typed_key"]
+        self.pending_key = state["pending_key"]
+        self.scan_started = state["scan_started"]
+        self.cassette.set_state(state["cassette"])
 
     def read_PIA1_A_data(self, cpu_cycles, op_address, address):
-        """ read from 0xff20 -> PIA 1 A side Data reg. """
-        log.error("TODO: read from 0xff20 -> PIA 1 A side Data reg.")
-        return 0x01
+        """
+        read from 0xff20 -> PIA 1 A side Data reg.
+        bit 0 is the cassette input, see: dragonpy.Dragon32.cassette
+        """
+        if self.cassette.tape is None:
+            return 0x01
+        return self.cassette.read_bit(cpu_cycles)
 
     def read_PIA1_A_control(self, cpu_cycles, op_address, address):
-        """ read from 0xff21 -> PIA 1 A side Control reg. """
-        log.error("TODO: read from 0xff21 -> PIA 1 A side Control reg.")
-        return 0x34
+        """
+        read from 0xff21 -> PIA 1 A side Control reg.
+        The last written value, e.g.: The ROM reads it to switch the cassette motor.
+        """
+        return self.pia_1_A_register.control_register
 
     def read_PIA1_B_data(self, cpu_cycles, op_address, address):
         """ read from 0xff22 -> PIA 1 B side Data reg. """
@@ -183,15 +244,26 @@ class PIA:
             "TODO: write $%02x to 0xff20 -> PIA 1 A side Data reg.", value)
 
     def write_PIA1_A_control(self, cpu_cycles, op_address, address, value):
-        """ write to 0xff21 -> PIA 1 A side Control reg. """
-        log.error(
-            "TODO: write $%02x to 0xff21 -> PIA 1 A side Control reg.", value)
+        """
+        write to 0xff21 -> PIA 1 A side Control reg.
+        CA2 is the cassette motor control
+        """
+        log.debug("write $%02x to 0xff21 -> PIA 1 A side Control reg.", value)
+        self.pia_1_A_register.control_register = value & 0x3f  # bit 6+7 are the read only IRQ flags
+        self.cassette.set_motor(cpu_cycles, value)
 
     def write_PIA1_B_data(self, cpu_cycles, op_address, address, value):
-        """ write to 0xff22 -> PIA 1 B side Data reg. """
-        log.debug(
-            "TODO: write $%02x to 0xff22 -> PIA 1 B side Data reg.", value
-        )
+        """
+        write to 0xff22 -> PIA 1 B side Data reg.
+        bit 3-7 are the VDG mode pins, see: dragonpy.Dragon32.vdg
+        """
+        log.debug("write $%02x to 0xff22 -> PIA 1 B side Data reg.", value)
+        self.pia_1_B_register.set(value)
+
+    @property
+    def vdg_mode_bits(self):
+        """ VDG A/G, GM2-GM0 and CSS pins from PIA 1 B side Data reg. """
+        return self.pia_1_B_register.get() & 0xf8
 
     def write_PIA1_B_control(self, cpu_cycles, op_address, address, value):
         """ write to 0xff23 -> PIA 1 B side Control reg. """
@@ -226,75 +298,64 @@ class PIA:
         """
         pia0b = self.pia_0_B_data.value  # $ff02
 
-        # FIXME: Find a way to handle CoCo and Dragon in the same way!
-        if self.cfg.CONFIG_NAME == constants.COCO2B:
-            #            log.critical("\t count: %i", self.input_repead)
-            if self.input_repead == 7:
-                try:
-                    self.current_input_char = self.user_input_queue.get_nowait()
-                except queue.Empty:
-                    self.current_input_char = None
-                else:
-                    log.critical(
-                        "\tget new key from queue: %s", repr(self.current_input_char))
-            elif self.input_repead == 18:
-                #                log.critical("\tForce send 'no key pressed'")
-                self.current_input_char = None
-            elif self.input_repead > 20:
-                self.input_repead = 0
-
-            self.input_repead += 1
-        else:  # Dragon
-            if pia0b == self.cfg.PIA0B_KEYBOARD_START:  # FIXME
-                if self.empty_key_toggle:
-                    # Work-a-round for "poor" dragon keyboard scan routine:
-                    # The scan routine in ROM ignores key pressed directly behind
-                    # one another if they are in the same row!
-                    # See "Inside the Dragon" book, page 203 ;)
-                    #
-                    # Here with the empty_key_toggle, we always send a "no key pressed"
-                    # after every key press back and then we send the next key from
-                    # the self.user_input_queue
-                    #
-                    # TODO: We can check the row of the previous key press and only
-                    # force a 'no key pressed' if the row is the same
-                    self.empty_key_toggle = False
-                    self.current_input_char = None
-#                     log.critical("\tForce send 'no key pressed'")
-                else:
-                    try:
-                        self.current_input_char = self.user_input_queue.get_nowait()
-                    except queue.Empty:
-                        # log.critical("\tinput_queue is empty"))
-                        self.current_input_char = None
-                    else:
-                        # log.critical(
-                        #     "\tget new key from queue: %s", repr(self.current_input_char)
-                        # )
-                        self.empty_key_toggle = True
-
-        if self.current_input_char is None:
-            #            log.critical("\tno key pressed")
-            result = 0xff
-            self.empty_key_toggle = False
-        else:
-            #            log.critical("\tsend %s", repr(self.current_input_char))
-            result = self.cfg.pia_keymatrix_result(
-                self.current_input_char, pia0b)
+        if self.scan_started and pia0b == self.keyboard_start:
+            # First read of a new keyboard scan: The next typed key, see: type_next_key()
+            # Re-reads with the same strobe (e.g.: CoCo debounce of column 0) are in the same scan.
+            self.scan_started = False
+            self.type_next_key()
+            # Report it for the idle loop detection
+            self.cpu.idle_detector.input_polled(
+                cpu_cycles,
+                empty=self.typed_key is None and self.pending_key is None and self.user_input_queue.empty(),
+            )
 
 #         if not is_bit_set(pia0b, bit=7):
 # bit 7 | PA7 | joystick comparison input
 #             result = clear_bit(result, bit=7)
 
-#         if self.current_input_char is not None:
-#             log.critical(
-#                 "%04x| read $%04x ($ff02 is $%02x %s) send $%02x %s back\t|%s",
-#                 op_address, address,
-#                 pia0b, '{0:08b}'.format(pia0b),
-#                 result, '{0:08b}'.format(result),
-#                 self.cfg.mem_info.get_shortest(op_address)
-#             )
-        return result
+        return self.key_matrix.table[pia0b]
+
+    def type_next_key(self):
+        """
+        Called at the start of every keyboard scan: Release the typed key of
+        the last scan and press the next key from the user input queue.
+
+        The scan routine in ROM ignores keys pressed directly behind one another
+        if they are in the same row! See "Inside the Dragon" book, page 203 ;)
+        So only if the next key shares a row with the released key, the ROM
+        gets one scan with "no key pressed" in between.
+        """
+        key_matrix = self.key_matrix
+        released_rows = 0
+        if self.typed_key is not None:
+            released_rows = key_matrix.get_rows(self.typed_key)
+            key_matrix.key_up(self.typed_key)
+            self.typed_key = None
+
+        inkey = self.pending_key
+        if inkey is None:
+            try:
+                inkey = self.user_input_queue.get_nowait()
+            except queue.Empty:
+                return
+
+        if key_matrix.get_rows(inkey) & released_rows:
+            self.pending_key = inkey  # Press it in the next scan
+            return
+
+        self.pending_key = None
+        if key_matrix.key_down(inkey):
+            self.typed_key = inkey
+
+    def key_down(self, inkey):
+        """
+        Hold a key down until key_up(), e.g.: for games. Any number of keys can be down.
+        Returns False if the key is not in the keyboard matrix.
+        """
+        return self.key_matrix.key_down(inkey)
+
+    def key_up(self, inkey):
+        self.key_matrix.key_up(inkey)
 
     def write_PIA0_A_data(self, cpu_cycles, op_address, address, value):
         """ write to 0xff00 -> PIA 0 A side Data reg. """
@@ -372,6 +433,9 @@ class PIA:
             op_address, value, byte2bit_string(value),
             address, self.cfg.mem_info.get_shortest(op_address)
         )
+        if value == self.keyboard_start:
+            # Dragon: "test all keys" strobe $00, CoCo: column 0 strobe $fe
+            self.scan_started = True
         self.pia_0_B_data.set(value)
 
     def read_PIA0_B_control(self, cpu_cycles, op_address, address):
@@ -12,88 +12,78 @@
 import logging
 import tkinter
 
-from dragonpy.Dragon32 import dragon_charmap
 from dragonpy.Dragon32.dragon_charmap import get_charmap_dict
-from dragonpy.Dragon32.dragon_font import CHARS_DICT, TkImageFont
+from dragonpy.Dragon32.dragon_font import CHARS_DICT
+from dragonpy.Dragon32.vdg import HEIGHT, WIDTH, VDGRenderer
 
 
 log = logging.getLogger(__name__)
 
 
-class MC6847_TextModeCanvas:
+class MC6847_FramebufferCanvas:
     """
-    MC6847 Video Display Generator (VDG) in Alphanumeric Mode.
-    This display mode consumes 512 bytes of memory and is a 32 character wide screen with 16 lines.
+    MC6847 Video Display Generator (VDG) in all text, semigraphics and graphics modes.
 
-    Here we only get the "write into Display RAM" information from the CPU-Thread
-    from display_queue.
+    The video RAM is rendered into one RGB framebuffer (see: dragonpy.Dragon32.vdg)
+    and displayed with a single Tkinter.PhotoImage(): flush() copies only the changed
+    cells into it, one Tk call per batch of adjacent changed rows.
 
-    The Display Tkinter.Canvas() which will be filled with Tkinter.PhotoImage() instances.
-    Every displayed character is a Tkinter.PhotoImage()
+    The display mode and the video RAM start address are taken from the SAM
+    and PIA registers on every flush(), so e.g.: PMODE and SCREEN commands work.
     """
 
-    def __init__(self, root):
-        self.rows = 32
-        self.columns = 16
+    def __init__(self, root, scale_factor=2):
+        self.scale_factor = scale_factor
+        self.memory = None  # The machine parts are set via attach()
+        self.sam = None
+        self.pia = None
 
-        scale_factor = 2  # scale the complete Display/Characters
-        self.tk_font = TkImageFont(CHARS_DICT, scale_factor)  # to generate PhotoImage()
+        self.renderer = VDGRenderer(CHARS_DICT, get_charmap_dict())
+        self.renderer.build_tables()
 
-        self.total_width = self.tk_font.width_scaled * self.rows
-        self.total_height = self.tk_font.height_scaled * self.columns
-
-        foreground, background = dragon_charmap.get_hex_color(dragon_charmap.NORMAL)
+        self.total_width = WIDTH * scale_factor
+        self.total_height = HEIGHT * scale_factor
         self.canvas = tkinter.Canvas(root,
                                      width=self.total_width,
                                      height=self.total_height,
                                      bd=0,  # no border
                                      highlightthickness=0,  # no highlight border
-                                     # bg="#ff0000",
-                                     bg=f"#{background}",
+                                     bg="#000000",
                                      )
-
-        # Contains the map from Display RAM value to char/color:
-        self.charmap = get_charmap_dict()
-
-        # Cache for the generated Tkinter.PhotoImage() in evry char/color combination:
-        self.image_cache = {}
-
-        # Tkinter.PhotoImage() IDs for image replace with canvas.itemconfigure():
-        self.images_map = {}
-
-        # Create all charachter images on the display and fill self.images_map:
-        self.init_img = self.tk_font.get_char(char="?", color=dragon_charmap.INVERTED)
-        for row in range(self.rows + 1):
-            for column in range(self.columns + 1):
-                x = self.tk_font.width_scaled * row
-                y = self.tk_font.height_scaled * column
-                image_id = self.canvas.create_image(x, y,
-                                                    image=self.init_img,
-                                                    state="normal",
-                                                    anchor=tkinter.NW  # NW == NorthWest
-                                                    )
-                # log.critical("Image ID: %s at %i x %i", image_id, x, y)
-                self.images_map[(x, y)] = image_id
-
-    def write_byte(self, cpu_cycles, op_address, address, value):
-        # log.critical(
-        #             "%04x| *** Display write $%02x ***%s*** %s at $%04x",
-        #             op_address, value, repr(char), color, address
-        #         )
-
-        try:
-            image = self.image_cache[value]
-        except KeyError:
-            # Generate a Tkinter.PhotoImage() for the requested char/color
-            char, color = self.charmap[value]
-            image = self.tk_font.get_char(char, color)
-            self.image_cache[value] = image
-
-        position = address - 0x400
-        column, row = divmod(position, self.rows)
-        x = self.tk_font.width_scaled * row
-        y = self.tk_font.height_scaled * column
-
-        #         log.critical("replace image %s at %i x %i", image, x, y)
-        image_id = self.images_map[(x, y)]
-        self.canvas.itemconfigure(image_id, image=image)
+        self.image = tkinter.PhotoImage(width=self.total_width, height=self.total_height)
+        self.canvas.create_image(0, 0, image=self.image, state="normal", anchor=tkinter.NW)
+
+    def attach(self, memory, sam, pia):
+        self.memory = memory
+        self.sam = sam
+        self.pia = pia
+
+    def get_mode(self):
+        """ Returns (video RAM start address, SAM mode, VDG mode bits) """
+        return self.sam.display_offset, self.sam.vdg_mode, self.pia.vdg_mode_bits
+
+    @property
+    def has_changes(self):
+        if self.memory is None:
+            return False
+        return self.renderer.has_changes(self.memory, *self.get_mode())
+
+    def flush(self):
+        """
+        Render all changed cells and display them.
+        Returns the number of updated row batches.
+        """
+        if self.memory is None:
+            return 0
+        ranges = self.renderer.update(self.memory, *self.get_mode())
+        scale_factor = self.scale_factor
+        for start_line, end_line, start_x, end_x in ranges:
+            batch = tkinter.PhotoImage(
+                data=self.renderer.get_ppm(start_line, end_line, start_x, end_x), format="PPM"
+            )
+            self.image.tk.call(
+                self.image, "copy", batch,
+                "-to", start_x * scale_factor, start_line * scale_factor,
+                "-zoom", scale_factor, scale_factor,
+            )
+        return len(ranges)
@@ -48,10 +48,24 @@
 
 import logging
 
+from dragonpy.components.memory import MAIN_BANK
+
 
 log = logging.getLogger(__name__)
 
 
+UPPER_RAM_BANK = "upper RAM"  # The upper 32KB RAM of a 64KB machine
+
+# Bit numbers in the 16 Bit SAM register.
+# Every bit is cleared by a write to $ffc0 + bit * 2 and set by a write to $ffc0 + bit * 2 + 1
+SAM_V0 = 0  # VDG mode V0-V2
+SAM_F0 = 3  # Display offset F0-F6
+SAM_P1 = 10  # Page #1
+SAM_R0 = 11  # MPU rate R0-R1
+SAM_M0 = 13  # Memory size M0-M1
+SAM_TY = 15  # Map type
+
+
 class SAM:
     """
     MC6883 (74LS783) Synchronous Address Multiplexer (SAM)
@@ -59,54 +73,49 @@ class SAM:
 
     # http://archive.worldofdragon.org/phpBB3/viewtopic.php?f=8&t=4894&p=11730#p11726
     IRQ_CYCLES = 17784
+    IRQ_EVENT = "sam.field_sync"
 
     def __init__(self, cfg, cpu, memory):
         self.cfg = cfg
         self.cpu = cpu
         self.memory = memory
 
-        self.cpu.add_sync_callback(callback_cycles=self.IRQ_CYCLES, callback=self.irq_trigger)
+        # The first field sync after one field, see: dragonpy.core.scheduler
+        self.cpu.scheduler.add_event(self.IRQ_EVENT, self.irq_trigger)
+        self.cpu.scheduler.schedule(self.IRQ_EVENT, self.IRQ_CYCLES, period=self.IRQ_CYCLES)
 
-        #
-        # TODO: Collect this information via a decorator similar to op codes in CPU!
-        #
-        self.memory.add_read_byte_callback(self.read_VDG_mode_register_v1, 0xffc2)
+        self.register = 0x0000  # All 16 SAM bits
+
+        if self.cfg.UPPER_RAM_SIZE:
+            # Dragon 64: The upper 32KB RAM can be switched in via page bit and map type:
+            self.memory.add_bank(UPPER_RAM_BANK, self.cfg.UPPER_RAM_SIZE)
 
-        self.memory.add_write_byte_callback(self.write_VDG_mode_register_v0, 0xffc0)
-        self.memory.add_write_byte_callback(self.write_VDG_mode_register_v1, 0xffc2)
-        self.memory.add_write_byte_callback(self.write_VDG_mode_register_v2, 0xffc4)
-        self.memory.add_write_byte_callback(self.write_display_offset_F0, 0xffc6)
-        self.memory.add_write_byte_callback(self.write_display_offset_F1, 0xffc8)
-        self.memory.add_write_byte_callback(self.write_display_offset_F2, 0xffca)
-        self.memory.add_write_byte_callback(self.write_display_offset_F3, 0xffcc)
-        self.memory.add_write_byte_callback(self.write_display_offset_F4, 0xffce)
-        self.memory.add_write_byte_callback(self.write_display_offset_F5, 0xffd0)
-        self.memory.add_write_byte_callback(self.write_display_offset_F6, 0xffd2)
-        self.memory.add_write_byte_callback(self.write_page_bit, 0xffd4)
-        self.memory.add_write_byte_callback(self.write_MPU_rate_bit0, 0xffd6)
-        self.memory.add_write_byte_callback(self.write_MPU_rate_bit1, 0xffd8)
-        self.memory.add_write_byte_callback(self.write_size_select_bit0, 0xffda)
-        self.memory.add_write_byte_callback(self.write_size_select_bit1, 0xffdc)
-        self.memory.add_write_byte_callback(self.write_map_type, 0xffde)
-        self.memory.add_write_byte_callback(self.write_map0, 0xffdd)
-
-        #  Dragon 64 only:
-        self.memory.add_write_byte_callback(self.write_D64_dynamic_memory, 0xffc9)
+        self.memory.add_read_byte_callback(self.read_VDG_mode_register_v1, 0xffc2)
+        self.memory.add_write_byte_callback(self.write_register_bit, 0xffc0, 0xffdf)
 
         self.memory.add_read_byte_callback(self.interrupt_vectors, 0xfff0, 0xffff)
 
     def reset(self):
-        log.critical("TODO: VDG reset")
+        self.register = 0x0000
+        self.update_memory_map()
 
-    def irq_trigger(self, call_cycles):
+    def get_state(self):
+        return {"register": self.register}
+
+    def set_state(self, state):
+        self.register = state["register"]
+        self.update_memory_map()
+
+    def irq_trigger(self, event_cycles):
         #        log.critical("%04x| SAM irq trigger called %i cycles to late",
-        #            self.cpu.last_op_address, call_cycles - self.IRQ_CYCLES
+        #            self.cpu.last_op_address, self.cpu.cycles - event_cycles
         #        )
         self.cpu.irq()
 
     def interrupt_vectors(self, cpu_cycles, op_address, address):
+        # The vectors are always read from ROM, also in the Dragon 64 "all RAM" mode:
         new_address = address - 0x4000
-        value = self.memory.read_byte(new_address)
+        value = self.memory.peek_bank(MAIN_BANK, new_address)
 #         log.critical("read interrupt vector $%04x redirect in SAM to $%04x use value $%02x",
 #             address, new_address, value
 #         )
@@ -122,59 +131,68 @@ class SAM:
 
     # --------------------------------------------------------------------------
 
-    def write_VDG_mode_register_v0(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write VDG mode register V0 $%02x to $%04x", value, address)
-
-    def write_VDG_mode_register_v1(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write VDG mode register V1 $%02x to $%04x", value, address)
-
-    def write_VDG_mode_register_v2(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write VDG mode register V2 $%02x to $%04x", value, address)
-
-    def write_display_offset_F0(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write display_offset_F0 $%02x to $%04x", value, address)
-
-    def write_display_offset_F1(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write display_offset_F1 $%02x to $%04x", value, address)
-
-    def write_display_offset_F2(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write display_offset_F2 $%02x to $%04x", value, address)
-
-    def write_display_offset_F3(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write display_offset_F3 $%02x to $%04x", value, address)
-
-    def write_display_offset_F4(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write display_offset_F4 $%02x to $%04x", value, address)
-
-    def write_display_offset_F5(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write display_offset_F5 $%02x to $%04x", value, address)
-
-    def write_display_offset_F6(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write display_offset_F6 $%02x to $%04x", value, address)
-
-    def write_page_bit(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write page_bit $%02x to $%04x", value, address)
-
-    def write_MPU_rate_bit0(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write MPU_rate_bit0 $%02x to $%04x", value, address)
-
-    def write_MPU_rate_bit1(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write MPU_rate_bit1 $%02x to $%04x", value, address)
-
-    def write_size_select_bit0(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write size_select_bit0 $%02x to $%04x", value, address)
-
-    def write_size_select_bit1(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write size_select_bit1 $%02x to $%04x", value, address)
-
-    def write_map_type(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write map_type $%02x to $%04x", value, address)
-
-    def write_map0(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write map0 $%02x to $%04x", value, address)
-
-    def write_D64_dynamic_memory(self, cpu_cycles, op_address, address, value):
-        log.debug("TODO: write D64_dynamic_memory $%02x to $%04x", value, address)
+    def write_register_bit(self, cpu_cycles, op_address, address, value):
+        """
+        The written value is ignored: The even address clears and the odd address sets the bit.
+        """
+        bit_no, set_bit = divmod(address - 0xffc0, 2)
+        old_register = self.register
+        if set_bit:
+            self.register |= 1 << bit_no
+        else:
+            self.register &= ~(1 << bit_no)
+
+        log.debug("%04x| SAM bit %i set to %i (register: $%04x)", op_address, bit_no, set_bit, self.register)
+
+        if bit_no in (SAM_P1, SAM_TY) and old_register != self.register:
+            self.update_memory_map()
+
+    @property
+    def vdg_mode(self):
+        return (self.register >> SAM_V0) & 0x07
+
+    @property
+    def display_offset(self):
+        """ Start address of the video RAM """
+        return ((self.register >> SAM_F0) & 0x7f) * 512
+
+    @property
+    def page_bit(self):
+        return (self.register >> SAM_P1) & 0x01
+
+    @property
+    def mpu_rate(self):
+        return (self.register >> SAM_R0) & 0x03
+
+    @property
+    def memory_size(self):
+        return (self.register >> SAM_M0) & 0x03
+
+    @property
+    def map_type(self):
+        return (self.register >> SAM_TY) & 0x01
+
+    def update_memory_map(self):
+        """
+        Dragon 64 / 64KB RAM bank switching:
+         * map type 0: $0000-$7fff: lower 32KB RAM, or upper 32KB RAM if page bit is set
+                       $8000-$feff: ROM
+         * map type 1: $0000-$7fff: lower 32KB RAM
+                       $8000-$feff: upper 32KB RAM
+        Only the memory page table will be changed, no RAM is copied.
+        """
+        if not self.cfg.UPPER_RAM_SIZE:
+            return
+
+        if self.map_type:
+            self.memory.map_bank(0x0000, 0x7fff)
+            self.memory.map_bank(0x8000, 0xfeff, UPPER_RAM_BANK, bank_offset=0x0000)
+        else:
+            self.memory.map_bank(0x8000, 0xfeff)
+            if self.page_bit:
+                self.memory.map_bank(0x0000, 0x7fff, UPPER_RAM_BANK, bank_offset=0x0000)
+            else:
+                self.memory.map_bank(0x0000, 0x7fff)
 
 
 # ------------------------------------------------------------------------------
@@ -1,35 +1,273 @@
-#!/usr/bin/env python
-
 """
     DragonPy - Dragon 32 emulator in Python
     =======================================
 
+    Cassette deck of Dragon 32/64 and CoCo.
+
+    The ROM reads the tape signal via PIA 1 A side bit 0 ($ff20) and
+    measures the time between the level changes. The motor is switched
+    via the CA2 line of PIA 1 A side ($ff21 bit 3).
+
+    The tape position is calculated from the CPU cycles the motor was on,
+    so the signal is sampled by CPU cycle, only if the ROM reads it.
+    No event per sample and no complete tape in memory:
 
-    Based on:
-        ApplePy - an Apple ][ emulator in Python:
-        James Tauber / http://jtauber.com/ / https://github.com/jtauber/applepy
-        originally written 2001, updated 2011
-        origin source code licensed under MIT License
+        WaveTape: The samples of a memory-mapped WAV file
+        CasTape: The signal of a .cas file, synthesized on the fly in small
+            chunks with the sinus cycles of PyDC Bitstream2Wave
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
 """
 
-import wave
+import logging
+import mmap
+import os
+import struct
+
+
+log = logging.getLogger(__name__)
+
+
+CPU_CYCLES_PER_SEC = 894886  # 14.31818 MHz crystal / 16
+
+# PIA 1 A side control register ($ff21): CA2 is a output (bit 5+4) and high (bit 3)
+MOTOR_ON_MASK = 0x38
+
+WAVE_FORMAT_PCM = 1
+
 
+class WaveTape:
+    """
+    The first channel of a PCM WAV file. Only the level (signal above zero) is used.
+    """
 
-class Cassette:
+    def __init__(self, filepath):
+        self.filepath = filepath
+        with open(filepath, "rb") as f:
+            try:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                raise ValueError(f"{filepath!r} is not a WAV file")
+        try:
+            self.parse_header()
+        except (ValueError, struct.error) as err:
+            self.close()
+            raise ValueError(f"{filepath!r} is not a supported WAV file: {err}")
+        log.info(
+            "Insert WAV tape %r: %iHz %i-bit %i channel(s), %i frames",
+            filepath, self.framerate, self.samplewidth * 8, self.channels, self.frame_count
+        )
 
-    def __init__(self, fn):
-        wav = wave.open(fn, "r")
-        self.raw = wav.readframes(wav.getnframes())
-        self.start_cycle = 0
-        self.start_offset = 0
+    def parse_header(self):
+        data = self.mmap
+        if data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+            raise ValueError("no RIFF/WAVE header")
 
-        for i, b in enumerate(self.raw):
-            if ord(b) > 0xA0:
-                self.start_offset = i
+        fmt = None
+        offset = 12
+        while offset + 8 <= len(data):
+            chunk_id, size = struct.unpack_from("<4sI", data, offset)
+            if chunk_id == b"fmt ":
+                fmt = struct.unpack_from("<HHIIHH", data, offset + 8)
+            elif chunk_id == b"data":
                 break
+            offset += 8 + size + (size & 1)  # Chunks are word aligned
+        else:
+            raise ValueError("no data chunk")
+        if fmt is None:
+            raise ValueError("no fmt chunk")
+
+        audio_format, self.channels, self.framerate, __, self.block_align, bits = fmt
+        if audio_format != WAVE_FORMAT_PCM:
+            raise ValueError(f"format {audio_format:d} is not PCM")
+        self.samplewidth = bits // 8
+        if self.samplewidth == 1:
+            self.sample_offset = 0  # 8-bit samples are unsigned
+            self.sample_threshold = 0x80
+        elif self.samplewidth in (2, 3, 4):
+            self.sample_offset = self.samplewidth - 1  # Little endian: the most significant byte
+            self.sample_threshold = None
+        else:
+            raise ValueError(f"{bits:d}-bit samples")
+
+        self.data_offset = offset + 8
+        data_size = min(size, len(data) - self.data_offset)
+        self.frame_count = data_size // self.block_align
+
+    def get_level(self, frame_no):
+        """ Returns 1 if the signal is above zero, 0 after the end of the tape """
+        if frame_no >= self.frame_count:
+            return 0
+        position = self.data_offset + frame_no * self.block_align
+        if self.sample_threshold is not None:
+            return int(self.mmap[position] > self.sample_threshold)
+        high_byte = self.mmap[position + self.sample_offset]
+        if high_byte & 0x80:
+            return 0
+        return int(any(self.mmap[position:position + self.sample_offset + 1]))
+
+    def close(self):
+        self.mmap.close()
+
+
+def build_bit_levels(framerate, hz):
+    """
+    The levels of one sinus cycle, like PyDC Bitstream2Wave writes one bit.
+
+    >>> build_bit_levels(22050, 2100)
+    b'\\x01\\x01\\x01\\x01\\x00\\x00\\x00\\x00\\x00\\x00'
+    """
+    # PyDC: import only if used
+    from PyDC.PyDC.utils import sinus_values_by_hz
+
+    return bytes(int(value > 0) for value in sinus_values_by_hz(framerate, hz, max_value=0x7fff))
+
+
+class CasTape:
+    """
+    A .cas file: The bytes as written to tape, incl. the leader and sync bytes.
+    The signal is created per chunk of CHUNK_SIZE bytes. Every bit is one
+    sinus cycle, the least significant bit first.
+    """
+    CHUNK_SIZE = 256
+
+    def __init__(self, filepath, cfg=None):
+        if cfg is None:
+            # PyDC: import only if used
+            from PyDC.PyDC.configs import Dragon32Config
+
+            cfg = Dragon32Config()
+
+        self.filepath = filepath
+        self.framerate = cfg.FRAMERATE
+        self.file = open(filepath, "rb")
+
+        bit_levels = (
+            build_bit_levels(self.framerate, cfg.BIT_NUL_HZ),
+            build_bit_levels(self.framerate, cfg.BIT_ONE_HZ),
+        )
+        # The levels of every byte value:
+        self.byte_levels = [
+            b"".join(bit_levels[(value >> bit) & 1] for bit in range(8))
+            for value in range(0x100)
+        ]
+        self.restart()
+        log.info("Insert CAS tape %r (%i Bytes)", filepath, os.path.getsize(filepath))
+
+    def restart(self):
+        self.file.seek(0)
+        self.levels = b""  # The levels of the current chunk
+        self.chunk_start = 0  # Frame no. of the first level of the current chunk
+        self.at_end = False
+
+    def next_chunk(self):
+        data = self.file.read(self.CHUNK_SIZE)
+        if not data:
+            self.at_end = True
+            return
+        self.chunk_start += len(self.levels)
+        byte_levels = self.byte_levels
+        self.levels = b"".join(byte_levels[value] for value in data)
+
+    def get_level(self, frame_no):
+        """ Returns 1 if the signal is above zero, 0 after the end of the tape """
+        if frame_no < self.chunk_start:
+            self.restart()  # The tape was rewound
+        while frame_no >= self.chunk_start + len(self.levels):
+            if self.at_end:
+                return 0
+            self.next_chunk()
+        return self.levels[frame_no - self.chunk_start]
+
+    def close(self):
+        self.file.close()
+
+
+def open_tape(filepath):
+    """
+    Returns a WaveTape or CasTape, by the file extension.
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext == ".wav":
+        return WaveTape(filepath)
+    elif ext == ".cas":
+        return CasTape(filepath)
+    raise ValueError(f"Unsupported tape file type {ext!r}: Only .wav and .cas")
+
+
+class CassetteDeck:
+    """
+    >>> deck = CassetteDeck()
+    >>> deck.set_motor(1000, MOTOR_ON_MASK)
+    >>> deck.motor
+    True
+    >>> deck.set_motor(1000 + CPU_CYCLES_PER_SEC, 0x34)  # Motor off after 1 sec.
+    >>> deck.motor, deck.position
+    (False, 894886)
+    >>> deck.read_bit(2000000)  # No tape: No signal
+    0
+    """
+
+    def __init__(self, cycles_per_sec=CPU_CYCLES_PER_SEC):
+        self.cycles_per_sec = cycles_per_sec
+        self.tape = None
+        self.reset()
+
+    def reset(self):
+        self.motor = False
+        self.position = 0  # CPU cycles the tape moved until the last motor start
+        self.motor_start_cycles = 0
+        self.last_cycles = 0
+
+    def insert(self, tape):
+        self.eject()
+        self.tape = tape
+        self.rewind()
+
+    def eject(self):
+        if self.tape is not None:
+            self.tape.close()
+            self.tape = None
+
+    def rewind(self):
+        self.position = 0
+        self.motor_start_cycles = self.last_cycles
+
+    def get_frame(self, cpu_cycles):
+        """ The tape position as frame no. """
+        cycles = self.position
+        if self.motor:
+            cycles += cpu_cycles - self.motor_start_cycles
+        return cycles * self.tape.framerate // self.cycles_per_sec
+
+    def set_motor(self, cpu_cycles, control_value):
+        """ Called with every write to the PIA 1 A side control register """
+        self.last_cycles = cpu_cycles
+        motor = (control_value & MOTOR_ON_MASK) == MOTOR_ON_MASK
+        if motor == self.motor:
+            return
+        if motor:
+            self.motor_start_cycles = cpu_cycles
+        else:
+            self.position += cpu_cycles - self.motor_start_cycles
+        self.motor = motor
+        log.info("Cassette motor %s", "on" if motor else "off")
+
+    def read_bit(self, cpu_cycles):
+        self.last_cycles = cpu_cycles
+        if self.tape is None or not self.motor:
+            return 0
+        return self.tape.get_level(self.get_frame(cpu_cycles))
+
+    def get_state(self):
+        return {
+            "motor": self.motor,
+            "position": self.position,
+            "motor_start_cycles": self.motor_start_cycles,
+        }
 
-    def read_byte(self, cpu_cycles):
-        if self.start_cycle == 0:
-            self.start_cycle = cpu_cycles
-        offset = self.start_offset + (cpu_cycles - self.start_cycle) * 22000 / 1000000
-        return ord(self.raw[offset]) if offset < len(self.raw) else 0x80
+    def set_state(self, state):
+        self.motor = state["motor"]
+        self.position = state["position"]
+        self.motor_start_cycles = state["motor_start_cycles"]
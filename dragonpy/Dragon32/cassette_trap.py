@@ -0,0 +1,215 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    Instant CLOAD/CSAVE: Trap the cassette routines of the ROM.
+
+    The opcode fetch of the routine entry addresses (see: Dragon32Cfg) is
+    intercepted via a memory read callback. If the trap takes over, the
+    routine is done in Python and a RTS opcode is fetched instead, so the
+    CPU returns directly to the caller:
+
+        read leader (CSRDON): Skipped, the blocks are already in sync
+        read block (BLKIN): Copy the next block of the tape into the
+            I/O buffer and set block type, length, checksum and error status
+        write leader (WRTLDR): Skipped
+        write block (BLKOUT): Capture the block from the I/O buffer
+
+    The tape is decoded once with PyDC into whole blocks: A .cas file or a
+    .wav file via Cassette.add_from_wav(). The captured blocks are saved
+    with Cassette.write_cas() after every end-of-file block.
+
+    If all blocks are read, the ROM routines run as usual,
+    e.g. on the signal of the cassette deck (see: dragonpy.Dragon32.cassette)
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import wave
+
+
+log = logging.getLogger(__name__)
+
+
+RTS_OPCODE = 0x39
+
+# Cassette I/O variables of the ROM, same on Dragon and CoCo:
+BLKTYP_ADDR = 0x7c  # Block type
+BLKLEN_ADDR = 0x7d  # Block length
+CBUFAD_ADDR = 0x7e  # I/O buffer address (word)
+CCKSUM_ADDR = 0x80  # Block checksum
+CSRERR_ADDR = 0x81  # Error status
+
+STATUS_OK = 0x00
+STATUS_NO_RAM = 0x02  # Attempt to load into ROM
+
+EOF_BLOCK = 0xff
+
+
+def block_checksum(block_type, data):
+    """
+    >>> hex(block_checksum(0x01, b"ABC"))
+    '0xca'
+    >>> block_checksum(0xff, b"")
+    255
+    """
+    return (block_type + len(data) + sum(data)) & 0xff
+
+
+def load_tape(filepath):
+    """
+    Decode a .cas or .wav tape image into a PyDC RawCassette with all blocks.
+    Raise ValueError if the tape can't be decoded or contains no blocks.
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext not in (".cas", ".wav"):
+        raise ValueError(f"Unsupported tape file type {ext!r}: Only .wav and .cas")
+
+    # PyDC: import only if used
+    from PyDC.PyDC.CassetteObjects import RawCassette
+    from PyDC.PyDC.configs import Dragon32Config
+
+    tape = RawCassette(Dragon32Config())
+    try:
+        if ext == ".wav":
+            tape.add_from_wav(str(filepath))
+        else:
+            tape.add_from_cas(str(filepath))
+    except (EOFError, wave.Error) as err:
+        raise ValueError(f"Can't decode tape {filepath!r}: {err}")
+    if not tape.blocks:
+        raise ValueError(f"No blocks found on tape {filepath!r}")
+    log.info("Load tape %r: %i files in %i blocks", filepath, len(tape.files), len(tape.blocks))
+    return tape
+
+
+class CassetteTrap:
+    def __init__(self, cfg, cpu, memory):
+        self.cfg = cfg
+        self.cpu = cpu
+        self.memory = memory
+
+        self.tape = None  # PyDC RawCassette with the blocks to read
+        self.position = 0  # Index of the next block to read
+
+        self.output = None  # PyDC RawCassette with the captured blocks
+        self.output_filepath = None
+
+        self.routines = {
+            cfg.CASSETTE_READ_LEADER_ADDR: self.read_leader,
+            cfg.CASSETTE_READ_BLOCK_ADDR: self.read_block,
+            cfg.CASSETTE_WRITE_LEADER_ADDR: self.write_leader,
+            cfg.CASSETTE_WRITE_BLOCK_ADDR: self.write_block,
+        }
+        for address in self.routines:
+            memory.add_read_byte_callback(self.opcode_fetch, address)
+
+    def insert(self, filepath):
+        self.tape = load_tape(filepath)
+        self.position = 0
+
+    def rewind(self):
+        self.position = 0
+
+    def eject(self):
+        self.tape = None
+        self.position = 0
+
+    def save_to(self, filepath):
+        """ Capture CSAVE into this .cas file """
+        # PyDC: import only if used
+        from PyDC.PyDC.CassetteObjects import RawCassette
+        from PyDC.PyDC.configs import Dragon32Config
+
+        self.output = RawCassette(Dragon32Config())
+        self.output_filepath = str(filepath)
+
+    @property
+    def blocks_left(self):
+        if self.tape is None:
+            return 0
+        return len(self.tape.blocks) - self.position
+
+    def opcode_fetch(self, cpu_cycles, op_address, address):
+        """ Read byte callback of the routine entry addresses """
+        if address == self.cpu.program_counter.value and self.routines[address]():
+            return RTS_OPCODE
+        return self.memory.peek(address)
+
+    def mask_interrupts(self):
+        """ Like the ROM routines: ORCC #$50 """
+        self.cpu.I = 1
+        self.cpu.F = 1
+
+    def set_status(self, status):
+        """ Like the ROM routine end: STA <CSRERR """
+        memory = self.memory
+        memory.poke(CSRERR_ADDR, status)
+        cpu = self.cpu
+        cpu.accu_a.set(status)
+        cpu.N = status >> 7
+        cpu.Z = int(status == 0)
+        cpu.V = 0
+
+    def read_leader(self):
+        if not self.blocks_left:
+            return False
+        self.mask_interrupts()
+        return True
+
+    def read_block(self):
+        if not self.blocks_left:
+            return False
+        file_obj, block_type, data = self.tape.blocks[self.position]
+        self.position += 1
+        self.mask_interrupts()
+
+        memory = self.memory
+        buffer_addr = memory.peek_word(CBUFAD_ADDR)
+        address = buffer_addr
+        status = STATUS_OK
+        for value in data:
+            memory.write_byte(address, value)
+            if memory.peek(address) != value:
+                log.error("Load block into ROM at $%04x", address)
+                status = STATUS_NO_RAM
+                break
+            address = (address + 1) & 0xffff
+
+        memory.poke(BLKTYP_ADDR, block_type)
+        memory.poke(BLKLEN_ADDR, len(data))
+        memory.poke(CCKSUM_ADDR, block_checksum(block_type, data))
+        self.cpu.index_x.set(address)  # Behind the last stored byte
+        self.set_status(status)
+        log.info(
+            "Read block %i of %i: type $%02x, %i bytes to $%04x",
+            self.position, len(self.tape.blocks), block_type, len(data), buffer_addr
+        )
+        return True
+
+    def write_leader(self):
+        if self.output is None:
+            return False
+        self.mask_interrupts()
+        return True
+
+    def write_block(self):
+        if self.output is None:
+            return False
+        self.mask_interrupts()
+
+        memory = self.memory
+        block_type = memory.peek(BLKTYP_ADDR)
+        length = memory.peek(BLKLEN_ADDR)
+        buffer_addr = memory.peek_word(CBUFAD_ADDR)
+        data = bytes(memory.peek((buffer_addr + offset) & 0xffff) for offset in range(length))
+        memory.poke(CCKSUM_ADDR, block_checksum(block_type, data))
+
+        self.output.buffer_block(block_type, length, data)
+        log.info("Write block: type $%02x, %i bytes from $%04x", block_type, length, buffer_addr)
+        if block_type == EOF_BLOCK:
+            self.output.write_cas(self.output_filepath)
+        return True
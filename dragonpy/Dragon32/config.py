@@ -15,8 +15,7 @@ from dragonlib.api import Dragon32API
 from dragonpy import constants
 from dragonpy.core.configs import BaseConfig
 from dragonpy.Dragon32.Dragon32_rom import Dragon32Rom
-from dragonpy.Dragon32.keyboard_map import get_dragon_keymatrix_pia_result
-from dragonpy.Dragon32.mem_info import get_dragon_meminfo
+from dragonpy.Dragon32.keyboard_map import DRAGON_KEYMAP
 
 
 log = logging.getLogger(__name__)
@@ -34,6 +33,7 @@ class Dragon32Cfg(BaseConfig):
 
     # How does the keyboard polling routine starts with?
     PIA0B_KEYBOARD_START = 0x00
+    KEYMAP = DRAGON_KEYMAP  # Key -> keyboard matrix (column, row) positions
 
     RAM_START = 0x0000
 
@@ -49,6 +49,9 @@ class Dragon32Cfg(BaseConfig):
 #     RAM_END = 0x3FFF # 16KB # usable
     RAM_END = 0x7FFF  # 32KB
 
+    # Size of the RAM that can be switched in by the SAM page bit and map type:
+    UPPER_RAM_SIZE = 0x0000
+
     ROM_START = 0x8000
     ROM_END = 0xBFFF
     # ROM size: 0x4000 == 16384 Bytes
@@ -68,12 +71,20 @@ class Dragon32Cfg(BaseConfig):
     # for unittests init:
     STARTUP_END_ADDR = 0xbbe5  # scan keyboard
 
+    # ROM cassette routines, see: dragonpy.Dragon32.cassette_trap
+    CASSETTE_READ_LEADER_ADDR = 0xbde7  # CSRDON
+    CASSETTE_READ_BLOCK_ADDR = 0xb93e  # BLKIN
+    CASSETTE_WRITE_LEADER_ADDR = 0xbe68  # WRTLDR
+    CASSETTE_WRITE_BLOCK_ADDR = 0xb999  # BLKOUT
+
     def __init__(self, cmd_args):
         super().__init__(cmd_args)
 
         self.machine_api = Dragon32API()
 
         if self.verbosity and self.verbosity <= logging.ERROR:
+            from dragonpy.Dragon32.mem_info import get_dragon_meminfo  # Big tables: import only if used
+
             self.mem_info = get_dragon_meminfo()
 
         self.periphery_class = None  # Dragon32Periphery
@@ -145,9 +156,6 @@ class Dragon32Cfg(BaseConfig):
 
         return mem
 
-    def pia_keymatrix_result(self, inkey, pia0b):
-        return get_dragon_keymatrix_pia_result(inkey, pia0b)
-
 
 config = Dragon32Cfg
 
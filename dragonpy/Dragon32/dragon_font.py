@@ -24,16 +24,23 @@
 
 import logging
 import math
-import tkinter
 
-from dragonpy.Dragon32.dragon_charmap import COLORS, INVERTED, NORMAL, get_hex_color
+from dragonpy.Dragon32.dragon_charmap import COLORS, INVERTED, NORMAL, get_rgb_color
 
 
 log = logging.getLogger(__name__)
 
 
+try:
+    import tkinter
+except ImportError:
+    log.critical("Error importing Tkinter!")
+    tkinter = None
+
+
 BACKGROUND_CHAR = "."
 FOREGROUND_CHAR = "X"
+UNKNOWN_CHAR = "?"  # Used for characters that are not in the font
 CHARS_DICT = {
     '@': (  # COMMERCIAL AT
         "........",
@@ -1223,6 +1230,24 @@ CHARS_DICT = {
 }
 
 
+def render_glyph_rows(char_data, foreground, background, scale_factor=1):
+    """
+    Returns the scaled pixel rows of one character as RGB bytes.
+
+    >>> render_glyph_rows(("X.", ".X"), foreground=b"F", background=b"b", scale_factor=2)
+    [b'FFbb', b'FFbb', b'bbFF', b'bbFF']
+    """
+    rows = []
+    for line in char_data:
+        row = b"".join((foreground if bit == FOREGROUND_CHAR else background) * scale_factor for bit in line)
+        rows.extend([row] * scale_factor)
+    return rows
+
+
+def ppm_header(width, height):
+    return f"P6 {width:d} {height:d} 255\n".encode("ascii")
+
+
 class TkImageFont:
     """
     Important is that image must be bind to a object, without:
@@ -1243,45 +1268,25 @@ class TkImageFont:
         self.width_scaled = self.width_real * self.scale_factor
         self.height_scaled = self.height_real * self.scale_factor
 
-        log.critical("Every character is %ipx x %ipx (incl. scale factor: %i)",
-                     self.width_scaled, self.height_scaled,
-                     self.scale_factor
-                     )
+        log.debug("Every character is %ipx x %ipx (incl. scale factor: %i)",
+                  self.width_scaled, self.height_scaled,
+                  self.scale_factor
+                  )
 
     def get_char(self, char, color):
-        log.critical("Generate char %s %s", repr(char), color)
+        """
+        Create the scaled character image in one step, from binary PPM data.
+        """
         try:
             char_data = self.chars_dict[char]
         except KeyError:
             log.log(99, "Error: character %s is not in CHARS_DICT !", repr(char))
-#             return self._generate_char(char="?", color=color)
-            return self.get_char(char="?", color=color)
-
-        foreground, background = get_hex_color(color)
-        foreground = f"#{foreground}"
-        background = f"#{background}"
-
-        img = tkinter.PhotoImage(
-            width=self.width_scaled,
-            height=self.height_scaled
-        )
-
-        # Fill the character pixels without padding
-        for y, line in enumerate(char_data):
-            for x, bit in enumerate(line):
-                if bit == BACKGROUND_CHAR:
-                    color = background
-                else:
-                    assert bit == FOREGROUND_CHAR
-                    color = foreground
-
-                img.put(color, (x, y))
-
-        # resize the character
-        if self.scale_factor > 1:
-            img = img.zoom(self.scale_factor, self.scale_factor)
+            return self.get_char(char=UNKNOWN_CHAR, color=color)
 
-        return img
+        foreground, background = get_rgb_color(color)
+        rows = render_glyph_rows(char_data, bytes(foreground), bytes(background), self.scale_factor)
+        data = ppm_header(self.width_scaled, self.height_scaled) + b"".join(rows)
+        return tkinter.PhotoImage(data=data, format="PPM")
 
 
 class TestTkImageFont:
@@ -37,6 +37,25 @@ class RuntimeCfg:
     max_run_time = 0.01  # target duration of one CPU Op burst run
     # important for CPU vs. GUI updates
 
+    # Adjust the burst size automatically to the target latency, see: dragonpy.core.burst_controller
+    # If deactivated: max_run_time is used
+    auto_burst = True
+    target_latency = 0.016  # seconds
+
+    # Don't emulate the polling loop, if the machine waits for input, see: dragonpy.core.idle
+    # Without speedlimit: pace the emulation like with speedlimit, while the machine is idle.
+    idle_sleep = True
+
+    # Snapshots for the "rewind" menu, see: dragonpy.core.rewind
+    rewind = True
+    rewind_interval_frames = 50  # One snapshot per second
+    rewind_max_mb = 64  # Memory budget of all snapshots
+
+    # Warp mode stop conditions, see: dragonpy.core.warp
+    # A key press and the keyboard scan address always stop the warp mode.
+    warp_stop_on_screen_change = False
+    warp_max_cycles = None  # Stop warp mode after this many CPU cycles
+
     # Use the default value from MC6809 class:
     min_burst_count = CPU.min_burst_count  # minimum outer op count per burst
     max_burst_count = CPU.max_burst_count  # maximum outer op count per burst
@@ -119,6 +138,35 @@ class BaseTkinterGUIConfig:
 
         row += 1
 
+        #
+        # auto burst size - self.runtime_cfg.auto_burst + self.runtime_cfg.target_latency
+        #
+        self.check_value_auto_burst = tkinter.IntVar(
+            value=self.runtime_cfg.auto_burst
+        )
+        self.checkbutton_auto_burst = tkinter.Checkbutton(self.root,
+                                                          text="auto burst", variable=self.check_value_auto_burst,
+                                                          command=self.command_checkbutton_auto_burst
+                                                          )
+        self.checkbutton_auto_burst.grid(row=row, column=0)
+        self.target_latency_var = tkinter.DoubleVar(
+            value=self.runtime_cfg.target_latency
+        )
+        self.target_latency_entry = tkinter.Entry(self.root,
+                                                  textvariable=self.target_latency_var, width=8,
+                                                  )
+        self.target_latency_entry.bind('<KeyRelease>', self.command_target_latency)
+        self.target_latency_entry.grid(row=row, column=1)
+        self.target_latency_label = tkinter.Label(self.root,
+                                                  text=(
+                                                      "GUI latency in seconds, used to adjust the burst size"
+                                                      " without speedlimit (target_latency)"
+                                                  )
+                                                  )
+        self.target_latency_label.grid(row=row, column=2, sticky=tkinter.W)
+
+        row += 1
+
         #
         # CPU burst max running time - self.runtime_cfg.max_run_time
         #
@@ -131,7 +179,10 @@ class BaseTkinterGUIConfig:
         self.max_run_time_entry.bind('<KeyRelease>', self.command_max_run_time)
         self.max_run_time_entry.grid(row=row, column=1)
         self.max_run_time_label = tkinter.Label(self.root,
-                                                text="How long should a CPU Op burst loop take (max_run_time)"
+                                                text=(
+                                                    "How long should a CPU Op burst loop take,"
+                                                    " if auto burst is off (max_run_time)"
+                                                )
                                                 )
         self.max_run_time_label.grid(row=row, column=2, sticky=tkinter.W)
 
@@ -257,6 +308,22 @@ class BaseTkinterGUIConfig:
         self.runtime_cfg.max_burst_count = max_burst_count
         self.max_burst_count_var.set(self.runtime_cfg.max_burst_count)
 
+    def command_checkbutton_auto_burst(self, event=None):
+        self.runtime_cfg.auto_burst = self.check_value_auto_burst.get()
+
+    def command_target_latency(self, event=None):
+        """ GUI latency for the automatic burst size - self.runtime_cfg.target_latency """
+        try:
+            target_latency = self.target_latency_var.get()
+        except ValueError:
+            target_latency = self.runtime_cfg.target_latency
+
+        if not 0 < target_latency <= 1:
+            target_latency = self.runtime_cfg.target_latency
+
+        self.runtime_cfg.target_latency = target_latency
+        self.target_latency_var.set(self.runtime_cfg.target_latency)
+
     def command_max_run_time(self, event=None):
         """ CPU burst max running time - self.runtime_cfg.max_run_time """
         try:
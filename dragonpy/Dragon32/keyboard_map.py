@@ -197,24 +197,120 @@ def _get_col_row_values(inkey, keymap):
     return col_row_values
 
 
-def _set_bits(pia0b, col_row_values):
-    result = 0xff
-    for col, row in col_row_values:
-        if not is_bit_set(pia0b, bit=col):
-            result = clear_bit(result, bit=row)
-    return result
+def build_row_table(col_row_values):
+    """
+    Returns the PA row byte ($ff00) for every PB column mask ($ff02),
+    while the keys at the given (column, row) matrix positions are pressed.
+
+    >>> table = build_row_table(((0, 4),))  # "P" on Dragon
+    >>> f"{table[0xfe]:08b} {table[0xfd]:08b} {table[0x00]:08b}"
+    '11101111 11111111 11101111'
+    """
+    table = bytearray(256)
+    for pia0b in range(256):
+        result = 0xff
+        for col, row in col_row_values:
+            if not is_bit_set(pia0b, bit=col):
+                result = clear_bit(result, bit=row)
+        table[pia0b] = result
+    return bytes(table)
+
+
+# frozenset of pressed (column, row) positions -> row table, shared by all KeyMatrix instances:
+_row_tables = {}
+
+
+def get_row_table(col_row_values):
+    col_row_values = frozenset(col_row_values)
+    try:
+        return _row_tables[col_row_values]
+    except KeyError:
+        table = _row_tables[col_row_values] = build_row_table(col_row_values)
+        return table
+
+
+class KeyMatrix:
+    """
+    The key-down/key-up state of the keyboard matrix.
+
+    The PA row byte of every PB column mask is precomputed for every key
+    of the keymap (and created on demand for every combination of keys),
+    so a read of the keyboard matrix is one table lookup.
+
+    >>> matrix = KeyMatrix(DRAGON_KEYMAP)
+    >>> matrix.read(0x00)
+    255
+    >>> matrix.key_down("P")
+    True
+    >>> f"{matrix.read(0xfe):08b} {matrix.read(0xfd):08b}"
+    '11101111 11111111'
+    >>> matrix.key_down("!")  # Simultaneous keys: Shift + "1" and "P"
+    True
+    >>> f"{matrix.read(0x00):08b} {matrix.read(0xfd):08b}"
+    '10101110 11111110'
+    >>> matrix.key_up("P")
+    >>> f"{matrix.read(0x00):08b}"
+    '10111110'
+    >>> matrix.get_rows("P"), matrix.get_rows("!")
+    (16, 65)
+    >>> matrix.release_all()
+    >>> matrix.pressed_keys
+    []
+    """
+
+    def __init__(self, keymap):
+        self.keymap = keymap
+        for col_row_values in keymap.values():
+            get_row_table(col_row_values)  # Precompute the tables of all single keys
+
+        self.pressed_keys = []  # All keys that are down, in press order
+        self.table = get_row_table(())  # PB column mask -> PA row byte
+
+    def _update_table(self):
+        col_row_values = set()
+        for inkey in self.pressed_keys:
+            col_row_values.update(self.keymap[inkey])
+        self.table = get_row_table(col_row_values)
+
+    def key_down(self, inkey):
+        """ Returns False if the key is not in the keyboard matrix """
+        if not _get_col_row_values(inkey, self.keymap):
+            return False
+        self.pressed_keys.append(inkey)
+        self._update_table()
+        return True
+
+    def key_up(self, inkey):
+        try:
+            self.pressed_keys.remove(inkey)
+        except ValueError:
+            return
+        self._update_table()
+
+    def release_all(self):
+        self.pressed_keys = []
+        self.table = get_row_table(())
+
+    def get_rows(self, inkey):
+        """ Returns the bit mask of all matrix rows of the key """
+        rows = 0
+        for col, row in self.keymap.get(inkey, ()):
+            rows |= 1 << row
+        return rows
+
+    def read(self, pia0b):
+        """ Returns the PA row byte ($ff00) for the PB column mask ($ff02) """
+        return self.table[pia0b]
 
 
 def get_dragon_keymatrix_pia_result(inkey, pia0b):
     col_row_values = _get_col_row_values(inkey, DRAGON_KEYMAP)
-    result = _set_bits(pia0b, col_row_values)
-    return result
+    return get_row_table(col_row_values)[pia0b]
 
 
 def get_coco_keymatrix_pia_result(inkey, pia0b):
     col_row_values = _get_col_row_values(inkey, COCO_KEYMAP)
-    result = _set_bits(pia0b, col_row_values)
-    return result
+    return get_row_table(col_row_values)[pia0b]
 
 
 def inkey_from_tk_event(event, auto_shift=True):
@@ -25,14 +25,15 @@
 
 import logging
 
-from MC6809.core.memory_info import BaseMemoryInfo
 from MC6809.utils.humanize import nice_hex
 
+from dragonpy.core.mem_info_index import IndexedMemoryInfo
+
 
 log = logging.getLogger(__name__)
 
 
-class DragonMemInfo(BaseMemoryInfo):
+class DragonMemInfo(IndexedMemoryInfo):
     MEM_INFO = (
         (0x0, 0x0, "BREAK message flag - if negative print BREAK"),
         (0x1, 0x1, """String delimiting char (0x22 '"')"""),
@@ -17,10 +17,12 @@
 
 import logging
 
-from dragonpy.Dragon32.dragon_charmap import get_charmap_dict
+from dragonpy.Dragon32.cassette import open_tape
+from dragonpy.Dragon32.cassette_trap import CassetteTrap
 from dragonpy.Dragon32.keyboard_map import add_to_input_queue
 from dragonpy.Dragon32.MC6821_PIA import PIA
 from dragonpy.Dragon32.MC6883_SAM import SAM
+from dragonpy.Dragon32.vdg_screen import VDGScreen
 
 
 log = logging.getLogger(__name__)
@@ -40,10 +42,24 @@ class Dragon32PeripheryBase:
         self.kbd = 0xBF
         self.display = None
         self.speaker = None  # Speaker()
-        self.cassette = None  # Cassette()
 
         self.sam = SAM(cfg, cpu, memory)
         self.pia = PIA(cfg, cpu, memory, self.user_input_queue)
+        self.cassette = self.pia.cassette  # dragonpy.Dragon32.cassette.CassetteDeck
+
+        tape_filepath = cfg.cfg_dict.get("cassette")
+        save_filepath = cfg.cfg_dict.get("cassette_save")
+        if cfg.cfg_dict.get("fast_cassette") or save_filepath:
+            # Instant CLOAD/CSAVE: The tape is read by the trapped ROM routines
+            self.cassette_trap = CassetteTrap(cfg, cpu, memory)
+            if save_filepath:
+                self.cassette_trap.save_to(save_filepath)
+            if tape_filepath:
+                self.cassette_trap.insert(tape_filepath)
+        else:
+            self.cassette_trap = None
+            if tape_filepath:
+                self.cassette.insert(open_tape(tape_filepath))
 
         self.memory.add_read_byte_callback(self.no_dos_rom, 0xC000)
         self.memory.add_read_word_callback(self.no_dos_rom, 0xC000)
@@ -55,6 +71,16 @@ class Dragon32PeripheryBase:
         self.pia.reset()
         self.pia.internal_reset()
 
+    def get_state(self):
+        return {
+            "sam": self.sam.get_state(),
+            "pia": self.pia.get_state(),
+        }
+
+    def set_state(self, state):
+        self.sam.set_state(state["sam"])
+        self.pia.set_state(state["pia"])
+
     def no_dos_rom(self, cpu_cycles, op_address, address):
         log.error("%04x| TODO: DOS ROM requested. Send 0x00 back", op_address)
         return 0x00
@@ -70,11 +96,23 @@ class Dragon32PeripheryBase:
 class Dragon32Periphery(Dragon32PeripheryBase):
     def __init__(self, cfg, cpu, memory, display_callback, user_input_queue):
         super().__init__(cfg, cpu, memory, user_input_queue)
+        self.display_callback = display_callback
 
-        # redirect writes to display RAM area 0x0400-0x0600 into display_queue:
-        self.memory.add_write_byte_middleware(
-            display_callback, 0x0400, 0x0600
-        )
+        if display_callback is not None:
+            # redirect writes to display RAM area 0x0400-0x0600 into display_queue:
+            self.memory.add_write_byte_middleware(
+                display_callback, 0x0400, 0x0600
+            )
+
+    def set_state(self, state):
+        super().set_state(state)
+
+        if self.display_callback is None:
+            return
+
+        # Redraw the complete text screen:
+        for address, value in self.memory.iter_bytes(0x0400, 0x0600):
+            self.display_callback(self.cpu.cycles, self.cpu.last_op_address, address, value)
 
 
 class Dragon32PeripheryUnittest(Dragon32PeripheryBase):
@@ -84,80 +122,20 @@ class Dragon32PeripheryUnittest(Dragon32PeripheryBase):
         self.user_input_queue = user_input_queue
         super().__init__(cfg, cpu, memory, self.user_input_queue)
 
-        self.rows = 32
-        self.columns = 16
-        # Contains the map from Display RAM value to char/color:
-        self.charmap = get_charmap_dict()
-
-        # redirect writes to display RAM area 0x0400-0x0600 into display_queue:
+        # Headless text screen, fed by the writes to display RAM area 0x0400-0x0600:
+        self.screen = VDGScreen()
         self.memory.add_write_byte_middleware(
-            self.to_line_buffer, 0x0400, 0x0600
+            self.screen.display_callback, 0x0400, 0x0600
         )
 
     def setUp(self):
         self.pia.internal_reset()
         self.user_input_queue.queue.clear()
-        self.old_columns = None
-        self.output_lines = [""]  # for unittest run_until_OK()
-        self.display_buffer = {}  # for striped_output()
+        self.screen.reset_written()
 
     def add_to_input_queue(self, txt):
         assert "\n" not in txt, "remove all \\n in unittests! Use only \\r as Enter!"
         add_to_input_queue(self.user_input_queue, txt)
 
-    def to_line_buffer(self, cpu_cycles, op_address, address, value):
-        char, color = self.charmap[value]
-#        log.critical(
-#            "%04x| *** Display write $%02x ***%s*** %s at $%04x",
-#            op_address, value, repr(char), color, address
-#        )
-        position = address - 0x400
-        column, row = divmod(position, self.rows)
-
-        if column != self.old_columns:
-            if self.old_columns is not None:
-                self.output_lines.append("")
-            self.old_columns = column
-
-        self.output_lines[-1] += char
-        self.display_buffer[address] = char
-
-        return value
-
-    def striped_output(self):
-        """
-        It's a little bit tricky to get the "written output"...
-        Because user input would be first cleared and then
-        the new char would be written.
-
-        "FOO" output looks like this:
-
-        bcd9| *** Display write $62 ***u'"'*** NORMAL at $04a2
-        b544| *** Display write $60 ***u' '*** NORMAL at $04a3
-        bcd9| *** Display write $46 ***u'F'*** NORMAL at $04a3
-        b544| *** Display write $60 ***u' '*** NORMAL at $04a4
-        bcd9| *** Display write $4f ***u'O'*** NORMAL at $04a4
-        b544| *** Display write $60 ***u' '*** NORMAL at $04a5
-        bcd9| *** Display write $4f ***u'O'*** NORMAL at $04a5
-        b544| *** Display write $60 ***u' '*** NORMAL at $04a6
-        bcd9| *** Display write $62 ***u'"'*** NORMAL at $04a6
-        """
-        output_lines = [""]
-        old_columns = None
-        for address, char in sorted(self.display_buffer.items()):
-            position = address - 0x400
-            column, row = divmod(position, self.rows)
-            if column != old_columns:
-                if old_columns is not None:
-                    output_lines.append("")
-                old_columns = column
-
-            output_lines[-1] += char
-
-        return [
-            line.strip()
-            for line in output_lines
-        ]
-
 
 # ------------------------------------------------------------------------------
@@ -0,0 +1,408 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    MC6847 Video Display Generator (VDG) rendered into one RGB framebuffer.
+
+    The display mode is driven by the hardware registers:
+
+        SAM (MC6883) V0-V2: How many bytes per memory row and how many
+                            scanlines display the same memory row.
+        SAM (MC6883) F0-F6: The start address of the video RAM.
+        PIA1 B ($ff22):     The VDG mode pins: A/G, GM0-GM2 and CSS.
+
+    So all text, semigraphics 4/6 and graphics (PMODE 0-4) modes are
+    supported, incl. the "mixed" SAM/VDG modes, e.g.: semigraphics 8/12/24.
+
+    The renderer is GUI independent: It compares the video RAM with the
+    last rendered content once per frame and renders only the changed cells
+    (the bytes between the first and the last changed byte of a memory row),
+    with precomputed byte -> RGB tables. update() returns the changed areas,
+    so the display can be updated in batches of adjacent rows.
+
+    The changes are not tracked via a write middleware: That would put every
+    video RAM write on the slow path of the memory and would miss the direct
+    memory changes, e.g.: loaded save states or the cassette trap.
+
+    Not supported: External character ROM (INT/EXT with a text char:
+    displayed with the internal font) and NTSC artifact colors.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import struct
+import zlib
+
+from dragonpy.Dragon32.dragon_charmap import COLOR_INFO, COLORS, INVERTED, NORMAL, ORANGE, get_rgb_color
+from dragonpy.Dragon32.dragon_font import FOREGROUND_CHAR, UNKNOWN_CHAR, ppm_header
+
+
+log = logging.getLogger(__name__)
+
+
+WIDTH = 256
+HEIGHT = 192
+LINE_SIZE = WIDTH * 3  # Bytes per RGB scanline
+CHAR_LINES = 12  # Scanlines per text row
+ADDRESS_COUNT = 0x10000
+
+# VDG mode pins from PIA1 B data register $ff22:
+VDG_AG = 0x80  # Alphanumeric / Graphics
+VDG_GM2 = 0x40
+VDG_GM1 = 0x20
+VDG_GM0 = 0x10  # In alphanumeric mode: INT/EXT -> semigraphics 6
+VDG_CSS = 0x08  # Color set select
+VDG_BITS_MASK = VDG_AG | VDG_GM2 | VDG_GM1 | VDG_GM0 | VDG_CSS
+
+# SAM V0-V2 mode -> (bytes per memory row, scanlines per memory row):
+SAM_MODES = {
+    0: (32, CHAR_LINES),  # Alphanumeric, semigraphics 4/6
+    1: (16, 3),  # CG1, RG1
+    2: (32, 3),  # CG2
+    3: (16, 2),  # RG2
+    4: (32, 2),  # CG3
+    5: (16, 1),  # RG3
+    6: (32, 1),  # CG6, RG6
+    7: (32, 1),  # DMA: Not a display mode
+}
+
+# VDG GM0-GM2 graphics mode -> (name, bits per pixel, pixels per scanline):
+GRAPHICS_MODES = {
+    0: ("CG1", 2, 64),
+    1: ("RG1", 1, 128),
+    2: ("CG2", 2, 128),
+    3: ("RG2", 1, 128),  # PMODE 0
+    4: ("CG3", 2, 128),  # PMODE 1
+    5: ("RG3", 1, 128),  # PMODE 2
+    6: ("CG6", 2, 128),  # PMODE 3
+    7: ("RG6", 1, 256),  # PMODE 4
+}
+
+BLACK = (0, 0, 0)
+
+# The eight semigraphics colors, color set 0 first: green, yellow, blue, red
+# and color set 1: buff, cyan, magenta, orange
+PALETTE = tuple(COLOR_INFO[color] for color in COLORS)
+
+# CSS -> (dark, bright) alphanumeric colors
+ALPHA_COLORS = {
+    0: get_rgb_color(NORMAL),
+    1: ((0x41, 0x10, 0x02), COLOR_INFO[ORANGE]),
+}
+
+
+def encode_png(width, height, rgb):
+    r"""
+    Returns the RGB pixel data as PNG image: 8 bit per channel, no filter.
+
+    >>> png = encode_png(2, 1, bytes((255, 0, 0, 0, 0, 255)))
+    >>> png[:8], png[12:16], png[-8:-4]
+    (b'\x89PNG\r\n\x1a\n', b'IHDR', b'IEND')
+    """
+    def chunk(chunk_type, data):
+        return b"".join((
+            struct.pack(">I", len(data)),
+            chunk_type,
+            data,
+            struct.pack(">I", zlib.crc32(chunk_type + data)),
+        ))
+
+    line_size = width * 3
+    raw = b"".join(
+        b"\x00" + bytes(rgb[offset:offset + line_size])  # filter type 0 at the start of every line
+        for offset in range(0, height * line_size, line_size)
+    )
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),  # 8 bit RGB
+        chunk(b"IDAT", zlib.compress(raw, 9)),
+        chunk(b"IEND", b""),
+    ))
+
+
+def get_mode_name(vdg_bits):
+    """
+    >>> get_mode_name(0x00)
+    'SG4'
+    >>> get_mode_name(VDG_GM0)
+    'SG6'
+    >>> get_mode_name(VDG_AG | VDG_GM2 | VDG_GM1 | VDG_GM0)
+    'RG6'
+    """
+    if vdg_bits & VDG_AG:
+        return GRAPHICS_MODES[(vdg_bits >> 4) & 0x07][0]
+    if vdg_bits & VDG_GM0:
+        return "SG6"
+    return "SG4"
+
+
+def build_graphics_table(gm, css):
+    """
+    Returns a list with the RGB pixels of every byte value in the given graphics mode.
+
+    >>> table = build_graphics_table(7, css=0)  # RG6: 1 bit per pixel
+    >>> table[0x80] == bytes(PALETTE[0]) + bytes(BLACK) * 7
+    True
+    >>> table = build_graphics_table(0, css=1)  # CG1: 2 bits per pixel, 4 pixels wide
+    >>> table[0b00011011] == b"".join(bytes(PALETTE[index]) * 4 for index in (4, 5, 6, 7))
+    True
+    """
+    __, bits_per_pixel, pixels = GRAPHICS_MODES[gm]
+    pixel_width = WIDTH // pixels
+    if bits_per_pixel == 1:
+        colors = (bytes(BLACK), bytes(PALETTE[css * 4]))
+    else:
+        colors = tuple(bytes(color) for color in PALETTE[css * 4:css * 4 + 4])
+    mask = (1 << bits_per_pixel) - 1
+    table = []
+    for value in range(256):
+        table.append(b"".join(
+            colors[(value >> shift) & mask] * pixel_width
+            for shift in range(8 - bits_per_pixel, -1, -bits_per_pixel)
+        ))
+    return table
+
+
+def build_semigraphics_line(value, line, semigraphics6, css):
+    """
+    Returns the 8 RGB pixels of one scanline of a semigraphics character.
+
+    >>> build_semigraphics_line(0b10001000, 0, semigraphics6=False, css=0) == bytes(PALETTE[0]) * 4 + bytes(BLACK) * 4
+    True
+    >>> build_semigraphics_line(0b10001000, 6, semigraphics6=False, css=0) == bytes(BLACK) * 8
+    True
+    >>> build_semigraphics_line(0b11000001, 11, semigraphics6=True, css=1) == bytes(BLACK) * 4 + bytes(PALETTE[7]) * 4
+    True
+    """
+    if semigraphics6:
+        color = bytes(PALETTE[css * 4 + ((value >> 6) & 0x03)])
+        shift = 4 - (line // 4) * 2  # Three block rows, 4 scanlines each
+    else:
+        color = bytes(PALETTE[(value >> 4) & 0x07])
+        shift = 2 - (line // 6) * 2  # Two block rows, 6 scanlines each
+    black = bytes(BLACK)
+    left = color if value & (2 << shift) else black
+    right = color if value & (1 << shift) else black
+    return left * 4 + right * 4
+
+
+def build_alpha_tables(chars_dict, charmap, semigraphics6, css):
+    """
+    Returns for every scanline of a text row a list with the RGB pixels of every byte value.
+    Text characters use the font data, with the charmap char/color.
+    """
+    dark, bright = (bytes(color) for color in ALPHA_COLORS[css])
+    tables = []
+    for line in range(CHAR_LINES):
+        table = []
+        for value in range(256):
+            if value & 0x80:
+                table.append(build_semigraphics_line(value, line, semigraphics6, css))
+                continue
+            char, color = charmap[value]
+            try:
+                char_data = chars_dict[char]
+            except KeyError:
+                char_data = chars_dict[UNKNOWN_CHAR]
+            if color == INVERTED:
+                foreground, background = bright, dark
+            else:
+                foreground, background = dark, bright
+            table.append(b"".join(
+                foreground if bit == FOREGROUND_CHAR else background
+                for bit in char_data[line]
+            ))
+        tables.append(table)
+    return tables
+
+
+class VDGRenderer:
+    """
+    Render the video RAM into the RGB framebuffer.
+
+    >>> from dragonpy.Dragon32.dragon_charmap import get_charmap_dict
+    >>> from dragonpy.Dragon32.dragon_font import CHARS_DICT
+    >>> ram = bytearray(0x10000)
+    >>> class Memory:
+    ...     def read_block(self, start, end):
+    ...         return bytes(ram[start:end])
+    >>> renderer = VDGRenderer(CHARS_DICT, get_charmap_dict())
+    >>> renderer.update(Memory(), display_offset=0x0400, sam_mode=0, vdg_bits=0)  # The complete screen
+    [(0, 192, 0, 256)]
+    >>> renderer.has_changes(Memory(), 0x0400, 0, 0)
+    False
+    >>> ram[0x0400 + 32 * 2 + 3] = 0x41  # "A" in the third text row, 4th column
+    >>> renderer.update(Memory(), 0x0400, 0, 0)  # Only this cell: (start line, end line, start x, end x)
+    [(24, 36, 24, 32)]
+    >>> renderer.update(Memory(), 0x0600, 6, VDG_AG | VDG_GM2 | VDG_GM1 | VDG_GM0)  # PMODE 4
+    [(0, 192, 0, 256)]
+    >>> ram[0x0600 + 32 * 10] = 0xff
+    >>> renderer.update(Memory(), 0x0600, 6, VDG_AG | VDG_GM2 | VDG_GM1 | VDG_GM0)
+    [(10, 11, 0, 8)]
+    >>> renderer.get_pixel(0, 10) == PALETTE[0], renderer.get_pixel(8, 10) == BLACK
+    (True, True)
+    """
+
+    def __init__(self, chars_dict, charmap):
+        self.chars_dict = chars_dict
+        self.charmap = charmap
+        self.framebuffer = bytearray(LINE_SIZE * HEIGHT)
+        self._tables = {}  # Precomputed RGB tables, see: get_table()
+        self.mode = None  # (display offset, SAM mode, VDG bits) of the framebuffer
+        self.vram = None  # Video RAM content of the framebuffer
+
+    def build_tables(self):
+        """
+        Build the RGB tables of all alphanumeric, semigraphics and graphics modes
+        (takes a few ms), e.g.: at startup. So a mode switch doesn't build a table
+        while the CPU runs.
+        """
+        for css in (0, VDG_CSS):
+            for semigraphics in (0, VDG_GM0):
+                self.get_table(semigraphics | css)
+            for gm in range(8):
+                self.get_table(VDG_AG | (gm << 4) | css)
+
+    def get_table(self, vdg_bits):
+        """
+        Graphics modes: byte value -> RGB pixels
+        Alphanumeric modes: [scanline of the text row][byte value] -> RGB pixels
+        """
+        if vdg_bits & VDG_AG:
+            key = vdg_bits
+        else:
+            key = vdg_bits & (VDG_GM0 | VDG_CSS)  # GM1/GM2 are not used in alphanumeric modes
+        try:
+            return self._tables[key]
+        except KeyError:
+            css = 1 if vdg_bits & VDG_CSS else 0
+            if vdg_bits & VDG_AG:
+                table = build_graphics_table((vdg_bits >> 4) & 0x07, css)
+            else:
+                table = build_alpha_tables(self.chars_dict, self.charmap, bool(vdg_bits & VDG_GM0), css)
+            self._tables[key] = table
+            return table
+
+    def get_geometry(self, sam_mode, vdg_bits):
+        """
+        Returns: (bytes per memory row in SAM, scanlines per memory row, bytes per row in VDG, video RAM size)
+
+        >>> VDGRenderer(None, None).get_geometry(0, 0x00)  # Text mode: 16 rows with 32 bytes
+        (32, 12, 32, 512)
+        >>> VDGRenderer(None, None).get_geometry(6, 0xf0)  # PMODE 4
+        (32, 1, 32, 6144)
+        """
+        row_bytes, row_lines = SAM_MODES[sam_mode & 0x07]
+        if vdg_bits & VDG_AG:
+            __, bits_per_pixel, pixels = GRAPHICS_MODES[(vdg_bits >> 4) & 0x07]
+            vdg_row_bytes = pixels * bits_per_pixel // 8
+        else:
+            vdg_row_bytes = 32
+        rows = -(-HEIGHT // row_lines)
+        return row_bytes, row_lines, vdg_row_bytes, (rows - 1) * row_bytes + vdg_row_bytes
+
+    def read_vram(self, memory, display_offset, size):
+        end = display_offset + size
+        if end <= ADDRESS_COUNT:
+            return memory.read_block(display_offset, end)
+        # The SAM address counter wraps around
+        return memory.read_block(display_offset, ADDRESS_COUNT) + memory.read_block(0, end - ADDRESS_COUNT)
+
+    def has_changes(self, memory, display_offset, sam_mode, vdg_bits):
+        """
+        Returns True if the framebuffer is outdated.
+        """
+        vdg_bits &= VDG_BITS_MASK
+        if self.mode != (display_offset, sam_mode, vdg_bits):
+            return True
+        size = len(self.vram)
+        return self.read_vram(memory, display_offset, size) != self.vram
+
+    def update(self, memory, display_offset, sam_mode, vdg_bits):
+        """
+        Render all changed cells into the framebuffer.
+        Returns the changed areas: [(start line, end line, start x, end x), ...]
+        Adjacent changed memory rows are merged into one area.
+        """
+        vdg_bits &= VDG_BITS_MASK
+        row_bytes, row_lines, vdg_row_bytes, size = self.get_geometry(sam_mode, vdg_bits)
+        vram = self.read_vram(memory, display_offset, size)
+
+        mode = (display_offset, sam_mode, vdg_bits)
+        old_vram = self.vram if mode == self.mode else None
+        if old_vram == vram:
+            return []
+        self.mode = mode
+        self.vram = vram
+
+        table = self.get_table(vdg_bits)
+        alphanumeric = not vdg_bits & VDG_AG
+        framebuffer = self.framebuffer
+        byte_pixels = WIDTH // vdg_row_bytes
+
+        ranges = []
+        for start in range(0, HEIGHT, row_lines):
+            offset = start // row_lines * row_bytes
+            row = vram[offset:offset + vdg_row_bytes]
+            if old_vram is None:
+                first, last = 0, vdg_row_bytes
+            else:
+                old_row = old_vram[offset:offset + vdg_row_bytes]
+                if old_row == row:
+                    continue
+                # Only the cells between the first and the last changed byte:
+                first = 0
+                while old_row[first] == row[first]:
+                    first += 1
+                last = vdg_row_bytes
+                while old_row[last - 1] == row[last - 1]:
+                    last -= 1
+                row = row[first:last]
+
+            end = min(start + row_lines, HEIGHT)
+            start_x = first * byte_pixels
+            end_x = last * byte_pixels
+            fb_start = start_x * 3
+            fb_end = end_x * 3
+            if alphanumeric:
+                for line in range(start, end):
+                    line_table = table[line % CHAR_LINES]
+                    fb_offset = line * LINE_SIZE
+                    framebuffer[fb_offset + fb_start:fb_offset + fb_end] = b"".join(
+                        [line_table[value] for value in row]
+                    )
+            else:
+                line_data = b"".join([table[value] for value in row])
+                for line in range(start, end):
+                    fb_offset = line * LINE_SIZE
+                    framebuffer[fb_offset + fb_start:fb_offset + fb_end] = line_data
+
+            if ranges and ranges[-1][1] == start:
+                # Merge adjacent rows into one batch
+                last_start, __, last_start_x, last_end_x = ranges[-1]
+                ranges[-1] = (last_start, end, min(last_start_x, start_x), max(last_end_x, end_x))
+            else:
+                ranges.append((start, end, start_x, end_x))
+        return ranges
+
+    def get_pixel(self, x, y):
+        offset = y * LINE_SIZE + x * 3
+        return tuple(self.framebuffer[offset:offset + 3])
+
+    def get_ppm(self, start_line=0, end_line=HEIGHT, start_x=0, end_x=WIDTH):
+        """
+        Returns the given area as binary PPM image data.
+        """
+        header = ppm_header(end_x - start_x, end_line - start_line)
+        if start_x == 0 and end_x == WIDTH:
+            return header + bytes(self.framebuffer[start_line * LINE_SIZE:end_line * LINE_SIZE])
+        framebuffer = self.framebuffer
+        return header + b"".join([
+            framebuffer[offset + start_x * 3:offset + end_x * 3]
+            for offset in range(start_line * LINE_SIZE, end_line * LINE_SIZE, LINE_SIZE)
+        ])
+
+    def get_png(self):
+        return encode_png(WIDTH, HEIGHT, self.framebuffer)
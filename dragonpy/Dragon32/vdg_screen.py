@@ -0,0 +1,180 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    Headless model of the 32x16 text screen of Dragon 32/64 and CoCo.
+
+    Fed by the display RAM write middleware: Every write is one bytearray
+    store, no string building while the CPU runs. The text is created on
+    request with one str.translate() call via a precomputed charmap table.
+
+    Screenshots are rendered with the same font data as the Tk display
+    (see: dragonpy.Dragon32.vdg) and saved as PNG or PPM, without Tk.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+import logging
+import os
+
+from dragonpy.Dragon32.dragon_charmap import get_charmap_dict
+from dragonpy.Dragon32.keyboard_map import add_to_input_queue
+
+
+log = logging.getLogger(__name__)
+
+
+# Display RAM value -> char, used as str.translate() table:
+TEXT_TABLE = "".join(char for value, (char, color) in sorted(get_charmap_dict().items()))
+
+
+class VDGScreen:
+    """
+    >>> screen = VDGScreen()
+    >>> for offset, value in enumerate(b"HELLO"):
+    ...     __ = screen.display_callback(0, 0, 0x0400 + 32 + offset, value)
+    >>> screen.get_lines()[:3]
+    ['', 'HELLO', '']
+    >>> screen.last_line
+    'HELLO'
+    >>> screen.get_written_lines()
+    ['HELLO']
+
+    Only the written cells are returned, not the old content of the row:
+
+    >>> screen.reset_written()
+    >>> for offset, value in enumerate(b"J"):
+    ...     __ = screen.display_callback(0, 0, 0x0400 + 32 + offset, value)
+    >>> screen.get_lines()[1]
+    'JELLO'
+    >>> screen.last_line
+    'J'
+    >>> screen.get_written_lines()
+    ['J']
+    >>> screen.screen_hash() == VDGScreen().screen_hash()
+    False
+    """
+    START_ADDR = 0x0400
+    COLUMNS = 32
+    ROWS = 16
+    SIZE = COLUMNS * ROWS
+    SPACE = 0x60  # A normal (not inverted) space character
+
+    def __init__(self):
+        self.data = bytearray([self.SPACE]) * self.SIZE  # Shadow of the display RAM
+        self.last_row = None  # Row of the last write since reset_written()
+        self.line_buffer = bytearray()  # All values written to last_row, in write order
+        self.written = bytearray(self.SIZE)  # 1: Cell was written since reset_written()
+        self._renderer = None  # VDGRenderer, created with the first screenshot
+
+    def display_callback(self, cpu_cycles, op_address, address, value):
+        """ Display RAM write middleware """
+        offset = address - self.START_ADDR
+        if 0 <= offset < self.SIZE:
+            self.data[offset] = value
+            self.written[offset] = 1
+            row = offset // self.COLUMNS
+            if row != self.last_row:
+                self.last_row = row
+                self.line_buffer = bytearray()
+            self.line_buffer.append(value)
+        return value
+
+    def load(self, memory):
+        """ Copy the display RAM into the shadow, e.g.: after the memory was restored directly """
+        self.data[:] = memory.read_block(self.START_ADDR, self.START_ADDR + self.SIZE)
+
+    def reset_written(self):
+        self.last_row = None
+        self.line_buffer = bytearray()
+        self.written[:] = bytes(self.SIZE)
+
+    def add_to_input_queue(self, user_input_queue, txt):
+        add_to_input_queue(user_input_queue, txt)
+
+    def get_bytes(self, memory=None):
+        return bytes(self.data)
+
+    def screen_hash(self):
+        """ SHA-1 hex digest of the display RAM content """
+        return hashlib.sha1(self.data).hexdigest()
+
+    def get_text_line(self, row):
+        start = row * self.COLUMNS
+        return self.data[start:start + self.COLUMNS].decode("latin-1").translate(TEXT_TABLE).rstrip()
+
+    @property
+    def last_line(self):
+        """
+        All chars written to the last written row, in write order (not stripped).
+        e.g.: Copying a "OK" row while scrolling results in "OK" with 30 spaces.
+        """
+        return self.line_buffer.decode("latin-1").translate(TEXT_TABLE)
+
+    def get_lines(self, memory=None):
+        text = self.data.decode("latin-1").translate(TEXT_TABLE)
+        columns = self.COLUMNS
+        return [text[start:start + columns].rstrip() for start in range(0, self.SIZE, columns)]
+
+    def get_written_lines(self):
+        """
+        The stripped text of all rows written since reset_written():
+        Only the written cells, without the old content of the row.
+        """
+        text = self.data.decode("latin-1").translate(TEXT_TABLE)
+        lines = []
+        for start in range(0, self.SIZE, self.COLUMNS):
+            written = self.written[start:start + self.COLUMNS]
+            if any(written):
+                lines.append("".join(
+                    char
+                    for char, is_written in zip(text[start:start + self.COLUMNS], written)
+                    if is_written
+                ).strip())
+        return lines
+
+    def get_text(self, memory=None, since=None):
+        """ The complete screen content. Can't separate old from new text. """
+        return "\n".join(self.get_lines())
+
+    def get_mark(self):
+        return None
+
+    def clear(self, memory):
+        memory.fill(self.START_ADDR, self.START_ADDR + self.SIZE, self.SPACE)
+        self.data[:] = bytes([self.SPACE]) * self.SIZE
+
+    # -------------------------------------------------------------------------
+
+    def read_block(self, start, end):
+        """ Memory interface for the VDGRenderer: Only the display RAM exists. """
+        return bytes(self.data[start - self.START_ADDR:end - self.START_ADDR])
+
+    def render(self):
+        """ Render the text screen, returns the VDGRenderer with the framebuffer """
+        if self._renderer is None:
+            # Big tables: import only if used
+            from dragonpy.Dragon32.dragon_font import CHARS_DICT
+            from dragonpy.Dragon32.vdg import VDGRenderer
+
+            self._renderer = VDGRenderer(CHARS_DICT, get_charmap_dict())
+        self._renderer.update(self, display_offset=self.START_ADDR, sam_mode=0, vdg_bits=0)
+        return self._renderer
+
+    def get_ppm(self):
+        return self.render().get_ppm()
+
+    def get_png(self):
+        return self.render().get_png()
+
+    def save_screenshot(self, filepath):
+        """ Save the screen as PNG or as binary PPM, if the file extension is .ppm """
+        if os.path.splitext(filepath)[1].lower() == ".ppm":
+            data = self.get_ppm()
+        else:
+            data = self.get_png()
+        with open(filepath, "wb") as f:
+            f.write(data)
+        log.info("Save screenshot to %s", filepath)
@@ -13,7 +13,6 @@ import logging
 from dragonpy import constants
 from dragonpy.Dragon32.config import Dragon32Cfg
 from dragonpy.Dragon64.Dragon64_rom import Dragon64RomIC17, Dragon64RomIC18
-from dragonpy.Dragon64.mem_info import get_dragon_meminfo
 
 
 class Dragon64Cfg(Dragon32Cfg):
@@ -34,6 +33,14 @@ class Dragon64Cfg(Dragon32Cfg):
 #     RAM_END = 0x3FFF # 16KB # usable
     RAM_END = 0x7FFF  # 32KB
 
+    # The upper 32KB of the 64KB RAM are switched in by the SAM page bit and map type.
+    # See: dragonpy.Dragon32.MC6883_SAM.SAM.update_memory_map()
+    UPPER_RAM_SIZE = 0x8000
+
+    # The Dragon 64 starts in the 32KB mode: "scan keyboard & return ASCII"
+    # at the same address as the Dragon 32, see: "Dragon 64 in 32 mode.txt"
+    STARTUP_END_ADDR = 0xbbe5
+
     ROM_START = 0x8000
     ROM_END = 0xFFFF
     # ROM size: 0x8000 == 32768 Bytes
@@ -51,6 +58,8 @@ class Dragon64Cfg(Dragon32Cfg):
         super().__init__(cmd_args)
 
         if self.verbosity <= logging.ERROR:
+            from dragonpy.Dragon64.mem_info import get_dragon_meminfo  # Big tables: import only if used
+
             self.mem_info = get_dragon_meminfo()
 
         self.periphery_class = None  # Dragon32Periphery
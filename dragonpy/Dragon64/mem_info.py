@@ -12,13 +12,13 @@
 
 import logging
 
-from MC6809.core.memory_info import BaseMemoryInfo
+from dragonpy.core.mem_info_index import IndexedMemoryInfo
 
 
 log = logging.getLogger(__name__)
 
 
-class Dragon64MemInfo(BaseMemoryInfo):
+class Dragon64MemInfo(IndexedMemoryInfo):
     MEM_INFO = (
         (0x0151, 0x0151, "Keyboard matrix state PB0"),
         (0x0152, 0x0152, "Keyboard matrix state PB1"),
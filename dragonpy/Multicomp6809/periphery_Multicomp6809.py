@@ -51,7 +51,9 @@ class Multicomp6809Periphery:
         try:
             char = self.user_input_queue.get(block=False)
         except queue.Empty:
+            self.cpu.idle_detector.input_polled(cpu_cycles, empty=True)
             return 0x0
+        self.cpu.idle_detector.input_polled(cpu_cycles, empty=False)
 
         if isinstance(char, int):
             log.critical("Ignore %s from user_input_queue", repr(char))
@@ -12,7 +12,6 @@ from dragonlib.api import CoCoAPI
 
 from dragonpy import constants
 from dragonpy.core.configs import BaseConfig
-from dragonpy.Simple6809.mem_info import get_simple6809_meminfo
 from dragonpy.Simple6809.Simple6809_rom import Simple6809Rom
 
 
@@ -57,6 +56,8 @@ class Simple6809Cfg(BaseConfig):
         self.machine_api = CoCoAPI()  # FIXME!
 
 #         if self.verbosity <= logging.INFO:
+        from dragonpy.Simple6809.mem_info import get_simple6809_meminfo  # Big tables: import only if used
+
         self.mem_info = get_simple6809_meminfo()
 
 #         self.periphery_class = Simple6809Periphery
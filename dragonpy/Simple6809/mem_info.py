@@ -12,13 +12,13 @@
 
 import logging
 
-from MC6809.core.memory_info import BaseMemoryInfo
+from dragonpy.core.mem_info_index import IndexedMemoryInfo
 
 
 log = logging.getLogger("DragonPy.Simple6809.mem_info")
 
 
-class Simple6809MemInfo(BaseMemoryInfo):
+class Simple6809MemInfo(IndexedMemoryInfo):
     MEM_INFO = (
         # generated from "ExBasROM.LST" with "make_mem_info.py":
 
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+from typing import Annotated
+
+import tyro
+from cli_base.cli_tools.verbosity import setup_logging
+from cli_base.tyro_commands import TyroVerbosityArgType
+from rich import print  # noqa
+
+from dragonpy.cli_app import app
+from dragonpy.cli_arg_types import TyroMachineArgType
+from dragonpy.core.batch import DEFAULT_MAX_CYCLES, iter_basic_files, run_batch
+
+
+@app.command
+def batch(
+    paths: Annotated[
+        list[Path],
+        tyro.conf.arg(help='BASIC listings to run and/or directories with *.bas files'),
+        tyro.conf.Positional,
+    ],
+    machine: TyroMachineArgType,
+    verbosity: TyroVerbosityArgType,
+    max_cycles: Annotated[
+        int,
+        tyro.conf.arg(help='Stop a program after this many CPU cycles'),
+    ] = DEFAULT_MAX_CYCLES,
+    workers: Annotated[
+        int | None,
+        tyro.conf.arg(help='Number of emulator processes (default: one per CPU core)'),
+    ] = None,
+    screenshots: Annotated[
+        Path | None,
+        tyro.conf.arg(help='Save the final screen of every program as PNG into this directory'),
+    ] = None,
+):
+    """
+    Run BASIC programs headless in parallel and print their screens
+    """
+    setup_logging(verbosity=verbosity)
+    filepaths = list(iter_basic_files(paths))
+    print(f'Run {len(filepaths)} BASIC programs on {machine}...')
+
+    cfg_dict = {
+        'verbosity': int(verbosity),
+        'trace': False,
+        'max_ops': None,
+    }
+    failed = 0
+    total_cycles = 0
+    total_duration = 0
+    if screenshots:
+        screenshots.mkdir(parents=True, exist_ok=True)
+        screenshots = str(screenshots)
+    for result in run_batch(
+        machine, filepaths, cfg_dict=cfg_dict, max_cycles=max_cycles, workers=workers, screenshot_dir=screenshots
+    ):
+        if result['error']:
+            state = f'[red]ERROR: {result["error"]}'
+        elif result['completed']:
+            state = '[green]OK'
+        else:
+            state = '[yellow]cycle limit reached'
+        if not result['completed']:
+            failed += 1
+        total_cycles += result['cycles']
+        total_duration += result['duration']
+
+        print(
+            f'\n[bold]{result["filepath"]}[/bold] - {state}[/] -'
+            f' {result["cycles"]:,} cycles in {result["duration"]:.2f} sec.'
+        )
+        sys.stdout.write(f'{result["screen"]}\n')  # Not rich.print(): The screen may contain [markup]
+        if result['screenshot']:
+            print(f'Screenshot: {result["screenshot"]}')
+
+    print(f'\n{len(filepaths) - failed}/{len(filepaths)} programs completed,'
+          f' {total_cycles:,} cycles in {total_duration:.2f} sec. (sum of all workers)')
+    if failed:
+        sys.exit(1)
@@ -1,14 +1,26 @@
 import locale
+import sys
 
 from cli_base.cli_tools.verbosity import setup_logging
 from cli_base.tyro_commands import TyroVerbosityArgType
 from rich import print  # noqa
 
-from basic_editor.editor import run_basic_editor
 from dragonpy.cli_app import app
-from dragonpy.cli_arg_types import TyroMachineArgType, TyroMaxOpsArgType, TyroTraceArgType
+from dragonpy.cli_arg_types import (
+    TyroCassetteArgType,
+    TyroCassetteSaveArgType,
+    TyroFastCassetteArgType,
+    TyroHeadlessArgType,
+    TyroMachineArgType,
+    TyroMaxOpsArgType,
+    TyroRecordArgType,
+    TyroTraceArgType,
+    TyroTypeTextArgType,
+    TyroUntilArgType,
+    TyroWarpArgType,
+)
 from dragonpy.core.configs import machine_dict
-from dragonpy.core.gui_starter import gui_mainloop
+from dragonpy.core.session import run_headless
 
 
 # use user's preferred locale
@@ -19,6 +31,8 @@ locale.setlocale(locale.LC_ALL, '')
 @app.command
 def gui(verbosity: TyroVerbosityArgType):
     """<<< **start this** - Start the DragonPy tkinter starter GUI"""
+    from dragonpy.core.gui_starter import gui_mainloop  # tkinter: import only if used
+
     setup_logging(verbosity=verbosity)
     gui_mainloop(confirm_exit=False)
 
@@ -28,16 +42,40 @@ def run(
     machine: TyroMachineArgType,
     trace: TyroTraceArgType,
     max_ops: TyroMaxOpsArgType,
+    headless: TyroHeadlessArgType,
+    type_text: TyroTypeTextArgType,
+    until: TyroUntilArgType,
+    warp: TyroWarpArgType,
+    record: TyroRecordArgType,
+    cassette: TyroCassetteArgType,
+    fast_cassette: TyroFastCassetteArgType,
+    cassette_save: TyroCassetteSaveArgType,
     verbosity: int = 0,  # TODO: use TyroVerbosityArgType
 ):
     """Run a machine emulation"""
-    machine_run_func, MachineConfigClass = machine_dict[machine]
-    print(f'Use machine func: {machine_run_func.__name__}')
     cfg_dict = {
         'verbosity': verbosity,  # TODO: Remove and use only logging
         'trace': trace,
         'max_ops': max_ops,
+        'warp': warp,
+        'record': record,
+        'cassette': cassette,
+        'fast_cassette': fast_cassette,
+        'cassette_save': cassette_save,
     }
+    if headless:
+        txt = type_text.replace('\\n', '\n') if type_text else None
+        matched, screen_text = run_headless(
+            machine, cfg_dict, txt=txt, until=until, max_cycles=max_ops, record_filepath=record
+        )
+        sys.stdout.write(f'{screen_text}\n')  # Not rich.print(): The screen may contain [markup]
+        if not matched:
+            print(f'ERROR: {until!r} not found on screen!', file=sys.stderr)
+            sys.exit(1)
+        return
+
+    machine_run_func, MachineConfigClass = machine_dict[machine]
+    print(f'Use machine func: {machine_run_func.__name__}')
     print(cfg_dict)
     machine_run_func(cfg_dict)
 
@@ -47,6 +85,8 @@ def editor(machine: TyroMachineArgType, verbosity: TyroVerbosityArgType):
     """
     Run only the BASIC editor
     """
+    from basic_editor.editor import run_basic_editor  # tkinter: import only if used
+
     setup_logging(verbosity=verbosity)
     machine_run_func, MachineConfigClass = machine_dict[machine]
     cfg_dict = {
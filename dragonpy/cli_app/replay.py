@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+from typing import Annotated
+
+import tyro
+from cli_base.cli_tools.verbosity import setup_logging
+from cli_base.tyro_commands import TyroVerbosityArgType
+from rich import print  # noqa
+
+from dragonpy.cli_app import app
+from dragonpy.core.input_record import InputRecording
+from dragonpy.core.session import replay_headless
+
+
+@app.command
+def replay(
+    recording: Annotated[
+        Path,
+        tyro.conf.arg(help='Input recording JSON file, created with "run --record"'),
+        tyro.conf.Positional,
+    ],
+    verbosity: TyroVerbosityArgType,
+):
+    """
+    Replay a recorded session headless, check the screen hash and print the speed
+    """
+    setup_logging(verbosity=verbosity)
+    input_recording = InputRecording.load(recording)
+    cfg_dict = {
+        'verbosity': int(verbosity),
+        'trace': False,
+        'max_ops': None,
+    }
+    session, cycles, duration = replay_headless(input_recording, cfg_dict=cfg_dict)
+    sys.stdout.write(f'{session.get_screen_text()}\n')  # Not rich.print(): The screen may contain [markup]
+
+    speed_info = f'\n{len(input_recording.events)} input events, {cycles:,} cycles in {duration:.2f} sec.'
+    if duration > 0:
+        speed_info += f' ({cycles / duration / 1000000:.2f} MHz)'
+    print(speed_info)
+    screen_hash = session.screen_hash()
+    if input_recording.screen_hash is None:
+        print(f'Screen hash: {screen_hash} (not recorded)')
+    elif screen_hash == input_recording.screen_hash:
+        print(f'[green]Screen hash: {screen_hash} OK')
+    else:
+        print(f'[red]Screen hash: {screen_hash} differs from recorded {input_recording.screen_hash}')
+        sys.exit(1)
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Annotated
 
 import tyro
@@ -25,3 +26,61 @@ TyroMachineArgType = Annotated[
         help=f'Used machine configuration, one of: {sorted(machine_dict.keys())}',
     ),
 ]
+
+TyroHeadlessArgType = Annotated[
+    bool,
+    tyro.conf.arg(
+        default=False,
+        help='Run without GUI as fast as possible and print the screen at the end',
+    ),
+]
+
+TyroWarpArgType = Annotated[
+    bool,
+    tyro.conf.arg(
+        default=False,
+        help='Start the GUI in warp mode: No speed limit and no display updates until the machine waits for input',
+    ),
+]
+
+TyroRecordArgType = Annotated[
+    Path | None,
+    tyro.conf.arg(
+        default=None,
+        help='Record all input with CPU cycle timestamps to this JSON file, for a bit-for-bit replay',
+    ),
+]
+
+TyroCassetteArgType = Annotated[
+    Path | None,
+    tyro.conf.arg(
+        default=None,
+        help='Dragon/CoCo: Insert this .wav or .cas tape image into the cassette deck, e.g. for CLOAD',
+    ),
+]
+
+TyroFastCassetteArgType = Annotated[
+    bool,
+    tyro.conf.arg(
+        default=False,
+        help='Dragon/CoCo: Instant CLOAD of the --cassette tape via the ROM block routines, instead of the tape signal',
+    ),
+]
+
+TyroCassetteSaveArgType = Annotated[
+    Path | None,
+    tyro.conf.arg(
+        default=None,
+        help='Dragon/CoCo: Capture CSAVE instantly into this .cas file, implies --fast-cassette',
+    ),
+]
+
+TyroTypeTextArgType = Annotated[
+    str | None,
+    tyro.conf.arg(default=None, help='Only --headless: Type this text into the machine, use "\\n" as ENTER'),
+]
+
+TyroUntilArgType = Annotated[
+    str | None,
+    tyro.conf.arg(default=None, help='Only --headless: Run until this regular expression appears on the screen'),
+]
@@ -27,6 +27,17 @@ import logging
 log = logging.getLogger(__name__)
 
 
+PAGE_SIZE = 0x100  # Bytes per page
+PAGE_COUNT = 0x100  # 256 pages a 256 Bytes == 64KB
+
+# Memory.page_types values:
+PAGE_RAM = 0  # plain RAM: read/write directly from/to the page
+PAGE_ROM = 1  # plain ROM: read directly, writes will be ignored
+PAGE_IO = 2  # hooked: callbacks/middlewares in this page, or a page that is only partly ROM
+
+MAIN_BANK = "main"  # The bank with the normal 64KB address space: Memory._mem
+
+
 class Memory:
     def __init__(self, cfg, read_bus_request_queue=None, read_bus_response_queue=None, write_bus_queue=None):
         self.cfg = cfg
@@ -70,10 +81,44 @@ class Memory:
         # array consumes also less RAM than lists and it's a little bit faster:
         self._mem = array.array("B", [0x00] * self.INTERNAL_SIZE)  # unsigned char
 
+        # Memory banks, e.g.: the upper 32KB RAM of the Dragon 64.
+        # The page memoryviews of every bank are created only once,
+        # so a bank switch only repoints entries in the page table.
+        self._banks = {MAIN_BANK: self._mem}
+        self._bank_pages = {MAIN_BANK: self._split_pages(self._mem)}
+
+        # The page table: The memoryview of the currently mapped bank page for every 256 Bytes page
+        self._pages = list(self._bank_pages[MAIN_BANK])
+
+        # PAGE_RAM, PAGE_ROM or PAGE_IO (page is only partly ROM) of the main bank pages:
+        self._main_types = bytearray(PAGE_COUNT)
+        for page in range(PAGE_COUNT):
+            page_start = page * PAGE_SIZE
+            page_end = page_start + PAGE_SIZE - 1
+            if self.cfg.ROM_START <= page_start and page_end <= self.cfg.ROM_END:
+                self._main_types[page] = PAGE_ROM
+            elif self.cfg.ROM_START <= page_end and page_start <= self.cfg.ROM_END:
+                self._main_types[page] = PAGE_IO
+        # The same for the currently mapped pages (all other banks contains only RAM):
+        self._map_types = bytearray(self._main_types)
+
+        # The dispatch tables used in read_byte()/write_byte():
+        # The page memoryview if the page can be accessed directly,
+        # or None if the slow path with callbacks/middlewares/ROM check must be used.
+        self._read_pages = [None] * PAGE_COUNT
+        self._write_pages = [None] * PAGE_COUNT
+        self._read_hooked = set()  # pages with read callbacks/middlewares
+        self._write_hooked = set()  # pages with write callbacks/middlewares
+        self.page_types = bytearray(PAGE_COUNT)  # PAGE_RAM, PAGE_ROM or PAGE_IO
+
         if cfg and cfg.rom_cfg:
             for romfile in cfg.rom_cfg:
                 self.load_file(romfile)
 
+        # The main bank content after ROM loading, used to skip unchanged pages in save states:
+        self._initial_mem = bytes(self._mem)
+        self._initial_pages = self._split_pages(self._initial_mem)
+
         self._read_byte_callbacks = {}
         self._read_word_callbacks = {}
         self._write_byte_callbacks = {}
@@ -85,6 +130,7 @@ class Memory:
         # init read/write byte middlewares:
         self._read_byte_middleware = {}
         self._write_byte_middleware = {}
+        self._update_hooked_pages()
         for addr_range, functions in list(cfg.memory_byte_middlewares.items()):
             start_addr, end_addr = addr_range
             read_func, write_func = functions
@@ -133,8 +179,130 @@ class Memory:
         else:
             for addr in range(start_addr, end_addr + 1):
                 callbacks_dict[addr] = callback_func
+        self._update_hooked_pages()
+
+    def _update_hooked_pages(self):
+        """
+        Must be called after every change of the byte callbacks/middlewares.
+        """
+        self._read_hooked = {
+            address >> 8
+            for callbacks_dict in (self._read_byte_callbacks, self._read_byte_middleware)
+            for address in callbacks_dict
+        }
+        self._write_hooked = {
+            address >> 8
+            for callbacks_dict in (self._write_byte_callbacks, self._write_byte_middleware)
+            for address in callbacks_dict
+        }
+        self._update_pages(range(PAGE_COUNT))
+
+    def _update_pages(self, pages):
+        """
+        Update the page dispatch tables for the given pages.
+        """
+        for page in pages:
+            page_view = self._pages[page]
+            page_type = self._map_types[page]
+            read_hooked = page in self._read_hooked
+            write_hooked = page in self._write_hooked
+
+            self._read_pages[page] = None if read_hooked else page_view
+            self._write_pages[page] = page_view if (page_type == PAGE_RAM and not write_hooked) else None
+
+            if read_hooked or write_hooked:
+                self.page_types[page] = PAGE_IO
+            else:
+                self.page_types[page] = page_type
 
     # ---------------------------------------------------------------------------
+    # Bank switching
+
+    def _split_pages(self, bank):
+        bank_view = memoryview(bank)
+        return [
+            bank_view[offset:offset + PAGE_SIZE]
+            for offset in range(0, len(bank), PAGE_SIZE)
+        ]
+
+    def add_bank(self, bank_name, size):
+        """
+        Add a new memory bank (initialized with zeros) that can be mapped via map_bank()
+        """
+        assert bank_name not in self._banks, f"Memory bank {bank_name!r} exists!"
+        assert size % PAGE_SIZE == 0, f"Memory bank size ${size:04x} is not a multiple of ${PAGE_SIZE:x}"
+        bank = array.array("B", bytes(size))
+        self._banks[bank_name] = bank
+        self._bank_pages[bank_name] = self._split_pages(bank)
+
+    def map_bank(self, start_addr, end_addr, bank_name=MAIN_BANK, bank_offset=None):
+        """
+        Map the page aligned address area start_addr...end_addr (inclusive)
+        to the given memory bank, starting at bank_offset (default: start_addr).
+        Mapped pages of other banks are always RAM. Mapping back the main bank
+        at the same address restores the ROM write protection.
+
+        Only the page table entries will be changed, no data is copied.
+        """
+        assert start_addr % PAGE_SIZE == 0, f"${start_addr:04x} is not page aligned"
+        assert end_addr % PAGE_SIZE == PAGE_SIZE - 1, f"${end_addr:04x} is not page aligned"
+        if bank_offset is None:
+            bank_offset = start_addr
+
+        bank_pages = self._bank_pages[bank_name]
+        first_page = start_addr // PAGE_SIZE
+        first_bank_page = bank_offset // PAGE_SIZE
+        pages = range(first_page, end_addr // PAGE_SIZE + 1)
+        for page in pages:
+            self._pages[page] = bank_pages[first_bank_page + page - first_page]
+            if bank_name == MAIN_BANK and first_bank_page == first_page:
+                self._map_types[page] = self._main_types[page]
+            else:
+                self._map_types[page] = PAGE_RAM
+        self._update_pages(pages)
+
+    def iter_changed_pages(self):
+        """
+        Yield (bank name, page number, page data) of every page that differs
+        from the initial content: Unchanged ROM pages and zero pages are skipped.
+        """
+        zero_page = bytes(PAGE_SIZE)
+        for bank_name, bank_pages in self._bank_pages.items():
+            for page, page_view in enumerate(bank_pages):
+                if bank_name == MAIN_BANK:
+                    initial = self._initial_pages[page]
+                else:
+                    initial = zero_page
+                if page_view != initial:
+                    yield bank_name, page, page_view.tobytes()
+
+    def iter_pages(self):
+        """
+        Yield (bank name, page number, page memoryview) of all pages of all banks
+        """
+        for bank_name, bank_pages in self._bank_pages.items():
+            for page, page_view in enumerate(bank_pages):
+                yield bank_name, page, page_view
+
+    def restore_pages(self, changed_pages):
+        """
+        Reset all banks to the initial content and store the
+        (bank name, page number, page data) from iter_changed_pages()
+        """
+        for bank_name, bank in self._banks.items():
+            if bank_name == MAIN_BANK:
+                memoryview(bank)[:] = self._initial_mem
+            else:
+                memoryview(bank)[:] = bytes(len(bank))
+
+        for bank_name, page, data in changed_pages:
+            self._bank_pages[bank_name][page][:] = data
+
+    def peek_bank(self, bank_name, offset):
+        """
+        Read a byte directly from a memory bank, independent of the current mapping.
+        """
+        return self._banks[bank_name][offset]
 
     def add_read_byte_callback(self, callback_func, start_addr, end_addr=None):
         self._map_address_range(self._read_byte_callbacks, callback_func, start_addr, end_addr)
@@ -168,28 +336,94 @@ class Memory:
         if isinstance(data, str):
             data = [ord(c) for c in data]
 
-        log.debug("ROM load at $%04x: %s", address,
-                  ", ".join(["$%02x" % i for i in data])
-                  )
-        for ea, datum in enumerate(data, address):
-            try:
-                self._mem[ea] = datum
-            except OverflowError as err:
-                msg = "%s - datum=$%x ea=$%04x (load address was: $%04x - data length: %iBytes)" % (
-                    err, datum, ea, address, len(data)
-                )
-                raise OverflowError(msg)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("ROM load at $%04x: %s", address, ", ".join(["$%02x" % i for i in data]))
+
+        self.write_block(address, data)
 
     def load_file(self, romfile):
         data = romfile.get_data()
         self.load(romfile.address, data)
         log.critical("Load ROM file %r to $%04x", romfile.rom_path, romfile.address)
 
+    # ---------------------------------------------------------------------------
+    # Side effect free access, e.g. for debuggers, dumps and BASIC listings:
+    # No CPU cycles are charged, no callbacks/middlewares are called
+    # and the ROM write protection is bypassed.
+
+    def _iter_page_views(self, start, end):
+        """
+        Yield the memoryview slices of all pages for the area start...end (exclusive)
+        """
+        if not 0 <= start <= end <= self.INTERNAL_SIZE:
+            raise IndexError(f"Memory area ${start:04x}-${end:04x} is outside ${self.INTERNAL_SIZE:04x} Bytes")
+        address = start
+        while address < end:
+            page, offset = divmod(address, PAGE_SIZE)
+            size = min(PAGE_SIZE - offset, end - address)
+            yield self._pages[page][offset:offset + size]
+            address += size
+
+    def peek(self, address):
+        return self._pages[address >> 8][address & 0xff]
+
+    def peek_word(self, address):
+        # 6809 is Big-Endian
+        return (self.peek(address) << 8) + self.peek(address + 1)
+
+    def poke(self, address, value):
+        self._pages[address >> 8][address & 0xff] = value
+
+    def poke_word(self, address, word):
+        self.write_block(address, word.to_bytes(2, "big"))
+
+    def read_block(self, start, end):
+        """
+        Return the memory content from start to end (exclusive) as bytes.
+        """
+        return b"".join(self._iter_page_views(start, end))
+
+    def write_block(self, address, data):
+        """
+        Store the given bytes (or a iterable of byte values) at the given address.
+        """
+        try:
+            data = bytes(data)
+        except ValueError as err:
+            raise OverflowError(f"{err} (load address was: ${address:04x})")
+
+        offset = 0
+        for page_view in self._iter_page_views(address, address + len(data)):
+            size = len(page_view)
+            page_view[:] = data[offset:offset + size]
+            offset += size
+
+    def fill(self, start, end, value=0x00):
+        """
+        Fill the memory from start to end (exclusive) with the given byte value.
+        """
+        self.write_block(start, bytes((value,)) * (end - start))
+
+    def copy(self, start, end, destination):
+        """
+        Copy the memory area start...end (exclusive) to destination.
+        Overlapping areas are handled like memmove()
+        """
+        self.write_block(destination, self.read_block(start, end))
+
     # ---------------------------------------------------------------------------
 
     def read_byte(self, address):
         self.cpu.cycles += 1
 
+        try:
+            page_view = self._read_pages[address >> 8]
+        except IndexError:
+            return self._read_outside(address)
+        if page_view is not None:
+            # Fast path: RAM/ROM page without any read hooks
+            return page_view[address & 0xff]
+
         if address in self._read_byte_callbacks:
             byte = self._read_byte_callbacks[address](
                 self.cpu.cycles, self.cpu.last_op_address, address
@@ -201,14 +435,9 @@ class Memory:
             return byte
 
         try:
-            byte = self._mem[address]
-        except KeyError:
-            msg = f"reading outside memory area (PC:${self.cpu.program_counter.value:x})"
-            self.cfg.mem_info(address, msg)
-            msg2 = f"{msg}: ${address:x}"
-            log.warning(msg2)
-            # raise RuntimeError(msg2)
-            byte = 0x0
+            byte = self._pages[address >> 8][address & 0xff]
+        except IndexError:
+            byte = self._read_outside(address)
 
         if address in self._read_byte_middleware:
             byte = self._read_byte_middleware[address](
@@ -225,6 +454,14 @@ class Memory:
 #        )
         return byte
 
+    def _read_outside(self, address):
+        msg = f"reading outside memory area (PC:${self.cpu.program_counter.value:x})"
+        self.cfg.mem_info(address, msg)
+        msg2 = f"{msg}: ${address:x}"
+        log.warning(msg2)
+        # raise RuntimeError(msg2)
+        return 0x0
+
     def read_word(self, address):
         if address in self._read_word_callbacks:
             word = self._read_word_callbacks[address](
@@ -253,6 +490,15 @@ class Memory:
 #             value = value & 0xff
 #             log.error(" ^^^^ wrap around to $%x", value)
 
+        try:
+            page_view = self._write_pages[address >> 8]
+        except IndexError:
+            return self._write_outside(address)
+        if page_view is not None:
+            # Fast path: RAM page without any write hooks
+            page_view[address & 0xff] = value
+            return
+
         if address in self._write_byte_middleware:
             value = self._write_byte_middleware[address](
                 self.cpu.cycles, self.cpu.last_op_address, address, value
@@ -267,7 +513,7 @@ class Memory:
                 self.cpu.cycles, self.cpu.last_op_address, address, value
             )
 
-        if self.cfg.ROM_START <= address <= self.cfg.ROM_END:
+        if self._map_types[address >> 8] != PAGE_RAM and self.cfg.ROM_START <= address <= self.cfg.ROM_END:
             msg = (
                 f"{self.cpu.program_counter.value:04x}|"
                 f" writing into ROM at ${address:04x} ignored."
@@ -278,16 +524,19 @@ class Memory:
             return
 
         try:
-            self._mem[address] = value
-        except (IndexError, KeyError):
-            msg = (
-                f"{self.cpu.program_counter.value:04x}|"
-                f" writing to {address:x} is outside RAM/ROM !"
-            )
-            self.cfg.mem_info(address, msg)
-            msg2 = f"{msg}: ${address:x}"
-            log.warning(msg2)
-#             raise RuntimeError(msg2)
+            self._pages[address >> 8][address & 0xff] = value
+        except IndexError:
+            self._write_outside(address)
+
+    def _write_outside(self, address):
+        msg = (
+            f"{self.cpu.program_counter.value:04x}|"
+            f" writing to {address:x} is outside RAM/ROM !"
+        )
+        self.cfg.mem_info(address, msg)
+        msg2 = f"{msg}: ${address:x}"
+        log.warning(msg2)
+#         raise RuntimeError(msg2)
 
     def write_word(self, address, word):
         assert word >= 0, f"Write negative word hex:{word:04x} dez:{word:d} to ${address:04x}"
@@ -319,11 +568,10 @@ class Memory:
         """
         used in unittests
         """
-        return [self.read_byte(addr) for addr in range(start, end)]
+        return list(self.read_block(start, end))
 
     def iter_bytes(self, start, end):
-        for addr in range(start, end):
-            yield addr, self.read_byte(addr)
+        yield from zip(range(start, end), self.read_block(start, end))
 
     def get_dump(self, start, end):
         dump_lines = []
@@ -0,0 +1,152 @@
+"""
+    DragonPy - Base Tkinter Periphery
+    =================================
+
+    Split from dragonpy.components.periphery: The headless core doesn't import tkinter.
+
+    :created: 2013 by Jens Diemer - www.jensdiemer.de
+    :copyleft: 2013-2014 by the DragonPy team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import logging
+import queue
+
+from dragonpy.components.periphery import PeripheryBase
+
+
+log = logging.getLogger(__name__)
+
+
+try:
+    import tkinter
+except ImportError:
+    log.critical("Error importing Tkinter!")
+    tkinter = None
+
+
+class TkPeripheryBase(PeripheryBase):
+    TITLE = "DragonPy - Base Tkinter Periphery"
+    GEOMETRY = "+500+300"
+    KEYCODE_MAP = {}
+    ESC_KEYCODE = "\x03"  # What keycode to send, if escape Key pressed?
+
+    def __init__(self, cfg):
+        super().__init__(cfg)
+        assert tkinter is not None, "ERROR: Tkinter is not available!"
+        self.root = tkinter.Tk()
+
+        self.root.title(self.TITLE)
+#         self.root.geometry() # '640x480+500+300') # X*Y + x/y-offset
+        self.root.geometry(self.GEOMETRY)  # Change initial position
+
+        # http://www.tutorialspoint.com/python/tk_text.htm
+        self.text = tkinter.Text(
+            self.root,
+            height=20, width=80,
+            state=tkinter.DISABLED  # FIXME: make textbox "read-only"
+        )
+        scollbar = tkinter.Scrollbar(self.root)
+        scollbar.config(command=self.text.yview)
+
+        self.text.config(
+            background="#08ff08",  # nearly green
+            foreground="#004100",  # nearly black
+            font=('courier', 11, 'bold'),
+            #            yscrollcommand=scollbar.set, # FIXME
+        )
+
+        scollbar.pack(side=tkinter.RIGHT, fill=tkinter.Y)
+        self.text.pack(side=tkinter.LEFT, fill=tkinter.Y)
+
+        self.root.bind("<Return>", self.event_return)
+        self.root.bind("<Escape>", self.from_console_break)
+        self.root.bind('<Control-c>', self.copy_to_clipboard)
+        self.root.bind("<Key>", self.event_key_pressed)
+        self.root.bind("<Destroy>", self.destroy)
+
+        self.root.update()
+        self.update_thread = None
+
+    def event_return(self, event):
+        #        log.critical("ENTER: add \\n")
+        self.user_input_queue.put("\n")
+
+    def from_console_break(self, event):
+        log.critical("from_console_break(): Add %r to input queue", self.ESC_KEYCODE)
+        self.user_input_queue.put(self.ESC_KEYCODE)
+
+    def copy_to_clipboard(self, event):
+        log.critical("Copy to clipboard")
+        text = self.text.get("1.0", tkinter.END)
+        print(text)
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+
+    def event_key_pressed(self, event):
+        keycode = event.keycode
+        char = event.char
+        log.critical("keycode %s - char %s", keycode, repr(char))
+        if char:
+            char = char.upper()
+        elif keycode in self.KEYCODE_MAP:
+            char = chr(self.KEYCODE_MAP[keycode])
+            log.critical("keycode %s translated to: %s", keycode, repr(char))
+        else:
+            log.critical("Ignore input, doesn't send to CPU.")
+            return
+
+        log.debug("Send %s", repr(char))
+        self.user_input_queue.put(char)
+
+    def exit(self, msg):
+        log.critical(msg)
+        self.root.quit()
+        super().exit()
+
+    def destroy(self, event=None):
+        self.exit("Tk window closed.")
+
+    STATE = 0
+    LAST_INPUT = ""
+
+    def write_acia_data(self, cpu_cycles, op_address, address, value):
+        log.debug("%04x| (%i) write to ACIA-data value: $%x (dez.: %i) ASCII: %r" % (
+            op_address, cpu_cycles, value, value, chr(value)
+        ))
+        if value == 0x8:  # Backspace
+            self.text.config(state=tkinter.NORMAL)
+            # delete last character
+            self.text.delete(f"{tkinter.INSERT} - 1 chars", tkinter.INSERT)
+            self.text.config(state=tkinter.DISABLED)  # FIXME: make textbox "read-only"
+            return
+
+        super().write_acia_data(cpu_cycles, op_address, address, value)
+
+    def _new_output_char(self, char):
+        """ insert in text field """
+        self.text.config(state=tkinter.NORMAL)
+        self.text.insert("end", char)
+        self.text.see("end")
+        self.text.config(state=tkinter.DISABLED)
+
+    def add_input_interval(self, cpu_process):
+        if not cpu_process.is_alive():
+            self.exit("CPU process is not alive.")
+
+        while True:
+            try:
+                char = self.display_queue.get(block=False)
+            except queue.Empty:
+                break
+            else:
+                self._new_output_char(char)
+
+        self.root.after(100, self.add_input_interval, cpu_process)
+
+    def mainloop(self, cpu_process):
+        log.critical("Tk mainloop started.")
+        self.add_input_interval(cpu_process)
+        self.root.mainloop()
+        log.critical("Tk mainloop stopped.")
@@ -0,0 +1,134 @@
+"""
+    DragonPy - batch runner
+    =======================
+
+    Run many BASIC programs in parallel: One headless emulator per process.
+
+    Every worker process boots the machine once. For every program the boot
+    state is restored, the listing is injected into the RAM and the machine
+    runs until the BASIC prompt appears again or the cycle limit is reached.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dragonpy.core.session import Session
+
+
+log = logging.getLogger(__name__)
+
+
+BASIC_EXT = ".bas"
+
+RUN_COMMAND = "RUN\r"
+DONE_PATTERN = r"(?m)^OK$"  # The BASIC prompt after the program has ended (or a error occurred)
+DEFAULT_MAX_CYCLES = 20000000  # ~22 sec. of a 0.89 MHz Dragon
+
+# The session of the current worker process, created by init_worker():
+_session = None
+_boot_state = None
+
+
+def iter_basic_files(paths):
+    """
+    Yield all given files and all *.bas files in the given directories (sorted)
+    """
+    for path in paths:
+        path = str(path)
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.lower().endswith(BASIC_EXT):
+                    yield os.path.join(root, filename)
+
+
+def init_worker(machine_name, cfg_dict, cache_path=None):
+    """
+    Called once in every worker process: boot the machine and remember the state.
+    cache_path: Directory of the boot state cache, see: Machine.boot()
+    """
+    global _session, _boot_state
+    _session = Session(machine_name, cfg_dict, cache_path=cache_path)
+    _boot_state = _session.snapshot()
+
+
+def run_program(
+    filepath, max_cycles=DEFAULT_MAX_CYCLES, run_command=RUN_COMMAND, done_pattern=DONE_PATTERN, screenshot_dir=None
+):
+    """
+    Run one BASIC program in the session of the current worker process.
+    Returns a dict with the results.
+    With screenshot_dir: Save the final screen as <program name>.png in this directory.
+    """
+    result = {
+        "filepath": filepath,
+        "completed": False,
+        "cycles": 0,
+        "duration": 0.0,
+        "screen": "",
+        "screen_hash": None,
+        "screenshot": None,
+        "error": None,
+    }
+    session = _session
+    start_time = time.perf_counter()
+    start_cycles = session.cycles
+    try:
+        with open(filepath) as f:
+            listing = f.read()
+
+        session.restore(_boot_state)
+        start_cycles = session.cycles
+        session.machine.inject_basic_program(listing)
+        session.clear_screen()
+        session.type(run_command)
+        match = session.run_until_text(done_pattern, max_cycles=max_cycles)
+    except (Exception, SystemExit) as err:  # The CPU calls sys.exit() on illegal ops
+        log.exception("Error running %r", filepath)
+        result["error"] = f"{err.__class__.__name__}: {err}"
+    else:
+        result["completed"] = match is not None
+
+    result["cycles"] = session.cycles - start_cycles
+    result["duration"] = time.perf_counter() - start_time
+    result["screen"] = session.get_screen_text()
+    result["screen_hash"] = session.screen_hash()
+    if screenshot_dir:
+        filename = os.path.splitext(os.path.basename(filepath))[0] + ".png"
+        screenshot_filepath = os.path.join(screenshot_dir, filename)
+        try:
+            session.save_screenshot(screenshot_filepath)
+        except (RuntimeError, OSError) as err:
+            log.error("Can't save screenshot of %r: %s", filepath, err)
+        else:
+            result["screenshot"] = screenshot_filepath
+    return result
+
+
+def run_batch(
+    machine_name, filepaths, cfg_dict=None, max_cycles=DEFAULT_MAX_CYCLES, workers=None, cache_path=None, **kwargs
+):
+    """
+    Run all programs in a process pool (default: one process per CPU core)
+    Yields the result dicts from run_program() in the order of filepaths.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(machine_name, cfg_dict, cache_path),
+    ) as executor:
+        futures = [
+            executor.submit(run_program, filepath, max_cycles, **kwargs)
+            for filepath in filepaths
+        ]
+        for future in futures:
+            yield future.result()
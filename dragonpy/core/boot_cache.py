@@ -0,0 +1,141 @@
+"""
+    DragonPy - boot state cache
+    ===========================
+
+    A machine cold boot (RAM test, BASIC init etc.) takes some seconds.
+    The save state of a machine that has reached its cfg.STARTUP_END_ADDR
+    is stored in a cache file, so that later starts can restore it instantly.
+
+    The cache key contains everything that affects the boot:
+        * the config class
+        * the RAM size
+        * the SHA1 of all ROM files
+        * the save state format version
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+import logging
+import os
+import time
+
+from dragonpy.core.save_state import STATE_VERSION
+
+
+log = logging.getLogger(__name__)
+
+
+BOOT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "DragonPy", "boot_states")
+BOOT_STATE_EXT = ".dps"
+
+BOOT_MAX_OPS = 10000000  # Stop a boot that never reaches cfg.STARTUP_END_ADDR
+
+
+def get_cache_key(cfg):
+    """
+    >>> from dragonpy.sbc09.config import SBC09Cfg
+    >>> cfg = SBC09Cfg({"verbosity": None, "trace": None})
+    >>> key = get_cache_key(cfg)
+    >>> key.startswith("sbc09_"), len(key)
+    (True, 46)
+    """
+    key_parts = [
+        f"{cfg.__class__.__module__}.{cfg.__class__.__qualname__}",
+        f"RAM ${cfg.RAM_START:04x}-${cfg.RAM_END:04x}",
+        f"upper RAM ${getattr(cfg, 'UPPER_RAM_SIZE', 0):04x}",
+        f"state version {STATE_VERSION:d}",
+    ]
+    for romfile in cfg.rom_cfg or ():
+        key_parts.append(f"ROM ${romfile.address:04x} {romfile.SHA1}")
+
+    key_hash = hashlib.sha1("\n".join(key_parts).encode("utf-8")).hexdigest()
+    return f"{cfg.CONFIG_NAME}_{key_hash}"
+
+
+def get_cache_filepath(cfg, cache_path=None):
+    if cache_path is None:
+        cache_path = BOOT_CACHE_PATH
+    return os.path.join(cache_path, get_cache_key(cfg) + BOOT_STATE_EXT)
+
+
+def cold_boot(machine, max_ops=BOOT_MAX_OPS):
+    """
+    Run the machine from the current program counter to cfg.STARTUP_END_ADDR
+    """
+    cpu = machine.cpu
+    start_time = time.perf_counter()
+    cpu.test_run(
+        start=cpu.program_counter.value,
+        end=machine.cfg.STARTUP_END_ADDR,
+        max_ops=max_ops,
+    )
+    machine.scheduler.resync(cpu.cycles)  # test_run() doesn't dispatch device events
+    duration = time.perf_counter() - start_time
+    log.info("Cold boot done in %.2f sec. (current cycle: %i)", duration, cpu.cycles)
+
+
+def boot(machine, cache_path=None):
+    """
+    Bring the machine into the "ready for user input" state:
+    Restore the cached boot state, or cold boot and store the state.
+
+    Returns True if the boot state was restored from the cache.
+    Configs without STARTUP_END_ADDR (e.g.: Vectrex) are not touched.
+    A broken cache file is deleted and the machine is reset to the start
+    state before the cold boot.
+    If the cold boot doesn't reach STARTUP_END_ADDR, the machine is reset
+    to the start state, so it starts normally without the cache.
+    """
+    cfg = machine.cfg
+    if getattr(cfg, "STARTUP_END_ADDR", None) is None:
+        log.info("%s has no STARTUP_END_ADDR: Skip boot cache.", cfg.CONFIG_NAME)
+        return False
+
+    if cache_path is None:
+        cache_path = BOOT_CACHE_PATH
+    filepath = get_cache_filepath(cfg, cache_path)
+    start_state = machine.save_state()
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except OSError:
+        log.info("No boot state cache file %r", filepath)
+    else:
+        try:
+            machine.load_state(data)
+        except ValueError as err:
+            # The device state may be restored only partly: Reset the complete machine
+            log.error("Delete broken boot state cache file %r: %s", filepath, err)
+            try:
+                os.remove(filepath)
+            except OSError as err:
+                log.error("Can't delete boot state cache file %r: %s", filepath, err)
+            machine.load_state(start_state)
+        else:
+            log.info("Boot state restored from %r", filepath)
+            return True
+
+    try:
+        cold_boot(machine, max_ops=BOOT_MAX_OPS)
+    except RuntimeError as err:
+        log.error(
+            "Cold boot doesn't reach STARTUP_END_ADDR $%04x (%s): Start without boot state cache.",
+            cfg.STARTUP_END_ADDR, err
+        )
+        machine.load_state(start_state)
+        return False
+
+    data = machine.save_state()
+    temp_filepath = f"{filepath}.{os.getpid():d}.tmp"
+    try:
+        os.makedirs(cache_path, exist_ok=True)
+        with open(temp_filepath, "wb") as f:
+            f.write(data)
+        os.replace(temp_filepath, filepath)  # other processes never see an incomplete file
+    except OSError as err:
+        log.error("Can't save boot state cache file %r: %s", filepath, err)
+    else:
+        log.info("Boot state saved to %r", filepath)
+    return False
@@ -0,0 +1,71 @@
+"""
+    DragonPy - adaptive burst size
+    ==============================
+
+    Without speed limit, the GUI runs the CPU in bursts between two Tk
+    event loop calls. Too small bursts waste time in Tk, too big bursts
+    make the GUI sluggish. The right size depends on the host speed and
+    the machine. The controller measures the real cycles/sec and adjusts
+    the cycles per burst to the target GUI latency.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+
+from dragonpy.core.frame_clock import FRAME_CYCLES
+
+
+log = logging.getLogger(__name__)
+
+
+class BurstController:
+    """
+    >>> controller = BurstController(target_latency=0.016, cycles_per_tick=10000)
+    >>> controller.add_tick(cycles=10000, duration=0.004)  # Fast host: 2.5 MHz
+    >>> controller.update()
+    2500000.0
+    >>> controller.cycles_per_tick  # Adjusted half way to 2.5 MHz * 16ms = 40000
+    25000
+    >>> controller.update() is None  # No new ticks
+    True
+    >>> for __ in range(10):
+    ...     controller.add_tick(cycles=controller.cycles_per_tick, duration=controller.cycles_per_tick / 2500000)
+    ...     __ = controller.update()
+    >>> 39900 < controller.cycles_per_tick <= 40000
+    True
+    """
+    MIN_CYCLES = 1000  # Even on slow hosts the Tk overhead must be small
+    MAX_CYCLES = 10 * FRAME_CYCLES
+    SMOOTHING = 0.5  # Move this ratio to the new target value per update: avoid oscillation
+
+    def __init__(self, target_latency=0.016, cycles_per_tick=FRAME_CYCLES):
+        self.target_latency = target_latency
+        self.cycles_per_tick = cycles_per_tick
+        self.reset()
+
+    def reset(self):
+        self.total_cycles = 0
+        self.total_duration = 0.0
+
+    def add_tick(self, cycles, duration):
+        self.total_cycles += cycles
+        self.total_duration += duration
+
+    def update(self):
+        """
+        Calculate the new burst size from all ticks since the last update.
+        Returns the measured cycles/sec or None if there is no new data.
+        """
+        if self.total_cycles <= 0 or self.total_duration <= 0:
+            return None
+
+        cycles_per_sec = self.total_cycles / self.total_duration
+        self.reset()
+
+        target_cycles = cycles_per_sec * self.target_latency
+        cycles_per_tick = self.cycles_per_tick + (target_cycles - self.cycles_per_tick) * self.SMOOTHING
+        self.cycles_per_tick = int(min(max(cycles_per_tick, self.MIN_CYCLES), self.MAX_CYCLES))
+        log.debug("%.0f cycles/sec -> %i cycles per tick", cycles_per_sec, self.cycles_per_tick)
+        return cycles_per_sec
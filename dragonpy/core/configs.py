@@ -7,6 +7,8 @@
     :license: GNU GPL v3 or above, see LICENSE for more details.
 """
 
+import array
+import importlib
 import inspect
 import logging
 
@@ -14,7 +16,31 @@ import logging
 log = logging.getLogger(__name__)
 
 
+def import_object(path):
+    """
+    >>> import_object("dragonpy.core.configs:import_object") is import_object
+    True
+    """
+    module_name, __, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
 class MachineDict(dict):
+    """
+    machine name -> (run function, config class)
+
+    Can be registered as lazy entry point "module:attribute" strings:
+    The machine modules (with tkinter, mem info and fonts) are imported
+    only on first access of the machine.
+
+    >>> machines = MachineDict()
+    >>> machines.register("Test", ("dragonpy.core.configs:import_object", "dragonpy.core.configs:BaseConfig"))
+    >>> sorted(machines)
+    ['Test']
+    >>> run_func, ConfigClass = machines["Test"]
+    >>> run_func is import_object, ConfigClass
+    (True, <class 'dragonpy.core.configs.BaseConfig'>)
+    """
     DEFAULT = None
 
     def register(self, name, cls, default=False):
@@ -22,6 +48,13 @@ class MachineDict(dict):
         if default:
             self.DEFAULT = name
 
+    def __getitem__(self, name):
+        entry = dict.__getitem__(self, name)
+        if any(isinstance(item, str) for item in entry):
+            entry = tuple(import_object(item) if isinstance(item, str) else item for item in entry)
+            dict.__setitem__(self, name, entry)
+        return entry
+
 
 machine_dict = MachineDict()
 
@@ -34,23 +67,49 @@ class DummyMemInfo:
         return ">>mem info not active<<"
 
 
-class AddressAreas(dict):
+class AddressAreas:
     """
     Hold information about memory address areas which accessed via bus.
     e.g.:
         Interrupt vectors
         Text screen
         Serial/parallel devices
+
+    Stored as a 64K array of area ids, not one dict entry per address.
+    A later added area overwrites the earlier ones.
+
+    >>> areas = AddressAreas(((0x0400, 0x05ff, "Text screen"), (0xfff0, 0xffff, "Interrupt vectors")))
+    >>> areas[0x0400], areas.get(0xfff2), areas.get(0x0600)
+    ('Text screen', 'Interrupt vectors', None)
+    >>> 0x0600 in areas
+    False
     """
 
     def __init__(self, areas):
-        super().__init__()
+        self.texts = [None]  # area id -> text, id 0: no area
+        self.area_ids = array.array("H", bytes(0x10000 * 2))
         for start_addr, end_addr, txt in areas:
             self.add_area(start_addr, end_addr, txt)
 
     def add_area(self, start_addr, end_addr, txt):
-        for addr in range(start_addr, end_addr + 1):
-            dict.__setitem__(self, addr, txt)
+        area_id = len(self.texts)
+        self.texts.append(txt)
+        self.area_ids[start_addr:end_addr + 1] = array.array("H", [area_id]) * (end_addr + 1 - start_addr)
+
+    def get(self, addr, default=None):
+        area_id = self.area_ids[addr]
+        if area_id:
+            return self.texts[area_id]
+        return default
+
+    def __getitem__(self, addr):
+        area_id = self.area_ids[addr]
+        if not area_id:
+            raise KeyError(addr)
+        return self.texts[area_id]
+
+    def __contains__(self, addr):
+        return 0 <= addr < len(self.area_ids) and self.area_ids[addr] != 0
 
 
 class BaseConfig:
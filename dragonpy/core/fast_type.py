@@ -0,0 +1,169 @@
+r"""
+    DragonPy - fast type
+    ====================
+
+    Type a text, e.g.: a pasted BASIC listing, as fast as the machine
+    accepts it.
+
+    The text is put line by line into the user input queue. The keyboard
+    device passes the keys with the maximum rate of the ROM keyboard scan
+    (see: MC6821_PIA.type_next_key()). The next line is only typed if the
+    machine waits for input again: All keys are consumed and the idle
+    detector (see: dragonpy.core.idle) reports the input polling loop of
+    the ROM. So no key gets lost while the ROM stores a program line or
+    executes a command, without any fixed delay.
+
+    The caller runs the machine via run() in chunks without speed limit,
+    like the warp mode. After the last line is accepted, the on_done
+    callback of the text is called.
+
+    Gives up if the machine doesn't accept a line within max_wait_cycles,
+    e.g.: a started BASIC program doesn't wait for input.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import logging
+import re
+import time
+
+
+log = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_WAIT_CYCLES = 10000000  # ~11 sec. of a 0.89 MHz Dragon
+
+
+def split_lines(txt):
+    r"""
+    Split the text into lines, every complete line ends with "\r" (ENTER)
+
+    >>> split_lines("10 CLS\n20 GOTO 10\r\nRUN")
+    ['10 CLS\r', '20 GOTO 10\r', 'RUN']
+    >>> split_lines("\n\n")
+    ['\r', '\r']
+    >>> split_lines("")
+    []
+    """
+    txt = txt.replace("\r\n", "\r").replace("\n", "\r")
+    return [line for line in re.split(r"(?<=\r)", txt) if line]
+
+
+class FastType:
+    CHUNK_CYCLES = 20000  # CPU cycles between two steps, if the machine doesn't accept the line before
+
+    def __init__(self, machine, add_input, max_wait_cycles=DEFAULT_MAX_WAIT_CYCLES):
+        """
+        add_input: callable that puts the text into the user input queue,
+            e.g.: BaseTkinterGUI.add_user_input()
+        max_wait_cycles: Give up, if the machine doesn't accept a line within this CPU cycles
+        """
+        self.machine = machine
+        self.add_input = add_input
+        self.max_wait_cycles = max_wait_cycles
+
+        # Lines to type: (line, on_done, wait_idle), on_done is only set in the last line of a text
+        self.lines = collections.deque()
+        self.typed = None  # The last typed line, until the machine accepted it
+        self.wait_start_cycles = None
+
+    @property
+    def active(self):
+        return self.typed is not None or bool(self.lines)
+
+    @property
+    def line_count(self):
+        """ Number of lines that are not accepted yet """
+        return len(self.lines) + (self.typed is not None)
+
+    def type(self, txt, on_done=None, wait_idle=True):
+        """
+        Add the text to type.
+        on_done(completed): Called after the last line was accepted (completed=True)
+            or if the machine stopped accepting input (completed=False)
+        wait_idle: The last line is accepted, if the machine waits for input again.
+            If not set: If the machine consumed all keys, e.g.: for "RUN"
+        """
+        lines = split_lines(txt)
+        if not lines:
+            if on_done is not None:
+                on_done(True)
+            return
+        if not self.active:
+            self.wait_start_cycles = self.machine.cpu.cycles
+        for line in lines[:-1]:
+            self.lines.append((line, None, True))
+        self.lines.append((lines[-1], on_done, wait_idle))
+
+    def machine_waits(self):
+        """ The machine consumed all keys and polls for input """
+        machine = self.machine
+        return machine.user_input_queue.empty() and machine.idle_detector.idle
+
+    def keys_consumed(self):
+        """ All keys are passed to the machine and are released """
+        machine = self.machine
+        return machine.user_input_queue.empty() and machine.idle_detector.empty_polls > 0
+
+    def accepted(self, machine=None):
+        """ True if the next step() makes progress. Used as Machine.run() `until` callable. """
+        if self.typed is None:
+            return bool(self.lines) and self.machine_waits()
+        line, on_done, wait_idle = self.typed
+        if wait_idle:
+            return self.machine_waits()
+        return self.keys_consumed()
+
+    def step(self):
+        """
+        Finish the typed line and type the next one, if the machine accepted it.
+        """
+        if self.accepted():
+            if self.typed is not None:
+                line, on_done, wait_idle = self.typed
+                self.typed = None
+                if on_done is not None:
+                    on_done(True)
+            if self.lines and self.machine_waits():
+                self.typed = self.lines.popleft()
+                self.add_input(self.typed[0])
+            self.wait_start_cycles = self.machine.cpu.cycles
+        elif self.machine.cpu.cycles - self.wait_start_cycles > self.max_wait_cycles:
+            self.cancel(f"no input accepted for {self.max_wait_cycles:d} cycles")
+
+    def cancel(self, reason):
+        """ Drop all lines that are not typed yet """
+        if not self.active:
+            return
+        log.error("Fast type canceled (%s): %i lines not typed", reason, len(self.lines))
+        entries = list(self.lines)
+        if self.typed is not None:
+            entries.insert(0, self.typed)
+        self.lines.clear()
+        self.typed = None
+        for line, on_done, wait_idle in entries:
+            if on_done is not None:
+                on_done(False)
+
+    def run(self, max_duration=0.1):
+        """
+        Type and run the machine until all text is typed or max_duration seconds are elapsed.
+        Returns True if there is more to type.
+        """
+        machine = self.machine
+        end_time = time.perf_counter() + max_duration
+        while machine.cpu.running:
+            self.step()
+            if not self.active:
+                break
+            machine.run(max_cycles=self.CHUNK_CYCLES, until=self.accepted)
+            if time.perf_counter() >= end_time:
+                break
+        return self.active
+
+    def run_until_done(self):
+        """ Type all text, e.g.: in a headless session """
+        while self.active and self.machine.cpu.running:
+            self.run(max_duration=1)
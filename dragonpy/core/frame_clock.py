@@ -0,0 +1,71 @@
+"""
+    DragonPy - frame clock
+    ======================
+
+    Pace the emulation in video frames: The CPU runs one frame of cycles
+    as fast as possible and waits for the start of the next frame.
+    The frame deadlines are absolute, so rounding errors of single
+    sleeps don't add up.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import time
+
+from dragonpy.Dragon32.MC6883_SAM import SAM
+
+
+log = logging.getLogger(__name__)
+
+
+# CPU cycles of one video field: The SAM triggers the field sync IRQ with this rate (50Hz)
+FRAME_CYCLES = SAM.IRQ_CYCLES
+
+
+class FrameClock:
+    """
+    >>> now = 0.0
+    >>> frame_clock = FrameClock(cycles_per_sec=100, frame_cycles=2, clock=lambda: now)
+    >>> frame_clock.frame_duration
+    0.02
+    >>> frame_clock.reset()
+    >>> round(frame_clock.next_delay(), 3)  # Frame took no time
+    0.02
+    >>> now = 0.025
+    >>> round(frame_clock.next_delay(), 3)  # Frame took longer: catch up
+    0.015
+    >>> now = 1.0  # Too far behind: Don't run the lost frames with full speed
+    >>> frame_clock.next_delay(), frame_clock.dropped_frames
+    (0, 1)
+    """
+    MAX_LAG_FRAMES = 5  # Resync, if the emulation is this many frames behind
+
+    def __init__(self, cycles_per_sec, frame_cycles=FRAME_CYCLES, clock=time.perf_counter):
+        self.cycles_per_sec = cycles_per_sec
+        self.frame_cycles = frame_cycles
+        self.clock = clock
+        self.dropped_frames = 0
+        self.reset()
+
+    @property
+    def frame_duration(self):
+        return self.frame_cycles / self.cycles_per_sec
+
+    def reset(self):
+        self.next_frame_time = self.clock()
+
+    def next_delay(self):
+        """
+        Advance to the next frame and return the seconds until it starts.
+        """
+        frame_duration = self.frame_duration
+        self.next_frame_time += frame_duration
+        delay = self.next_frame_time - self.clock()
+        if delay < -self.MAX_LAG_FRAMES * frame_duration:
+            log.info("Emulation is %.1f frames behind: resync", -delay / frame_duration)
+            self.dropped_frames += 1
+            self.reset()
+            return 0
+        return max(delay, 0)
@@ -15,18 +15,25 @@ import string
 import sys
 import time
 import tkinter as tk
+from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import font as TkFont
-from tkinter import messagebox, scrolledtext
 
 from dragonlib.utils.auto_shift import invert_shift
 from MC6809.utils.humanize import get_python_info, locale_format_number
 
 import dragonpy
 from basic_editor.editor import EditorWindow
+from dragonpy.core.burst_controller import BurstController
+from dragonpy.core.fast_type import FastType
+from dragonpy.core.frame_clock import FrameClock
 from dragonpy.core.gui_starter import MultiStatusBar
+from dragonpy.core.input_record import RecordingInputQueue
+from dragonpy.core.rewind import RewindBuffer
+from dragonpy.core.warp import STOP_KEY_PRESS, Warp
+from dragonpy.Dragon32.cassette import open_tape
 from dragonpy.Dragon32.gui_config import BaseTkinterGUIConfig, RuntimeCfg
 from dragonpy.Dragon32.keyboard_map import add_to_input_queue, inkey_from_tk_event
-from dragonpy.Dragon32.MC6847 import MC6847_TextModeCanvas
+from dragonpy.Dragon32.MC6847 import MC6847_FramebufferCanvas
 
 
 log = logging.getLogger(__name__)
@@ -37,6 +44,11 @@ class BaseTkinterGUI:
     The complete Tkinter GUI window
     """
 
+    STATE_FILETYPES = [  # For filedialog
+        ("DragonPy save states", "*.dps"),
+        ("All files", "*"),
+    ]
+
     def __init__(self, cfg, user_input_queue):
         self.cfg = cfg
         self.runtime_cfg = RuntimeCfg()
@@ -44,12 +56,25 @@ class BaseTkinterGUI:
         # Queue to send keyboard inputs to CPU Thread:
         self.user_input_queue = user_input_queue
 
+        # A replay needs reproducible CPU cycles: No idle skipping and no rewind while recording
+        self.recording = isinstance(user_input_queue, RecordingInputQueue)
+
         self.max_ops = self.cfg.cfg_dict["max_ops"]
         self.op_delay = 0
         self.burst_op_count = 100
         self.cpu_after_id = None  # Used to call CPU OP burst loop
         self.target_burst_duration = 0.1  # Duration how long should a CPU Op burst loop take
 
+        # Real time pacing of the video frames, if speed limit is activated:
+        self.frame_clock = FrameClock(cycles_per_sec=self.runtime_cfg.cycles_per_sec)
+
+        # Burst size without speed limit, if runtime_cfg.auto_burst is on:
+        self.burst_controller = BurstController(target_latency=self.runtime_cfg.target_latency)
+
+        self.warp = None  # dragonpy.core.warp.Warp instance, if warp mode is active
+        self.fast_type = None  # dragonpy.core.fast_type.FastType instance, created in mainloop()
+        self.rewind_buffer = None  # Created in mainloop(), if runtime_cfg.rewind is on
+
         self.init_statistics()  # Called also after reset
 
         self.root = tk.Tk(className="DragonPy")
@@ -94,6 +119,14 @@ class BaseTkinterGUI:
         self.cpu_menu.add_separator()
         self.cpu_menu.add_command(label="soft reset", command=self.command_cpu_soft_reset)
         self.cpu_menu.add_command(label="hard reset", command=self.command_cpu_hard_reset)
+        self.cpu_menu.add_separator()
+        self.cpu_menu.add_command(label="save state...", command=self.command_save_state)
+        self.cpu_menu.add_command(label="load state...", command=self.command_load_state)
+        self.cpu_menu.add_command(label="rewind 1 sec.", command=lambda: self.command_rewind(seconds=1))
+        self.cpu_menu.add_command(label="rewind 10 sec.", command=lambda: self.command_rewind(seconds=10))
+        self.cpu_menu.add_separator()
+        self.warp_var = tk.BooleanVar(value=False)
+        self.cpu_menu.add_checkbutton(label="warp", variable=self.warp_var, command=self.command_warp)
         self.menubar.add_cascade(label="6809", menu=self.cpu_menu)
 
         self.config_window = None
@@ -177,26 +210,103 @@ class BaseTkinterGUI:
         self.machine.hard_reset()
         self.init_statistics()  # Reset statistics
 
+    def command_save_state(self):
+        outfile = filedialog.asksaveasfile(
+            parent=self.root,
+            mode="wb",
+            title="Save machine state",
+            filetypes=self.STATE_FILETYPES,
+            defaultextension=".dps",
+        )
+        if outfile is not None:
+            with outfile:
+                outfile.write(self.machine.save_state())
+            log.critical("Machine state saved to: %r", outfile.name)
+
+    def command_load_state(self):
+        infile = filedialog.askopenfile(
+            parent=self.root,
+            mode="rb",
+            title="Select a machine state to load",
+            filetypes=self.STATE_FILETYPES,
+        )
+        if infile is not None:
+            with infile:
+                data = infile.read()
+            try:
+                self.machine.load_state(data)
+            except ValueError as err:
+                messagebox.showerror("Load state", f"Error loading {infile.name!r}:\n{err}")
+            else:
+                if self.rewind_buffer is not None:
+                    self.rewind_buffer.clear()  # The history of the old machine state
+                self.init_statistics()  # Reset statistics
+
+    def command_rewind(self, seconds):
+        if self.rewind_buffer is None:
+            messagebox.showinfo("Rewind", "Rewind is deactivated.")
+            return
+        steps = max(round(seconds * self.runtime_cfg.cycles_per_sec / self.rewind_buffer.interval_cycles), 1)
+        self.stop_warp("rewind")
+        self.rewind_buffer.rewind(steps)
+        self.flush_display()
+        self.frame_clock.reset()
+        self.init_statistics()  # Reset statistics
+
+    # -----------------------------------------------------------------------------------------
+
+    warp_run_time = 0.1  # Seconds between two Tk event loop calls in warp mode
+
+    def has_display_changes(self):
+        """
+        Returns True if display_callback() was called since the last flush_display()
+        """
+        return False
+
+    def command_warp(self):
+        if self.warp_var.get():
+            self.start_warp()
+        elif self.warp is not None:
+            self.warp.stop("menu")
+
+    def start_warp(self):
+        self.flush_display()
+        if self.runtime_cfg.warp_stop_on_screen_change:
+            screen_changed = self.has_display_changes
+        else:
+            screen_changed = None
+        self.warp = Warp(
+            self.machine,
+            stop_address=getattr(self.cfg, "STARTUP_END_ADDR", None),
+            screen_changed=screen_changed,
+            max_cycles=self.runtime_cfg.warp_max_cycles,
+        )
+        self.warp_var.set(True)
+        self.status.set(f"{self.cfg.MACHINE_NAME} in warp mode...\n")
+
+    def stop_warp(self, reason):
+        if self.warp is not None:
+            self.warp.stop(reason)
+
+    def end_warp(self):
+        log.critical("Warp mode stopped by %s after %i cycles", self.warp.stop_reason, self.warp.cycles)
+        self.warp = None
+        self.warp_var.set(False)
+        self.frame_clock.reset()
+        self.burst_controller.reset()
+        self.init_statistics()
+
     # -----------------------------------------------------------------------------------------
 
     def add_user_input(self, txt):
         add_to_input_queue(self.user_input_queue, txt)
 
-    def wait_until_input_queue_empty(self):
-        for count in range(1, 10):
-            self.cpu_interval()
-            if self.user_input_queue.empty():
-                log.critical("user_input_queue is empty, after %i burst runs, ok.", count)
-                if self.cpu_after_id is None:
-                    self.status_paused()
-                return
-        if self.cpu_after_id is None:
-            self.status_paused()
-        log.critical("user_input_queue not empty, after %i burst runs!", count)
-
-    def add_user_input_and_wait(self, txt):
-        self.add_user_input(txt)
-        self.wait_until_input_queue_empty()
+    def type_text(self, txt, on_done=None, wait_idle=True):
+        """
+        Type the text line by line, as fast as the machine accepts it.
+        on_done(completed) is called after the last line, see: dragonpy.core.fast_type
+        """
+        self.fast_type.type(txt, on_done=on_done, wait_idle=wait_idle)
 
     def paste_clipboard(self, event):
         """
@@ -204,9 +314,7 @@ class BaseTkinterGUI:
         """
         log.critical("paste clipboard")
         clipboard = self.root.clipboard_get()
-        for line in clipboard.splitlines():
-            log.critical("paste line: %s", repr(line))
-            self.add_user_input(line + "\r")
+        self.type_text("".join(f"{line}\r" for line in clipboard.splitlines()))
 
     def event_key_pressed(self, event):
         log.critical("event.char: %-6r event.keycode: %-3r event.keysym: %-11r event.keysym_num: %5r",
@@ -215,72 +323,153 @@ class BaseTkinterGUI:
         inkey = inkey_from_tk_event(event, auto_shift=self.auto_shift)
         log.critical("inkey: %r", inkey)
         self.user_input_queue.put(inkey)
+        self.stop_warp(STOP_KEY_PRESS)
 
     total_burst_duration = 0
     cpu_interval_calls = 0
     last_display_queue_qsize = 0
 
+    def flush_display(self):
+        """
+        Called once after every cpu_interval(): Display all changes from display_callback()
+        """
+
     def cpu_interval(self, interval=None):
+        """
+        Run the emulation without any Tk calls:
+            speed limit: One video frame and wait for the start of the next frame.
+            auto burst: The cycles from the BurstController
+            else: As many video frames as fit into runtime_cfg.max_run_time
+        If the machine is idle (see: dragonpy.core.idle) and runtime_cfg.idle_sleep
+        is on: Pace the emulation like with speed limit and skip the idle loops.
+        The display is updated once after the burst.
+        In warp mode: Run until a stop condition is met, without display updates.
+        While text is fast typed: Run without speed limit, until all lines are typed.
+        """
         self.cpu_interval_calls += 1
 
-        if self.runtime_cfg.speedlimit:
-            # Run CPU not faster than speedlimit
-            target_cycles_per_sec = self.runtime_cfg.cycles_per_sec
-        else:
-            # Run CPU as fast as Python can...
-            target_cycles_per_sec = None
+        if self.warp is not None:
+            active = self.warp.run(max_duration=self.warp_run_time)
+            if self.rewind_buffer is not None:
+                self.rewind_buffer.update()
+            if not active:
+                self.end_warp()
+                self.flush_display()
+            if interval is not None and self.machine.cpu.running:
+                self.cpu_after_id = self.root.after(interval, self.cpu_interval, interval)
+            return
 
-        start_time = time.time()
-        self.machine.cpu.run(
-            max_run_time=self.runtime_cfg.max_run_time,
-            target_cycles_per_sec=target_cycles_per_sec,
-        )
-        now = time.time()
-        self.total_burst_duration += (now - start_time)
+        if self.fast_type.active:
+            if not self.fast_type.run(max_duration=self.warp_run_time):
+                self.frame_clock.reset()
+                self.burst_controller.reset()
+            self.flush_display()
+            if self.rewind_buffer is not None:
+                self.rewind_buffer.update()
+            if interval is not None and self.machine.cpu.running:
+                self.cpu_after_id = self.root.after(interval, self.cpu_interval, interval)
+            return
+
+        skip_idle = self.runtime_cfg.idle_sleep and not self.recording
+        speedlimit = self.runtime_cfg.speedlimit or (skip_idle and self.machine.idle_detector.idle)
+
+        if speedlimit:
+            self.frame_clock.cycles_per_sec = self.runtime_cfg.cycles_per_sec
+
+        start_time = time.perf_counter()
+        start_cycles = self.machine.cpu.cycles
+        auto_burst = not speedlimit and self.runtime_cfg.auto_burst
+        if speedlimit:
+            self.machine.run_frame(skip_idle=skip_idle)
+        elif auto_burst:
+            self.machine.run(max_cycles=self.burst_controller.cycles_per_tick)
+        else:
+            end_time = start_time + self.runtime_cfg.max_run_time
+            while True:
+                self.machine.run_frame()
+                if time.perf_counter() >= end_time:
+                    break
+        self.flush_display()
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.update()
+        duration = time.perf_counter() - start_time
+        self.total_burst_duration += duration
+        if auto_burst:
+            self.burst_controller.add_tick(self.machine.cpu.cycles - start_cycles, duration)
 
         if interval is not None:
             if self.machine.cpu.running:
-                self.cpu_after_id = self.root.after(interval, self.cpu_interval, interval)
+                if speedlimit:
+                    # Never block the Tk main loop: A few ms jitter of after() is fine,
+                    # because the frame deadlines are absolute and don't add up.
+                    delay = round(self.frame_clock.next_delay() * 1000)
+                else:
+                    delay = interval
+                    self.frame_clock.reset()
+                self.cpu_after_id = self.root.after(delay, self.cpu_interval, interval)
             else:
                 log.critical("CPU stopped.")
 
     last_update = 0
+    last_idle_cycles = 0
 
     def update_status_interval(self, interval=500):
+        if self.warp is not None:
+            self.status.set(
+                f"{self.cfg.MACHINE_NAME} in warp mode:"
+                f" {locale_format_number(self.warp.cycles)} cycles\n"
+            )
+            self.root.after(interval, self.update_status_interval, interval)
+            return
+
+        if self.fast_type.active:
+            self.status.set(f"{self.cfg.MACHINE_NAME} types {self.fast_type.line_count:d} lines...\n")
+            self.root.after(interval, self.update_status_interval, interval)
+            return
+
         # Update CPU settings:
         self.machine.cpu.max_burst_count = self.runtime_cfg.max_burst_count
 
         new_cycles = self.machine.cpu.cycles - self.last_cpu_cycles
         duration = time.time() - self.last_update
+        idle_cycles = self.machine.idle_cycles - self.last_idle_cycles
 
         cycles_per_sec = new_cycles / duration
 
-        msg = ("%s cycles/sec (burst op count: outer: %s - inner: %s)\n" "%i CPU interval calls") % (
+        msg = ("%s cycles/sec (inner burst op count: %s)\n" "%i CPU interval calls") % (
             locale_format_number(cycles_per_sec),
 
-            locale_format_number(self.machine.cpu.outer_burst_op_count),
             locale_format_number(self.machine.cpu.inner_burst_op_count),
 
             self.cpu_interval_calls,
         )
 
+        if self.runtime_cfg.auto_burst and not self.runtime_cfg.speedlimit:
+            self.burst_controller.target_latency = self.runtime_cfg.target_latency
+            self.burst_controller.update()
+            msg += " (auto burst: %s cycles)" % locale_format_number(self.burst_controller.cycles_per_tick)
+
         if self.runtime_cfg.speedlimit:
             msg += (
-                " (Burst delay: %f)\nSpeed target: %s cylces/sec - diff: %s cylces/sec"
+                " (%i frame resyncs)\nSpeed target: %s cylces/sec - diff: %s cylces/sec"
             ) % (
-                self.machine.cpu.delay,
+                self.frame_clock.dropped_frames,
                 locale_format_number(self.runtime_cfg.cycles_per_sec),
                 locale_format_number(
                     cycles_per_sec - self.runtime_cfg.cycles_per_sec
                 ),
             )
 
+        if idle_cycles:
+            msg += " (idle: %i%%)" % (idle_cycles * 100 / max(new_cycles, 1))
+
         if self.max_ops and self.machine.cpu.cycles >= self.max_ops:
             self.exit()
 
         self.status.set(msg)
 
         self.last_cpu_cycles = self.machine.cpu.cycles
+        self.last_idle_cycles = self.machine.idle_cycles
         self.cpu_interval_calls = 0
         self.burst_loops = 0
         self.last_update = time.time()
@@ -289,9 +478,20 @@ class BaseTkinterGUI:
 
     def mainloop(self, machine):
         self.machine = machine
+        self.fast_type = FastType(machine, self.add_user_input)
+
+        if self.runtime_cfg.rewind and not self.recording:
+            self.rewind_buffer = RewindBuffer(
+                machine,
+                interval_frames=self.runtime_cfg.rewind_interval_frames,
+                max_bytes=self.runtime_cfg.rewind_max_mb * 1024 * 1024,
+            )
 
         self.update_status_interval(interval=500)
 
+        if self.cfg.cfg_dict.get("warp"):
+            self.start_warp()
+
         self.cpu_interval(interval=1)
 
         log.critical("Start root.mainloop()")
@@ -311,24 +511,72 @@ class DragonTkinterGUI(BaseTkinterGUI):
         super().__init__(*args, **kwargs)
 
         machine_name = self.cfg.MACHINE_NAME
-        self.root.title(
-            f"{machine_name} - Text Display 32 columns x 16 rows")
+        self.root.title(f"{machine_name} - MC6847 Display 256 x 192 pixels")
 
-        self.display = MC6847_TextModeCanvas(self.root)
+        self.display = MC6847_FramebufferCanvas(self.root)
         self.display.canvas.grid(row=0, column=0)
 
         self._editor_window = None
 
         self.menubar.insert_command(index=3, label="BASIC editor", command=self.open_basic_editor)
 
+        cassette_menu = tk.Menu(self.menubar, tearoff=0)
+        cassette_menu.add_command(label="insert tape...", command=self.command_insert_tape)
+        cassette_menu.add_command(label="rewind", command=self.command_rewind_tape)
+        cassette_menu.add_command(label="eject", command=self.command_eject_tape)
+        self.menubar.insert_cascade(index=4, label="cassette", menu=cassette_menu)
+
         # display the menu
         self.root.config(menu=self.menubar)
         self.root.update()
 
-    def display_callback(self, cpu_cycles, op_address, address, value):
-        """ called via memory write_byte_middleware """
-        self.display.write_byte(cpu_cycles, op_address, address, value)
-        return value
+    def mainloop(self, machine):
+        periphery = machine.periphery
+        self.display.attach(machine.cpu.memory, periphery.sam, periphery.pia)
+        super().mainloop(machine)
+
+    TAPE_FILETYPES = [  # For filedialog
+        ("Tape images", "*.wav *.cas"),
+        ("All files", "*"),
+    ]
+
+    def command_insert_tape(self):
+        filepath = filedialog.askopenfilename(
+            parent=self.root,
+            title="Select a tape image",
+            filetypes=self.TAPE_FILETYPES,
+        )
+        if filepath:
+            cassette_trap = self.machine.periphery.cassette_trap
+            try:
+                if cassette_trap is not None:
+                    cassette_trap.insert(filepath)
+                else:
+                    self.machine.periphery.cassette.insert(open_tape(filepath))
+            except (ValueError, OSError) as err:
+                messagebox.showerror("Insert tape", f"Error loading {filepath!r}:\n{err}")
+
+    def get_tape_device(self):
+        """ The cassette deck or the ROM trap of the fast cassette mode """
+        periphery = self.machine.periphery
+        if periphery.cassette_trap is not None:
+            return periphery.cassette_trap
+        return periphery.cassette
+
+    def command_rewind_tape(self):
+        self.get_tape_device().rewind()
+
+    def command_eject_tape(self):
+        self.get_tape_device().eject()
+
+    # No display write middleware: flush_display() renders the changed video RAM
+    display_callback = None
+
+    def has_display_changes(self):
+        return self.display.has_changes
+
+    def flush_display(self):
+        self.display.flush()
 
     def close_basic_editor(self):
         if messagebox.askokcancel("Quit", "Do you really wish to close the Editor?"):
@@ -350,22 +598,32 @@ class DragonTkinterGUI(BaseTkinterGUI):
         self._editor_window.focus_text()
 
     def command_load_from_DragonPy(self):
-        self.add_user_input_and_wait("'SAVE TO EDITOR")
-        listing_ascii = self.machine.get_basic_program()
-        self._editor_window.set_content(listing_ascii)
-        self.add_user_input_and_wait("\n")
+        def load(completed):
+            listing_ascii = self.machine.get_basic_program()
+            self._editor_window.set_content(listing_ascii)
 
-    def command_inject_into_DragonPy(self):
-        self.add_user_input_and_wait("'LOAD FROM EDITOR")
+        self.type_text("'SAVE TO EDITOR\n", on_done=load)
+
+    def command_inject_into_DragonPy(self, on_done=None):
+        """
+        Inject the listing, if the ROM waits for input again.
+        on_done() is called after the program is injected.
+        """
         content = self._editor_window.get_content()
-        result = self.machine.inject_basic_program(content)
-        log.critical("program loaded: %s", result)
-        self.add_user_input_and_wait("\n")
+
+        def inject(completed):
+            if not completed:
+                messagebox.showerror("Inject", "The machine doesn't accept input: program not injected.")
+                return
+            result = self.machine.inject_basic_program(content)
+            log.critical("program loaded: %s", result)
+            if on_done is not None:
+                on_done()
+
+        self.type_text("'LOAD FROM EDITOR\n", on_done=inject)
 
     def command_inject_and_run_into_DragonPy(self):
-        self.command_inject_into_DragonPy()
-        self.add_user_input_and_wait("\n")  # FIXME: Sometimes this input will be "ignored"
-        self.add_user_input_and_wait("RUN\n")
+        self.command_inject_into_DragonPy(on_done=lambda: self.type_text("RUN\n", wait_idle=False))
 
     # ##########################################################################
 
@@ -405,6 +663,7 @@ class ScrolledTextGUI(BaseTkinterGUI):
             font=('courier', 11),
         )
         self.text.grid(row=0, column=0, sticky=tk.NSEW)
+        self.display_chars = []  # Output since the last flush_display()
 
 #         self._editor_window = None
 #         self.menubar.insert_command(index=3, label="BASIC editor", command=self.open_basic_editor)
@@ -431,6 +690,7 @@ class ScrolledTextGUI(BaseTkinterGUI):
             char = invert_shift(char)
 
         self.user_input_queue.put(char)
+        self.stop_warp(STOP_KEY_PRESS)
 
         # Don't insert the char in text widget, because it will be echoed
         # back from the machine!
@@ -438,15 +698,27 @@ class ScrolledTextGUI(BaseTkinterGUI):
 
     def display_callback(self, char):
         log.debug("Add to text: %s", repr(char))
-        if char == "\x08":
-            # Delete last input char
-            self.text.delete(tk.INSERT + "-1c")
-        else:
-            # insert the new character:
-            self.text.insert(tk.END, char)
+        self.display_chars.append(char)
 
-            # scroll down if needed:
-            self.text.see(tk.END)
+    def has_display_changes(self):
+        return bool(self.display_chars)
 
-            # Set cursor to the END position:
-            self.text.mark_set(tk.INSERT, tk.END)
+    def flush_display(self):
+        if not self.display_chars:
+            return
+        txt = "".join(self.display_chars)
+        self.display_chars = []
+
+        for no, part in enumerate(txt.split("\x08")):
+            if no:
+                # Delete last input char
+                self.text.delete(tk.INSERT + "-1c")
+            if part:
+                # insert the new characters:
+                self.text.insert(tk.END, part)
+
+                # Set cursor to the END position:
+                self.text.mark_set(tk.INSERT, tk.END)
+
+        # scroll down if needed:
+        self.text.see(tk.END)
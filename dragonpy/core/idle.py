@@ -0,0 +1,87 @@
+"""
+    DragonPy - idle loop detection
+    ==============================
+
+    A machine that waits for input spins in a tight polling loop, e.g.:
+    the Dragon ROM in the keyboard scan routine, or the sbc09 monitor
+    reading the ACIA data register. The input devices report every poll
+    of the input queue. Many empty polls in a row, with only a few CPU
+    cycles between them, means: The machine is idle.
+
+    Machine.run(skip_idle=True) doesn't emulate the rest of a idle loop:
+    It advances the CPU cycles directly to the next device event (e.g.:
+    the next field sync IRQ) or to the end of the run. So the GUI can
+    sleep until the next video frame, instead of burning a host core.
+    Side effect: Loop counters in the polling loop (e.g.: the cursor
+    blink delay) count slower.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+
+
+log = logging.getLogger(__name__)
+
+
+class IdleDetector:
+    """
+    >>> detector = IdleDetector()
+    >>> for cycles in range(0, 500 * IdleDetector.MIN_POLLS, 500):
+    ...     detector.input_polled(cycles, empty=True)
+    >>> detector.idle
+    True
+    >>> detector.input_polled(cycles + 500, empty=False)  # Got input
+    >>> detector.idle
+    False
+
+    Polls with too many CPU cycles in between are not a idle loop,
+    e.g.: the BREAK key check of a running BASIC program:
+
+    >>> for cycles in range(0, 5000 * IdleDetector.MIN_POLLS, 5000):
+    ...     detector.input_polled(cycles, empty=True)
+    >>> detector.idle
+    False
+
+    After the idle cycles are skipped, the next empty poll means idle again:
+
+    >>> detector.wake()
+    >>> detector.input_polled(1000000, empty=True)
+    >>> detector.idle
+    True
+    """
+    MIN_POLLS = 20  # Empty input polls in a row
+    MAX_POLL_DISTANCE = 2000  # Maximum CPU cycles between two polls of a idle loop
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.empty_polls = 0
+        self.last_poll_cycles = None
+
+    def input_polled(self, cycles, empty):
+        """
+        Called by the input devices on every read of the input queue.
+        """
+        if not empty:
+            self.reset()
+            return
+
+        if self.last_poll_cycles is not None and cycles - self.last_poll_cycles > self.MAX_POLL_DISTANCE:
+            self.empty_polls = 0
+        self.empty_polls += 1
+        self.last_poll_cycles = cycles
+
+    def wake(self):
+        """
+        The idle cycles are skipped and a device event (e.g.: a IRQ) may be
+        handled now: The next empty poll, wherever it comes, means idle again.
+        """
+        self.empty_polls = self.MIN_POLLS - 1
+        self.last_poll_cycles = None
+
+    @property
+    def idle(self):
+        return self.empty_polls >= self.MIN_POLLS
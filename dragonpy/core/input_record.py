@@ -0,0 +1,193 @@
+"""
+    DragonPy - deterministic input recording and replay
+    ===================================================
+
+    The emulation itself is deterministic: Device events are dispatched
+    at exact CPU cycles (see: dragonpy.core.scheduler). Only the user input
+    arrives at "random" cycles, depending on the host speed. So a session
+    can be reproduced with a save state and the input timed in CPU cycles.
+
+    RecordingInputQueue logs every input item with the CPU cycles at which
+    the machine saw it the first time (empty()/get() returned it) and at
+    which the machine consumed it.
+
+    ReplayInputQueue contains all recorded items from the start and hides
+    every item until its recorded CPU cycles: The machine sees exactly
+    the same input at exactly the same cycles. A replay results in the same
+    CPU cycles, the same memory and the same screen, bit-for-bit.
+
+    Not reproducible: Machine.run(skip_idle=True) depends on the host timing.
+    Record and replay without idle skipping.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import base64
+import json
+import logging
+import queue
+
+
+log = logging.getLogger(__name__)
+
+
+RECORDING_VERSION = 1
+
+
+class RecordingInputQueue(queue.Queue):
+    """
+    A user input queue, that records the input for a replay.
+
+    >>> from unittest import mock
+    >>> cpu = mock.Mock(cycles=100)
+    >>> input_queue = RecordingInputQueue()
+    >>> input_queue.attach(cpu)
+    >>> input_queue.put("A")
+    >>> cpu.cycles = 120
+    >>> input_queue.empty()  # The machine polls the input
+    False
+    >>> cpu.cycles = 150
+    >>> input_queue.get(block=False)
+    'A'
+    >>> input_queue.events
+    [(120, 150, 'A')]
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        self.cpu = None
+        self.events = []  # [(seen cycles, consumed cycles, item), ...]
+        self.seen_cycles = None  # CPU cycles at which the first item in the queue was seen
+
+    def attach(self, cpu):
+        self.cpu = cpu
+
+    def _qsize(self):
+        size = len(self.queue)
+        if size and self.seen_cycles is None:
+            self.seen_cycles = self.cpu.cycles
+        return size
+
+    def _get(self):
+        item = self.queue.popleft()
+        cycles = self.cpu.cycles
+        if self.seen_cycles is None:  # e.g.: get() without a size check before
+            self.seen_cycles = cycles
+        self.events.append((self.seen_cycles, cycles, item))
+        self.seen_cycles = None
+        return item
+
+
+class ReplayInputQueue(queue.Queue):
+    """
+    A user input queue, that plays back recorded input at the recorded CPU cycles.
+
+    >>> from unittest import mock
+    >>> cpu = mock.Mock(cycles=100)
+    >>> input_queue = ReplayInputQueue([(120, 150, "A")])
+    >>> input_queue.attach(cpu)
+    >>> input_queue.empty()
+    True
+    >>> cpu.cycles = 120
+    >>> input_queue.empty()
+    False
+    >>> input_queue.get(block=False)
+    'A'
+    >>> input_queue.finished
+    True
+    """
+
+    def __init__(self, events):
+        super().__init__()
+        self.cpu = None
+        self.queue.extend(events)
+
+    def attach(self, cpu):
+        self.cpu = cpu
+
+    @property
+    def finished(self):
+        return not self.queue
+
+    @property
+    def next_cycles(self):
+        """ CPU cycles of the next input item, None if all items are replayed """
+        if self.queue:
+            return self.queue[0][0]
+        return None
+
+    def _qsize(self):
+        if self.queue and self.queue[0][0] <= self.cpu.cycles:
+            return 1
+        return 0
+
+    def _put(self, item):
+        log.warning("Ignore input %r: Replay is running", item)
+
+    def _get(self):
+        __, consumed_cycles, item = self.queue.popleft()
+        if consumed_cycles != self.cpu.cycles:
+            log.warning(
+                "Replay diverged: %r consumed at cycle %i, recorded at cycle %i",
+                item, self.cpu.cycles, consumed_cycles
+            )
+        return item
+
+
+class InputRecording:
+    """
+    A save state, the recorded input and the final CPU cycles and screen
+    hash of a session. Stored as JSON.
+
+    >>> recording = InputRecording("sbc09", b"state", [(1, 2, "A")], end_cycles=3, screen_hash="abc")
+    >>> InputRecording.from_json(recording.to_json()) == recording
+    True
+    """
+
+    def __init__(self, machine_name, state, events, end_cycles, screen_hash=None):
+        self.machine_name = machine_name
+        self.state = state  # save state bytes of the start, see: dragonpy.core.save_state
+        self.events = [tuple(event) for event in events]
+        self.end_cycles = end_cycles
+        self.screen_hash = screen_hash
+
+    def __eq__(self, other):
+        return isinstance(other, InputRecording) and self.to_dict() == other.to_dict()
+
+    def to_dict(self):
+        return {
+            "version": RECORDING_VERSION,
+            "machine": self.machine_name,
+            "state": base64.b64encode(self.state).decode("ascii"),
+            "events": [list(event) for event in self.events],
+            "end_cycles": self.end_cycles,
+            "screen_hash": self.screen_hash,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, data):
+        data = json.loads(data)
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported input recording version: {data.get('version')!r}")
+        return cls(
+            machine_name=data["machine"],
+            state=base64.b64decode(data["state"]),
+            events=data["events"],
+            end_cycles=data["end_cycles"],
+            screen_hash=data["screen_hash"],
+        )
+
+    def save(self, filepath):
+        with open(filepath, "w") as f:
+            f.write(self.to_json())
+        log.info("Save %i input events to %s", len(self.events), filepath)
+
+    @classmethod
+    def load(cls, filepath):
+        with open(filepath) as f:
+            return cls.from_json(f.read())
+
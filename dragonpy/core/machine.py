@@ -19,6 +19,11 @@ from dragonlib.core.basic import log_program_dump
 from MC6809.components.cpu6809 import CPU
 
 from dragonpy.components.memory import Memory
+from dragonpy.core import boot_cache, save_state
+from dragonpy.core.frame_clock import FRAME_CYCLES
+from dragonpy.core.idle import IdleDetector
+from dragonpy.core.input_record import InputRecording, RecordingInputQueue
+from dragonpy.core.scheduler import EventScheduler
 from dragonpy.utils.simple_debugger import print_exc_plus
 
 
@@ -26,6 +31,12 @@ log = logging.getLogger(__name__)
 
 
 class Machine:
+    # How many CPU op bursts (of cpu.inner_burst_op_count ops) between two "until" checks in run()
+    UNTIL_CHECK_BURSTS = 10
+
+    # Average CPU cycles per op: The bursts in run() are limited by CPU cycles
+    CYCLES_PER_OP = 4
+
     def __init__(self, cfg, periphery_class, display_callback, user_input_queue):
         self.cfg = cfg
         self.machine_api = cfg.machine_api
@@ -41,6 +52,13 @@ class Machine:
         self.cpu = CPU(memory, self.cfg)
         memory.cpu = self.cpu  # FIXME
 
+        # Cycle triggered device events, e.g.: VDG field sync IRQ, VIA timer:
+        self.scheduler = self.cpu.scheduler = EventScheduler()
+
+        # The input devices report empty input polls, see: dragonpy.core.idle
+        self.idle_detector = self.cpu.idle_detector = IdleDetector()
+        self.idle_cycles = 0  # CPU cycles skipped in idle loops
+
         try:
             self.periphery = self.periphery_class(
                 self.cfg, self.cpu, memory, self.display_callback, self.user_input_queue
@@ -55,12 +73,14 @@ class Machine:
         self.cpu.reset()
 
         self.op_count = 0
+        self.frame_end_cycles = None  # CPU cycles at the end of the last run_frame()
 
     def get_basic_program(self):
-        program_start = self.cpu.memory.read_word(self.machine_api.PROGRAM_START_ADDR)
-        variables_start = self.cpu.memory.read_word(self.machine_api.VARIABLES_START_ADDR)
-        array_start = self.cpu.memory.read_word(self.machine_api.ARRAY_START_ADDR)
-        free_space_start = self.cpu.memory.read_word(self.machine_api.FREE_SPACE_START_ADDR)
+        memory = self.cpu.memory
+        program_start = memory.peek_word(self.machine_api.PROGRAM_START_ADDR)
+        variables_start = memory.peek_word(self.machine_api.VARIABLES_START_ADDR)
+        array_start = memory.peek_word(self.machine_api.ARRAY_START_ADDR)
+        free_space_start = memory.peek_word(self.machine_api.FREE_SPACE_START_ADDR)
 
         program_end = variables_start - 1
         variables_end = array_start - 1
@@ -70,10 +90,7 @@ class Machine:
         log.critical("variables....: $%04x-$%04x", variables_start, variables_end)
         log.critical("array........: $%04x-$%04x", array_start, array_end)
 
-        dump = [
-            value
-            for addr, value in self.cpu.memory.iter_bytes(program_start, program_end)
-        ]
+        dump = list(memory.read_block(program_start, program_end))
         log.critical("Dump: %s", repr(dump))
         log_program_dump(dump)
 
@@ -85,18 +102,17 @@ class Machine:
         """
         save the given ASCII BASIC program listing into the emulator RAM.
         """
-        program_start = self.cpu.memory.read_word(
-            self.machine_api.PROGRAM_START_ADDR
-        )
+        memory = self.cpu.memory
+        program_start = memory.peek_word(self.machine_api.PROGRAM_START_ADDR)
         tokens = self.machine_api.ascii_listing2program_dump(ascii_listing)
-        self.cpu.memory.load(program_start, tokens)
+        memory.write_block(program_start, tokens)
         log.critical("BASIC program injected into Memory.")
 
         # Update the BASIC addresses:
         program_end = program_start + len(tokens)
-        self.cpu.memory.write_word(self.machine_api.VARIABLES_START_ADDR, program_end)
-        self.cpu.memory.write_word(self.machine_api.ARRAY_START_ADDR, program_end)
-        self.cpu.memory.write_word(self.machine_api.FREE_SPACE_START_ADDR, program_end)
+        memory.poke_word(self.machine_api.VARIABLES_START_ADDR, program_end)
+        memory.poke_word(self.machine_api.ARRAY_START_ADDR, program_end)
+        memory.poke_word(self.machine_api.FREE_SPACE_START_ADDR, program_end)
         log.critical("BASIC addresses updated.")
 
     def hard_reset(self):
@@ -107,6 +123,135 @@ class Machine:
 #        print_cpu_state_data(self.cpu.get_state())
         self.cpu.reset()
 
+    def save_state(self):
+        """
+        Returns a snapshot of the complete machine as bytes, see: dragonpy.core.save_state
+        """
+        return save_state.dump_state(self.cfg, self.cpu, self.cpu.memory, self.periphery)
+
+    def load_state(self, data):
+        """
+        Restore the complete machine from a snapshot created by save_state()
+        """
+        save_state.load_state(data, self.cfg, self.cpu, self.cpu.memory, self.periphery)
+
+    def boot(self, cache_path=None):
+        """
+        Bring the machine to cfg.STARTUP_END_ADDR, via the boot state cache,
+        see: dragonpy.core.boot_cache
+        cache_path: Directory of the cache files (default: boot_cache.BOOT_CACHE_PATH)
+        Can be disabled with cfg_dict["boot_cache"] = False
+        """
+        if not self.cfg.cfg_dict.get("boot_cache", True):
+            log.info("Boot state cache disabled.")
+            return False
+        return boot_cache.boot(self, cache_path=cache_path)
+
+    def run(self, max_cycles=None, until=None, skip_idle=False):
+        """
+        Run the machine without any GUI, as fast as Python can.
+
+        The CPU runs in bursts of about cpu.inner_burst_op_count ops, the
+        cycle triggered sync callbacks are called after every burst.
+        A burst ends directly after the op that reaches the next device event
+        (see: dragonpy.core.scheduler) or max_cycles: The events are
+        dispatched at the same op, independent of how the run is split into
+        run() calls. So a run is reproducible, see: dragonpy.core.input_record
+        Stops if:
+            * at least max_cycles CPU cycles are emulated (if given)
+            * `until` matched:
+                a callable: until(machine) returns True (checked every few bursts)
+                a int: The program counter reached this address (checked after every op)
+            * the CPU was stopped, e.g.: via quit()
+            * skip_idle is set, the machine is idle and no device event is pending
+
+        With skip_idle: If the machine waits for input in a polling loop, the CPU
+        cycles are advanced to the next device event or to max_cycles,
+        see: dragonpy.core.idle (Not reproducible: depends on max_cycles)
+
+        Returns True if `until` matched.
+        """
+        cpu = self.cpu
+        get_and_call_next_op = cpu.get_and_call_next_op
+        scheduler = self.scheduler
+        run_due = scheduler.run_due
+        idle_detector = self.idle_detector
+        user_input_queue = self.user_input_queue
+        program_counter = cpu.program_counter
+        burst_cycles = cpu.inner_burst_op_count * self.CYCLES_PER_OP
+
+        if max_cycles is None:
+            end_cycles = None
+        else:
+            end_cycles = cpu.cycles + max_cycles
+
+        if isinstance(until, int):
+            end_pc = until
+            until = None
+        else:
+            end_pc = None
+
+        burst_count = 0
+        while cpu.running:
+            burst_end_cycles = cpu.cycles + burst_cycles
+            next_cycles = scheduler.next_cycles
+            if next_cycles is not None and next_cycles < burst_end_cycles:
+                burst_end_cycles = next_cycles
+            if end_cycles is not None and end_cycles < burst_end_cycles:
+                burst_end_cycles = end_cycles
+
+            if end_pc is None:
+                while cpu.cycles < burst_end_cycles:
+                    get_and_call_next_op()
+            else:
+                while cpu.cycles < burst_end_cycles:
+                    if program_counter.value == end_pc:
+                        return True
+                    get_and_call_next_op()
+            if next_cycles is not None and cpu.cycles >= next_cycles:
+                run_due(cpu.cycles)
+
+            if skip_idle and idle_detector.idle and user_input_queue.empty():
+                if scheduler.next_cycles is None:
+                    idle_end_cycles = end_cycles
+                elif end_cycles is None:
+                    idle_end_cycles = scheduler.next_cycles
+                else:
+                    idle_end_cycles = min(scheduler.next_cycles, end_cycles)
+                if idle_end_cycles is None:
+                    break  # Nothing will happen without input
+                if idle_end_cycles > cpu.cycles:
+                    self.idle_cycles += idle_end_cycles - cpu.cycles
+                    cpu.cycles = idle_end_cycles
+                    run_due(cpu.cycles)
+                idle_detector.wake()
+
+            if end_cycles is not None and cpu.cycles >= end_cycles:
+                break
+
+            if until is not None:
+                burst_count += 1
+                if burst_count >= self.UNTIL_CHECK_BURSTS:
+                    burst_count = 0
+                    if until(self):
+                        return True
+
+        return until is not None and until(self)
+
+    def run_frame(self, frame_cycles=FRAME_CYCLES, skip_idle=False):
+        """
+        Run the CPU for one video frame.
+        Machine.run() stops up to one op after the frame end: This
+        overshoot is subtracted from the next frame, so the frames stay in sync.
+        """
+        if self.frame_end_cycles is not None and 0 <= self.cpu.cycles - self.frame_end_cycles < frame_cycles:
+            max_cycles = frame_cycles - (self.cpu.cycles - self.frame_end_cycles)
+        else:
+            # First frame or the CPU cycles jumped, e.g.: load state
+            max_cycles = frame_cycles
+        self.frame_end_cycles = self.cpu.cycles + max_cycles
+        self.run(max_cycles=max_cycles, skip_idle=skip_idle)
+
     def quit(self):
         self.cpu.running = False
 
@@ -116,11 +261,11 @@ class MachineThread(threading.Thread):
     run machine in a seperated thread.
     """
 
-    def __init__(self, cfg, periphery_class, user_input_queue):
+    def __init__(self, cfg, periphery_class, display_callback, user_input_queue):
         super().__init__(name="CPU-Thread")
         log.critical(" *** MachineThread init *** ")
         self.machine = Machine(
-            cfg, periphery_class, user_input_queue
+            cfg, periphery_class, display_callback, user_input_queue
         )
 
     def run(self):
@@ -139,11 +284,11 @@ class MachineThread(threading.Thread):
 
 
 class ThreadedMachine:
-    def __init__(self, cfg, periphery_class, user_input_queue):
+    def __init__(self, cfg, periphery_class, display_callback, user_input_queue):
         self.cpu_thread = MachineThread(
-            cfg, periphery_class, user_input_queue
+            cfg, periphery_class, display_callback, user_input_queue
         )
-        self.cpu_thread.deamon = True
+        self.cpu_thread.daemon = True
         self.cpu_thread.start()
 #         log.critical("Wait for CPU thread stop.")
 #         try:
@@ -163,8 +308,14 @@ class MachineGUI:
     def __init__(self, cfg):
         self.cfg = cfg
 
+        # Record all input for a replay, see: dragonpy.core.input_record
+        self.record_filepath = cfg.cfg_dict.get("record")
+
         # Queue to send keyboard inputs from GUI to CPU Thread:
-        self.user_input_queue = queue.Queue()
+        if self.record_filepath:
+            self.user_input_queue = RecordingInputQueue()
+        else:
+            self.user_input_queue = queue.Queue()
 
     def run(self, PeripheryClass, GUI_Class):
         log.log(99, "Startup '%s' machine...", self.cfg.MACHINE_NAME)
@@ -184,6 +335,10 @@ class MachineGUI:
             gui.display_callback,
             self.user_input_queue
         )
+        if self.record_filepath:
+            self.user_input_queue.attach(machine.cpu)
+        machine.boot()
+        record_state = machine.save_state() if self.record_filepath else None
 
         try:
             gui.mainloop(machine)
@@ -192,6 +347,14 @@ class MachineGUI:
             print_exc_plus()
         machine.quit()
 
+        if self.record_filepath:
+            InputRecording(
+                machine_name=self.cfg.CONFIG_NAME,
+                state=record_state,
+                events=self.user_input_queue.events,
+                end_cycles=machine.cpu.cycles,
+            ).save(self.record_filepath)
+
         log.log(99, " --- END ---")
 
 
@@ -0,0 +1,145 @@
+"""
+    DragonPy - memory info interval index
+    =====================================
+
+    The memory info tables (e.g.: DragonMemInfo.MEM_INFO) are long tuples
+    of (start, end, text) and BaseMemoryInfo.get_shortest() scans all of
+    them on every lookup.
+
+    IndexedMemoryInfo compiles the table into a 64K array with the entry
+    id of the shortest area for every address: A lookup is one array access.
+    The array is built on the first lookup and cached on disk, keyed by
+    a hash of the table content.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import array
+import hashlib
+import logging
+import os
+
+from MC6809.core.memory_info import BaseMemoryInfo
+
+
+log = logging.getLogger(__name__)
+
+
+MEM_INFO_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "DragonPy", "mem_info")
+INDEX_VERSION = 1
+
+ADDRESS_COUNT = 0x10000
+NO_ENTRY = 0  # Entry ids in the table are: index in MEM_INFO + 1
+
+
+def build_shortest_table(mem_info):
+    """
+    Returns a array with the id of the shortest entry for every address.
+    Like BaseMemoryInfo.get_shortest(): On same size, the first entry wins.
+
+    >>> table = build_shortest_table(((0x0, 0xff, "page"), (0x10, 0x11, "word"), (0x10, 0x11, "same size")))
+    >>> table[0x00], table[0x10], table[0x11], table[0x12], table[0x100]
+    (1, 2, 2, 1, 0)
+    """
+    table = array.array("H", bytes(ADDRESS_COUNT * 2))
+    # Write the biggest areas first, so the shortest area wins:
+    entries = sorted(
+        (
+            (end - start, entry_id, start, end)
+            for entry_id, (start, end, __) in enumerate(mem_info, start=1)
+            if start <= end  # Invalid areas never match in BaseMemoryInfo, too
+        ),
+        key=lambda entry: (-entry[0], -entry[1]),
+    )
+    for __, entry_id, start, end in entries:
+        start = max(start, 0)
+        end = min(end, ADDRESS_COUNT - 1)
+        if start <= end:
+            table[start:end + 1] = array.array("H", [entry_id]) * (end - start + 1)
+    return table
+
+
+def get_cache_filepath(mem_info, cache_path=None):
+    if cache_path is None:
+        cache_path = MEM_INFO_CACHE_PATH
+    content = repr((INDEX_VERSION, tuple(mem_info))).encode("utf-8")
+    return os.path.join(cache_path, f"{hashlib.sha1(content).hexdigest()}.bin")
+
+
+def get_shortest_table(mem_info, cache_path=None):
+    """
+    Load the table from the disk cache, or build and cache it.
+    """
+    if cache_path is False:
+        return build_shortest_table(mem_info)
+
+    filepath = get_cache_filepath(mem_info, cache_path)
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except OSError:
+        log.info("No memory info index cache file %r", filepath)
+    else:
+        if len(data) == ADDRESS_COUNT * 2:
+            table = array.array("H")
+            table.frombytes(data)
+            return table
+        log.error("Ignore corrupt memory info index cache file %r", filepath)
+
+    table = build_shortest_table(mem_info)
+    temp_filepath = f"{filepath}.{os.getpid():d}.tmp"
+    try:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(temp_filepath, "wb") as f:
+            f.write(table.tobytes())
+        os.replace(temp_filepath, filepath)  # other processes never see an incomplete file
+    except OSError as err:
+        log.error("Can't save memory info index cache file %r: %s", filepath, err)
+    return table
+
+
+# MemoryInfo class -> shortest table, shared by all instances
+_tables = {}
+
+
+class IndexedMemoryInfo(BaseMemoryInfo):
+    """
+    BaseMemoryInfo with a lookup via the index. Set MEM_INFO in subclasses.
+
+    >>> class TestMemInfo(IndexedMemoryInfo):
+    ...     MEM_INFO = ((0x0, 0xff, "page"), (0x10, 0x10, "byte"))
+    ...     INDEX_CACHE_PATH = False  # No disk cache
+    >>> mem_info = TestMemInfo(print)
+    >>> mem_info.get_shortest(0x10)
+    '$10: byte'
+    >>> mem_info.get_shortest(0x11)
+    '$11: $0-$ff - page'
+    >>> mem_info.get_shortest(0x1000)
+    '$1000: UNKNOWN'
+    >>> mem_info(0x10, "Read")
+    Read: $10: byte
+    """
+    MEM_INFO = ()
+    INDEX_CACHE_PATH = None  # None: MEM_INFO_CACHE_PATH, False: no disk cache
+
+    def get_table(self):
+        cls = self.__class__
+        table = _tables.get(cls)
+        if table is None:
+            table = _tables[cls] = get_shortest_table(self.MEM_INFO, self.INDEX_CACHE_PATH)
+        return table
+
+    def get_shortest(self, addr):
+        if 0 <= addr < ADDRESS_COUNT:
+            entry_id = self.get_table()[addr]
+        else:
+            entry_id = NO_ENTRY
+        if entry_id == NO_ENTRY:
+            return f"${addr:x}: UNKNOWN"
+
+        start, end, txt = self.MEM_INFO[entry_id - 1]
+        if start == end:
+            return f"${addr:x}: {txt}"
+        else:
+            return f"${addr:x}: ${start:x}-${end:x} - {txt}"
@@ -0,0 +1,180 @@
+"""
+    DragonPy - rewind buffer
+    ========================
+
+    A ring buffer of machine snapshots, taken every few video frames, to
+    step the emulation backwards.
+
+    Only the newest snapshot has a full copy of the memory. Every snapshot
+    stores the changed pages as XOR delta against its predecessor (zlib
+    compressed, mostly zero bytes). Rewinding applies the deltas from the
+    newest snapshot backwards, so no keyframes are needed and the oldest
+    snapshots can simply be dropped if the memory budget is exceeded.
+
+    The CPU registers, the pending device events and the periphery state
+    are stored as JSON, like in the save states (see: dragonpy.core.save_state).
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import json
+import logging
+import zlib
+
+from dragonpy.core import save_state
+from dragonpy.core.frame_clock import FRAME_CYCLES
+
+
+log = logging.getLogger(__name__)
+
+
+DEFAULT_INTERVAL_FRAMES = 50  # One snapshot per second (50Hz video fields)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Rough size of a snapshot without the page deltas, e.g.: the list entries, the JSON state
+SNAPSHOT_OVERHEAD = 512
+
+
+def xor_bytes(a, b):
+    r"""
+    >>> xor_bytes(b"\x01\x02\xff", b"\x01\x03\x0f")
+    b'\x00\x01\xf0'
+    """
+    size = len(a)
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(size, "little")
+
+
+class Snapshot:
+    __slots__ = ("cycles", "delta_data", "delta_pages", "size", "state_json")
+
+    def __init__(self, cycles, state_json):
+        self.cycles = cycles
+        self.state_json = state_json
+        self.delta_pages = None  # [(bank name, page number), ...] changed since the previous snapshot
+        self.delta_data = None  # zlib compressed XOR delta of all changed pages
+        self.size = SNAPSHOT_OVERHEAD + len(state_json)
+
+    def set_delta(self, delta_pages, delta_data):
+        self.delta_pages = delta_pages
+        self.delta_data = delta_data
+        self.size += len(delta_data) + len(delta_pages) * 16
+
+    def drop_delta(self):
+        if self.delta_pages is not None:
+            self.size -= len(self.delta_data) + len(self.delta_pages) * 16
+            self.delta_pages = None
+            self.delta_data = None
+
+
+class RewindBuffer:
+    def __init__(self, machine, interval_frames=DEFAULT_INTERVAL_FRAMES, max_bytes=DEFAULT_MAX_BYTES):
+        self.machine = machine
+        self.interval_cycles = interval_frames * FRAME_CYCLES
+        self.max_bytes = max_bytes
+
+        self.snapshots = collections.deque()
+        self.pages = {}  # (bank name, page number) -> page data of the newest snapshot
+        self.size = 0  # Bytes used by all snapshots (without self.pages)
+        self.next_snapshot_cycles = None
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    def clear(self):
+        self.snapshots.clear()
+        self.pages = {}
+        self.size = 0
+        self.next_snapshot_cycles = None
+
+    def update(self):
+        """
+        Called regularly, e.g.: after every CPU burst: Take a snapshot, if the interval is elapsed.
+        """
+        cycles = self.machine.cpu.cycles
+        if self.next_snapshot_cycles is not None and 0 <= self.next_snapshot_cycles - cycles <= self.interval_cycles:
+            return False
+        # First call, interval elapsed or the CPU cycles jumped back (e.g.: load state)
+        self.snapshot()
+        return True
+
+    def snapshot(self):
+        machine = self.machine
+        cpu = machine.cpu
+        state = save_state.get_device_state(cpu, machine.periphery)
+        snapshot = Snapshot(cpu.cycles, json.dumps(state))
+
+        pages = self.pages
+        delta_pages = []
+        delta_parts = []
+        for bank_name, page, page_view in cpu.memory.iter_pages():
+            key = (bank_name, page)
+            old_data = pages.get(key)
+            if old_data is not None and page_view == old_data:
+                continue
+            data = page_view.tobytes()
+            if old_data is not None:
+                delta_pages.append(key)
+                delta_parts.append(xor_bytes(old_data, data))
+            pages[key] = data
+
+        if self.snapshots:
+            snapshot.set_delta(delta_pages, zlib.compress(b"".join(delta_parts), 1))
+
+        self.snapshots.append(snapshot)
+        self.size += snapshot.size
+        self.next_snapshot_cycles = cpu.cycles + self.interval_cycles
+
+        while self.size > self.max_bytes and len(self.snapshots) > 1:
+            self.size -= self.snapshots.popleft().size
+            oldest = self.snapshots[0]
+            self.size -= oldest.size
+            oldest.drop_delta()  # Nothing older to rewind to
+            self.size += oldest.size
+
+        log.debug(
+            "Snapshot at cycle %i: %i changed pages, %i snapshots in %i Bytes",
+            snapshot.cycles, len(delta_pages), len(self.snapshots), self.size
+        )
+
+    def _drop_newest(self):
+        """
+        Remove the newest snapshot and revert self.pages to the previous snapshot
+        """
+        snapshot = self.snapshots.pop()
+        self.size -= snapshot.size
+        if snapshot.delta_pages:
+            delta = zlib.decompress(snapshot.delta_data)
+            pages = self.pages
+            for index, key in enumerate(snapshot.delta_pages):
+                start = index * len(pages[key])
+                pages[key] = xor_bytes(pages[key], delta[start:start + len(pages[key])])
+
+    def rewind(self, steps=1):
+        """
+        Restore the snapshot `steps` intervals back in time: steps=1 is the newest
+        snapshot (that may be taken a few moments ago). All newer snapshots are dropped.
+        Returns the CPU cycles of the restored snapshot, None if the buffer is empty.
+        """
+        if not self.snapshots:
+            return None
+
+        steps = min(steps, len(self.snapshots))
+        for __ in range(steps - 1):
+            self._drop_newest()
+        snapshot = self.snapshots[-1]
+
+        machine = self.machine
+        memory = machine.cpu.memory
+        memory.restore_pages(
+            (bank_name, page, data) for (bank_name, page), data in self.pages.items()
+        )
+        save_state.set_device_state(machine.cpu, machine.periphery, json.loads(snapshot.state_json))
+        self.next_snapshot_cycles = snapshot.cycles + self.interval_cycles
+
+        log.info(
+            "Rewind %i steps to cycle %i (%i snapshots left)",
+            steps, snapshot.cycles, len(self.snapshots)
+        )
+        return snapshot.cycles
@@ -0,0 +1,199 @@
+"""
+    DragonPy - save states
+    ======================
+
+    A versioned, compressed binary snapshot of a complete machine:
+    CPU registers, the memory and the state of the periphery.
+
+    Format:
+        STATE_MAGIC (8 Bytes) + STATE_VERSION (unsigned short, big-endian)
+        + zlib compressed payload
+
+    The payload:
+        length of the JSON header (unsigned int, big-endian)
+        + JSON header (machine name, CPU registers, pending device events,
+          periphery state, page list)
+        + raw data of all pages from the page list (256 Bytes each)
+
+    Only memory pages that differs from the initial memory content are stored:
+    Unchanged ROM pages and zero pages are skipped.
+    A periphery without get_state()/set_state() (e.g.: the ACIA peripheries
+    of sbc09, Simple6809 and Multicomp6809) has no internal state.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import json
+import logging
+import struct
+import zlib
+
+from dragonpy.components.memory import PAGE_SIZE
+
+
+log = logging.getLogger(__name__)
+
+
+STATE_MAGIC = b"DragonPy"
+STATE_VERSION = 6
+
+STATE_HEADER = struct.Struct(">8sH")
+JSON_LENGTH = struct.Struct(">I")
+
+# CPU register objects, stored with their .value
+CPU_REGISTERS = (
+    "index_x", "index_y",
+    "user_stack_pointer", "system_stack_pointer",
+    "program_counter",
+    "accu_a", "accu_b",
+    "direct_page",
+)
+
+
+def get_cpu_state(cpu):
+    state = {name: getattr(cpu, name).value for name in CPU_REGISTERS}
+    state["cc"] = cpu.get_cc_value()
+    state["cycles"] = cpu.cycles
+    state["last_op_address"] = cpu.last_op_address
+    state["irq_enabled"] = cpu.irq_enabled
+    return state
+
+
+def set_cpu_state(cpu, state):
+    for name in CPU_REGISTERS:
+        getattr(cpu, name).set(state[name])
+    cpu.set_cc(state["cc"])
+    cpu.cycles = state["cycles"]
+    cpu.last_op_address = state["last_op_address"]
+    cpu.irq_enabled = state["irq_enabled"]
+
+
+def get_scheduler_state(cpu):
+    scheduler = getattr(cpu, "scheduler", None)
+    return scheduler.get_state() if scheduler else {}
+
+
+def set_scheduler_state(cpu, state):
+    scheduler = getattr(cpu, "scheduler", None)
+    if scheduler:
+        scheduler.set_state(state)
+
+
+def get_device_state(cpu, periphery):
+    """
+    The state of the CPU, the pending device events and the periphery (without the memory)
+    """
+    get_periphery_state = getattr(periphery, "get_state", None)
+    return {
+        "cpu": get_cpu_state(cpu),
+        "events": get_scheduler_state(cpu),
+        "periphery": get_periphery_state() if get_periphery_state else {},
+    }
+
+
+def set_device_state(cpu, periphery, state):
+    set_cpu_state(cpu, state["cpu"])
+    set_scheduler_state(cpu, state["events"])
+
+    set_periphery_state = getattr(periphery, "set_state", None)
+    if set_periphery_state:
+        set_periphery_state(state["periphery"])
+
+
+def dump_state(cfg, cpu, memory, periphery):
+    """
+    Create a save state of the complete machine and return it as bytes.
+    """
+    pages = []
+    page_data = []
+    for bank_name, page, data in memory.iter_changed_pages():
+        pages.append((bank_name, page))
+        page_data.append(data)
+
+    header = {
+        "machine": cfg.CONFIG_NAME,
+        **get_device_state(cpu, periphery),
+        "pages": pages,
+    }
+    json_header = json.dumps(header).encode("utf-8")
+    payload = b"".join((JSON_LENGTH.pack(len(json_header)), json_header, *page_data))
+
+    log.info(
+        "Save state with %i changed pages (%i Bytes uncompressed)",
+        len(pages), len(payload)
+    )
+    return STATE_HEADER.pack(STATE_MAGIC, STATE_VERSION) + zlib.compress(payload)
+
+
+def parse_state(data, cfg, memory):
+    """
+    Parse and validate a save state created by dump_state(), without changing the machine.
+    Returns the JSON header and the changed pages for memory.restore_pages()
+    Raise ValueError if the data is not a valid save state for this machine.
+    """
+    if len(data) < STATE_HEADER.size or data[:len(STATE_MAGIC)] != STATE_MAGIC:
+        raise ValueError("Data is not a DragonPy save state!")
+    __, version = STATE_HEADER.unpack_from(data)
+    if version != STATE_VERSION:
+        raise ValueError(f"Unsupported save state version {version:d} (supported: {STATE_VERSION:d})")
+
+    try:
+        payload = zlib.decompress(data[STATE_HEADER.size:])
+        (json_length,) = JSON_LENGTH.unpack_from(payload)
+        offset = JSON_LENGTH.size + json_length
+        header = json.loads(payload[JSON_LENGTH.size:offset])  # ValueError on broken JSON/UTF-8
+    except (zlib.error, struct.error, ValueError) as err:
+        raise ValueError(f"Save state is corrupt: {err}")
+
+    try:
+        machine_name = header["machine"]
+        cpu_state = header["cpu"]
+        missing = [
+            name for name in (*CPU_REGISTERS, "cc", "cycles", "last_op_address", "irq_enabled")
+            if name not in cpu_state
+        ]
+        if missing:
+            raise KeyError(", ".join(missing))
+        header["events"]
+        header["periphery"]
+        pages = [(bank_name, page) for bank_name, page in header["pages"]]
+        known_pages = {(bank_name, page) for bank_name, page, __ in memory.iter_pages()}
+        unknown_pages = [key for key in pages if key not in known_pages]
+    except (KeyError, TypeError, ValueError) as err:
+        raise ValueError(f"Save state is corrupt: Missing or wrong entry {err}")
+
+    if machine_name != cfg.CONFIG_NAME:
+        raise ValueError(f"Save state is from {machine_name!r} and not from {cfg.CONFIG_NAME!r}")
+
+    if unknown_pages:
+        raise ValueError(f"Save state is corrupt: Unknown memory pages {unknown_pages!r}")
+    if len(payload) != offset + len(pages) * PAGE_SIZE:
+        raise ValueError(
+            f"Save state is corrupt: {len(payload) - offset:d} Bytes page data for {len(pages):d} pages"
+        )
+
+    changed_pages = []
+    for bank_name, page in pages:
+        changed_pages.append((bank_name, page, payload[offset:offset + PAGE_SIZE]))
+        offset += PAGE_SIZE
+    return header, changed_pages
+
+
+def load_state(data, cfg, cpu, memory, periphery):
+    """
+    Restore the complete machine from a save state created by dump_state()
+
+    Raise ValueError if the data is invalid: The machine is unchanged if
+    parse_state() failed, but it's in an undefined state if the device state
+    can't be restored.
+    """
+    header, changed_pages = parse_state(data, cfg, memory)
+
+    memory.restore_pages(changed_pages)
+    try:
+        set_device_state(cpu, periphery, header)
+    except (KeyError, TypeError, ValueError) as err:
+        raise ValueError(f"Save state is corrupt: Can't restore the device state: {err!r}")
+
+    log.info("Save state with %i changed pages loaded.", len(changed_pages))
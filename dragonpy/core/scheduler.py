@@ -0,0 +1,198 @@
+"""
+    DragonPy - device event scheduler
+    =================================
+
+    A priority queue of device events, ordered by the CPU cycle count:
+    The machine run loop dispatches all due events after every CPU burst.
+    So the devices don't need to poll the CPU cycles on every register
+    access, e.g.: the VDG field sync IRQ or the VIA timer expiry.
+
+    Every event has a unique name and a callback, registered once via
+    add_event(). Afterwards the device can schedule (and reschedule)
+    the event at any CPU cycle count or cancel it. A periodic event is
+    rescheduled automatically in phase with its first schedule.
+
+    Canceled and rescheduled events stay in the heap until they are
+    popped: The heap entry is compared with the pending event entry.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import heapq
+import itertools
+import logging
+
+
+log = logging.getLogger(__name__)
+
+
+class EventScheduler:
+    """
+    >>> scheduler = EventScheduler()
+    >>> calls = []
+    >>> scheduler.add_event("tick", lambda cycles: calls.append(("tick", cycles)))
+    >>> scheduler.add_event("timer", lambda cycles: calls.append(("timer", cycles)))
+    >>> scheduler.schedule("tick", 100, period=100)
+    >>> scheduler.schedule("timer", 150)
+    >>> scheduler.next_cycles
+    100
+    >>> scheduler.run_due(cycles=99)
+    >>> calls
+    []
+    >>> scheduler.run_due(cycles=250)
+    >>> calls
+    [('tick', 100), ('timer', 150), ('tick', 200)]
+    >>> scheduler.get_state()
+    {'tick': [300, 100]}
+
+    Reschedule and cancel:
+
+    >>> scheduler.schedule("timer", 400)
+    >>> scheduler.schedule("timer", 320)
+    >>> scheduler.remaining_cycles("timer", cycles=300)
+    20
+    >>> scheduler.cancel("tick")
+    >>> scheduler.is_pending("tick")
+    False
+    >>> calls.clear()
+    >>> scheduler.run_due(cycles=1000)
+    >>> calls
+    [('timer', 320)]
+    >>> scheduler.next_cycles is None
+    True
+    """
+
+    def __init__(self):
+        self.callbacks = {}  # event name -> callback(cycles)
+        self.pending = {}  # event name -> heap entry: [cycles, sequence, name, period]
+        self.heap = []
+        self.sequence = itertools.count()
+        self.next_cycles = None  # CPU cycles of the next pending event
+
+    def add_event(self, name, callback):
+        """
+        Register a event: callback(cycles) will be called with the
+        scheduled CPU cycles (not the current cycles) if the event is due.
+        """
+        if name in self.callbacks:
+            raise KeyError(f"Event {name!r} already exists")
+        self.callbacks[name] = callback
+
+    def schedule(self, name, cycles, period=None):
+        """
+        (Re-)schedule the event at the given CPU cycles.
+        A periodic event is rescheduled every `period` cycles after that.
+        """
+        if name not in self.callbacks:
+            raise KeyError(f"Unknown event {name!r}")
+        entry = [cycles, next(self.sequence), name, period]
+        self.pending[name] = entry
+        heapq.heappush(self.heap, entry)
+        if self.next_cycles is None or cycles < self.next_cycles:
+            self.next_cycles = cycles
+
+        if len(self.heap) > 2 * len(self.pending) + 64:
+            self._compact()
+
+    def cancel(self, name):
+        self.pending.pop(name, None)
+
+    def clear(self):
+        self.pending.clear()
+        self.heap.clear()
+        self.next_cycles = None
+
+    def is_pending(self, name):
+        return name in self.pending
+
+    def remaining_cycles(self, name, cycles):
+        """
+        CPU cycles until the event is due, None if the event is not pending.
+        """
+        entry = self.pending.get(name)
+        if entry is None:
+            return None
+        return entry[0] - cycles
+
+    def _compact(self):
+        """
+        Remove the entries of canceled and rescheduled events from the heap
+        """
+        self.heap = list(self.pending.values())
+        heapq.heapify(self.heap)
+
+    def _update_next_cycles(self):
+        heap = self.heap
+        pending = self.pending
+        while heap and pending.get(heap[0][2]) is not heap[0]:
+            heapq.heappop(heap)  # canceled or rescheduled
+        self.next_cycles = heap[0][0] if heap else None
+
+    def run_due(self, cycles):
+        """
+        Call all events that are due at the given CPU cycles, in cycle order.
+        """
+        next_cycles = self.next_cycles
+        if next_cycles is None or next_cycles > cycles:
+            return
+
+        heap = self.heap
+        pending = self.pending
+        while heap and heap[0][0] <= cycles:
+            entry = heapq.heappop(heap)
+            event_cycles, __, name, period = entry
+            if pending.get(name) is not entry:
+                continue  # canceled or rescheduled
+
+            if period is None:
+                del pending[name]
+            else:
+                next_entry = [event_cycles + period, next(self.sequence), name, period]
+                pending[name] = next_entry
+                heapq.heappush(heap, next_entry)
+
+            self.callbacks[name](event_cycles)
+
+        self._update_next_cycles()
+
+    def resync(self, cycles):
+        """
+        The CPU ran without event dispatching (e.g.: a cold boot via cpu.test_run()):
+        Don't call the missed events one after another, move them to the given cycles.
+        Periodic events stay in phase.
+
+        >>> scheduler = EventScheduler()
+        >>> scheduler.add_event("tick", print)
+        >>> scheduler.add_event("timer", print)
+        >>> scheduler.schedule("tick", 100, period=100)
+        >>> scheduler.schedule("timer", 150)
+        >>> scheduler.resync(cycles=1050)
+        >>> scheduler.get_state()
+        {'tick': [1100, 100], 'timer': [1050, None]}
+        >>> scheduler.run_due(cycles=1050)
+        1050
+        """
+        for name, (event_cycles, __, __, period) in list(self.pending.items()):
+            if event_cycles >= cycles:
+                continue
+            if period is None:
+                event_cycles = cycles
+            else:
+                missed = (cycles - event_cycles) // period
+                log.debug("Event %r: skip %i missed periods", name, missed)
+                event_cycles += (missed + 1) * period
+            self.pending[name] = [event_cycles, next(self.sequence), name, period]
+        self._compact()
+        self._update_next_cycles()
+
+    def get_state(self):
+        """
+        The pending events: {name: [cycles, period]}, used in save states.
+        """
+        return {name: [entry[0], entry[3]] for name, entry in sorted(self.pending.items())}
+
+    def set_state(self, state):
+        self.clear()
+        for name, (cycles, period) in state.items():
+            self.schedule(name, cycles, period)
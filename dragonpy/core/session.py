@@ -0,0 +1,351 @@
+r"""
+    DragonPy - headless session
+    ===========================
+
+    Script a machine without any GUI, e.g. in CI or batch jobs:
+
+        session = Session(constants.DRAGON32)
+        session.type("PRINT 6*7\r")
+        session.run_until_text("OK")
+        print(session.get_screen_text())
+
+    Type a complete listing line by line, as fast as the ROM accepts it
+    (see: dragonpy.core.fast_type):
+
+        session.fast_type(listing)
+
+    The machine starts from the cached boot state (see: dragonpy.core.boot_cache)
+    and runs as fast as Python can via Machine.run()
+
+    Record a session and replay it bit-for-bit (see: dragonpy.core.input_record):
+
+        session = Session(constants.DRAGON32, record=True)
+        ...
+        recording = session.get_recording()
+        replayed = Session.replay(recording)
+        assert replayed.screen_hash() == recording.screen_hash
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+import logging
+import queue
+import re
+import time
+
+from dragonpy import constants
+from dragonpy.CoCo.config import CoCo2bCfg
+from dragonpy.CoCo.periphery_coco import CoCoPeriphery
+from dragonpy.core.fast_type import DEFAULT_MAX_WAIT_CYCLES, FastType
+from dragonpy.core.input_record import InputRecording, RecordingInputQueue, ReplayInputQueue
+from dragonpy.core.machine import Machine
+from dragonpy.Dragon32.config import Dragon32Cfg
+from dragonpy.Dragon32.periphery_dragon import Dragon32Periphery
+from dragonpy.Dragon32.vdg_screen import VDGScreen
+from dragonpy.Dragon64.config import Dragon64Cfg
+from dragonpy.Multicomp6809.config import Multicomp6809Cfg
+from dragonpy.Multicomp6809.periphery_Multicomp6809 import Multicomp6809Periphery
+from dragonpy.sbc09.config import SBC09Cfg
+from dragonpy.sbc09.periphery import SBC09Periphery
+from dragonpy.Simple6809.config import Simple6809Cfg
+from dragonpy.Simple6809.periphery_simple6809 import Simple6809Periphery
+
+
+log = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_CYCLES = 50000000  # Default cycle budget of Session.run_until_*()
+DEFAULT_RUN_CYCLES = 1000000  # run_headless() without a pattern: ~1 sec. of a 0.89 MHz Dragon
+
+
+class TerminalScreen:
+    """
+    Collect the serial (ACIA) output of sbc09, Simple6809 and Multicomp6809.
+    """
+
+    def __init__(self):
+        self.output = []
+        self.output_len = 0
+
+    def display_callback(self, char):
+        self.output.append(char)
+        self.output_len += 1
+
+    def add_to_input_queue(self, user_input_queue, txt):
+        txt = txt.replace("\r\n", "\r").replace("\n", "\r")
+        for char in txt:
+            user_input_queue.put(char)
+
+    def get_bytes(self, memory):
+        return "".join(self.output).encode("utf-8", errors="surrogateescape")
+
+    def get_lines(self, memory):
+        return self.get_text(memory).splitlines()
+
+    def get_text(self, memory, since=None):
+        """ All output, or only the output after the given get_mark() """
+        output = self.output[since:] if since else self.output
+        return "".join(output).replace("\r", "")
+
+    def get_mark(self):
+        return self.output_len
+
+    def clear(self, memory):
+        self.output.clear()
+        self.output_len = 0
+
+
+# Machine name -> (config class, periphery class, screen class)
+HEADLESS_MACHINES = {
+    constants.DRAGON32: (Dragon32Cfg, Dragon32Periphery, VDGScreen),
+    constants.DRAGON64: (Dragon64Cfg, Dragon32Periphery, VDGScreen),
+    constants.COCO2B: (CoCo2bCfg, CoCoPeriphery, VDGScreen),
+    constants.SBC09: (SBC09Cfg, SBC09Periphery, TerminalScreen),
+    constants.SIMPLE6809: (Simple6809Cfg, Simple6809Periphery, TerminalScreen),
+    constants.MULTICOMP6809: (Multicomp6809Cfg, Multicomp6809Periphery, TerminalScreen),
+}
+
+
+class Session:
+    """
+    A headless machine with a scriptable API.
+
+    >>> sorted(HEADLESS_MACHINES)
+    ['CoCo2b', 'Dragon32', 'Dragon64', 'Multicomp6809', 'Simple6809', 'sbc09']
+    >>> Session("Vectrex")
+    Traceback (most recent call last):
+    ...
+    ValueError: No headless support for 'Vectrex'
+    """
+
+    def __init__(
+        self, machine_name=constants.DRAGON32, cfg_dict=None, boot=True, record=False, replay_events=None,
+        cache_path=None,
+    ):
+        """
+        record: Record all input for a replay, see: get_recording()
+        replay_events: Recorded input to replay, see: Session.replay()
+        cache_path: Directory of the boot state cache, see: Machine.boot()
+        """
+        try:
+            ConfigClass, PeripheryClass, ScreenClass = HEADLESS_MACHINES[machine_name]
+        except KeyError:
+            raise ValueError(f"No headless support for {machine_name!r}")
+
+        cfg_dict = {
+            "verbosity": None,
+            "trace": False,
+            "max_ops": None,
+            **(cfg_dict or {}),
+        }
+        self.machine_name = machine_name
+        self.cfg = ConfigClass(cfg_dict)
+        self.screen = ScreenClass()
+        if record:
+            self.user_input_queue = RecordingInputQueue()
+        elif replay_events is not None:
+            self.user_input_queue = ReplayInputQueue(replay_events)
+        else:
+            self.user_input_queue = queue.Queue()
+        self.machine = Machine(
+            self.cfg,
+            PeripheryClass,
+            self.screen.display_callback,
+            self.user_input_queue,
+        )
+        self.cpu = self.machine.cpu
+        self.memory = self.cpu.memory
+        if record or replay_events is not None:
+            self.user_input_queue.attach(self.cpu)
+        if boot:
+            self.machine.boot(cache_path=cache_path)
+        self.record_state = self.machine.save_state() if record else None
+        if record and isinstance(self.screen, TerminalScreen):
+            # The terminal output is not in the machine state: A replay starts with an empty terminal, too
+            self.screen.clear(self.memory)
+
+    @classmethod
+    def replay(cls, recording, cfg_dict=None, run=True):
+        """
+        Create a session from a InputRecording: Restore the start state
+        and feed the recorded input at the recorded CPU cycles.
+        With run=True: run until the recorded end cycles.
+        """
+        session = cls(recording.machine_name, cfg_dict, boot=False, replay_events=recording.events)
+        session.machine.load_state(recording.state)
+        if run:
+            session.run_until_cycles(recording.end_cycles)
+        return session
+
+    def get_recording(self):
+        """
+        Returns a InputRecording of all input since the start of the session,
+        with the current CPU cycles and screen hash as expected result of a replay.
+        """
+        if self.record_state is None:
+            raise RuntimeError("Session is not recording!")
+        return InputRecording(
+            machine_name=self.machine_name,
+            state=self.record_state,
+            events=self.user_input_queue.events,
+            end_cycles=self.cycles,
+            screen_hash=self.screen_hash(),
+        )
+
+    @property
+    def cycles(self):
+        return self.cpu.cycles
+
+    @property
+    def program_counter(self):
+        return self.cpu.program_counter.value
+
+    def type(self, txt):
+        r"""
+        Send the text as keyboard input. Use "\r" or "\n" for ENTER.
+        """
+        self.screen.add_to_input_queue(self.user_input_queue, txt)
+
+    def fast_type(self, txt, wait_idle=True, max_wait_cycles=DEFAULT_MAX_WAIT_CYCLES):
+        """
+        Type the text line by line and run the machine until it accepted the last line,
+        see: dragonpy.core.fast_type
+        Returns False if the machine didn't accept a line within max_wait_cycles.
+        """
+        result = []
+        fast_type = FastType(self.machine, self.type, max_wait_cycles=max_wait_cycles)
+        fast_type.type(txt, on_done=result.append, wait_idle=wait_idle)
+        fast_type.run_until_done()
+        return bool(result) and result[0]
+
+    def input_consumed(self):
+        return self.user_input_queue.empty()
+
+    def run(self, max_cycles=None, until=None):
+        """ see: Machine.run() """
+        return self.machine.run(max_cycles=max_cycles, until=until)
+
+    def run_until_cycles(self, cycles):
+        """
+        Run until the CPU cycles counter reached the given value.
+        Stops at the first op boundary at or after it, so the end is reproducible.
+        """
+        if cycles > self.cpu.cycles:
+            self.machine.run(max_cycles=cycles - self.cpu.cycles)
+
+    def run_until_pc(self, address, max_cycles=DEFAULT_MAX_CYCLES):
+        """
+        Run until the program counter reached the address.
+        Returns False if the cycle budget ran out before.
+        """
+        return self.machine.run(max_cycles=max_cycles, until=address)
+
+    def run_until_text(self, pattern, max_cycles=DEFAULT_MAX_CYCLES):
+        """
+        Run until the regular expression pattern matches the screen text.
+        The pattern is checked only after all typed input is consumed.
+
+        On the text screen of Dragon/CoCo the complete screen is searched,
+        on a serial terminal only the output after the call.
+
+        Returns the re.Match object or None if the cycle budget ran out.
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
+        mark = self.screen.get_mark()
+        result = []
+
+        def until(machine):
+            if not self.input_consumed():
+                return False
+            match = pattern.search(self.screen.get_text(self.memory, since=mark))
+            if match is None:
+                return False
+            result.append(match)
+            return True
+
+        if self.machine.run(max_cycles=max_cycles, until=until):
+            return result[-1]
+        log.info("%r not found after %i cycles", pattern.pattern, max_cycles)
+        return None
+
+    def clear_screen(self):
+        """
+        Remove all old text from the screen, without the machine noticing it.
+        Useful before run_until_text() on a text screen.
+        """
+        self.screen.clear(self.memory)
+
+    def get_screen_lines(self):
+        return self.screen.get_lines(self.memory)
+
+    def get_screen_text(self):
+        return "\n".join(self.get_screen_lines())
+
+    def screen_hash(self):
+        """ SHA-1 hex digest of the screen content: video RAM or terminal output """
+        return hashlib.sha1(self.screen.get_bytes(self.memory)).hexdigest()
+
+    def save_screenshot(self, filepath):
+        """ Save the text screen as PNG (or PPM), see: VDGScreen.save_screenshot() """
+        save_screenshot = getattr(self.screen, "save_screenshot", None)
+        if save_screenshot is None:
+            raise RuntimeError(f"No screenshots of the {self.machine_name} serial terminal")
+        save_screenshot(filepath)
+
+    def read_memory(self, start, end):
+        """ Returns the memory $start-$end (excluded) as bytes, without side effects """
+        return self.memory.read_block(start, end)
+
+    def peek(self, address):
+        return self.memory.peek(address)
+
+    def peek_word(self, address):
+        return self.memory.peek_word(address)
+
+    def snapshot(self):
+        """ Returns a save state of the complete machine, see: dragonpy.core.save_state """
+        return self.machine.save_state()
+
+    def restore(self, data):
+        self.machine.load_state(data)
+        self.user_input_queue.queue.clear()
+
+
+def run_headless(
+    machine_name, cfg_dict, txt=None, until=None, max_cycles=None, record_filepath=None, cache_path=None
+):
+    """
+    Boot a machine, type the text and run until the screen pattern appears
+    or the cycle budget ran out. Returns (matched, screen text)
+    With record_filepath: Save a InputRecording of the session, see: replay_headless()
+    """
+    session = Session(machine_name, cfg_dict, record=bool(record_filepath), cache_path=cache_path)
+    if txt:
+        session.type(txt)
+    if until:
+        match = session.run_until_text(until, max_cycles=max_cycles or DEFAULT_MAX_CYCLES)
+        matched = match is not None
+    else:
+        session.run(max_cycles=max_cycles or DEFAULT_RUN_CYCLES)
+        matched = True
+
+    if record_filepath:
+        session.get_recording().save(record_filepath)
+    return matched, session.get_screen_text()
+
+
+def replay_headless(recording, cfg_dict=None):
+    """
+    Replay a InputRecording as fast as possible.
+    Returns the session, the emulated CPU cycles and the duration in seconds.
+    """
+    session = Session.replay(recording, cfg_dict, run=False)
+    start_cycles = session.cycles
+    start_time = time.perf_counter()
+    session.run_until_cycles(recording.end_cycles)
+    duration = time.perf_counter() - start_time
+    return session, session.cycles - start_cycles, duration
@@ -0,0 +1,102 @@
+"""
+    DragonPy - warp mode
+    ====================
+
+    Run the emulation as fast as Python can, without speed limit and without
+    any display update, until one of the stop conditions is met:
+
+        * The machine waits for a key press: The program counter reaches
+          the keyboard scan address and the user input queue is empty
+        * The screen changed (optional)
+        * The given number of CPU cycles are emulated (optional)
+        * stop() was called, e.g.: by the GUI on a key press
+
+    The GUI calls run() in chunks of max_duration seconds, so it can
+    handle Tk events between the chunks.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import time
+
+
+log = logging.getLogger(__name__)
+
+
+STOP_KEYBOARD_SCAN = "keyboard scan"
+STOP_SCREEN_CHANGE = "screen change"
+STOP_CYCLES = "cycle count"
+STOP_KEY_PRESS = "key press"
+
+
+class Warp:
+    # CPU cycles between two checks of the stop conditions
+    CHUNK_CYCLES = 20000
+
+    def __init__(self, machine, stop_address=None, screen_changed=None, max_cycles=None):
+        """
+        stop_address: keyboard scan address, e.g.: cfg.STARTUP_END_ADDR
+        screen_changed: callable that returns True if the screen content changed
+        max_cycles: stop after this many CPU cycles
+        """
+        self.machine = machine
+        self.stop_address = stop_address
+        self.screen_changed = screen_changed
+        self.max_cycles = max_cycles
+
+        self.start_cycles = machine.cpu.cycles
+        self.start_time = time.perf_counter()
+        self.stop_reason = None
+
+    @property
+    def cycles(self):
+        return self.machine.cpu.cycles - self.start_cycles
+
+    @property
+    def active(self):
+        return self.stop_reason is None
+
+    def stop(self, reason):
+        if self.stop_reason is None:
+            self.stop_reason = reason
+            duration = time.perf_counter() - self.start_time
+            log.info(
+                "Warp stopped by %s after %i cycles in %.2f sec.",
+                reason, self.cycles, duration
+            )
+
+    def _run_chunk(self, max_cycles):
+        machine = self.machine
+        if self.stop_address is None:
+            machine.run(max_cycles=max_cycles)
+            return
+
+        cpu = machine.cpu
+        if cpu.program_counter.value == self.stop_address:
+            cpu.get_and_call_next_op()  # Leave the address, otherwise run() returns directly
+        if machine.run(max_cycles=max_cycles, until=self.stop_address) and machine.user_input_queue.empty():
+            self.stop(STOP_KEYBOARD_SCAN)
+
+    def run(self, max_duration=0.1):
+        """
+        Run until a stop condition is met or max_duration seconds are elapsed.
+        Returns True if warp mode is still active.
+        """
+        end_time = time.perf_counter() + max_duration
+        while self.active and self.machine.cpu.running:
+            chunk_cycles = self.CHUNK_CYCLES
+            if self.max_cycles is not None:
+                chunk_cycles = min(chunk_cycles, self.max_cycles - self.cycles)
+                if chunk_cycles <= 0:
+                    self.stop(STOP_CYCLES)
+                    break
+
+            self._run_chunk(chunk_cycles)
+
+            if self.screen_changed is not None and self.screen_changed():
+                self.stop(STOP_SCREEN_CHANGE)
+            if time.perf_counter() >= end_time:
+                break
+        return self.active
@@ -12,7 +12,6 @@ from dragonlib.api import CoCoAPI
 
 from dragonpy import constants
 from dragonpy.core.configs import BaseConfig
-from dragonpy.sbc09.mem_info import get_sbc09_meminfo
 from dragonpy.sbc09.periphery import SBC09Periphery
 from dragonpy.sbc09.sbc09_rom import SBC09Rom
 
@@ -54,6 +53,8 @@ class SBC09Cfg(BaseConfig):
 
         self.machine_api = CoCoAPI()  # FIXME!
 
+        from dragonpy.sbc09.mem_info import get_sbc09_meminfo  # Big tables: import only if used
+
 #         if self.verbosity <= logging.INFO:
         self.mem_info = get_sbc09_meminfo()
 
@@ -12,13 +12,13 @@
 
 import logging
 
-from MC6809.core.memory_info import BaseMemoryInfo
+from dragonpy.core.mem_info_index import IndexedMemoryInfo
 
 
 log = logging.getLogger("DragonPy.sbc09.mem_info")
 
 
-class SBC09MemInfo(BaseMemoryInfo):
+class SBC09MemInfo(IndexedMemoryInfo):
     MEM_INFO = (
         # generated from "monitor.lst":
         (0xe400, 0xe400, "Disable interrupts."),
@@ -21,13 +21,6 @@ from dragonpy.components.periphery import ConsolePeripheryBase
 log = logging.getLogger(__name__)
 
 
-try:
-    import tkinter
-except ImportError:
-    log.critical("Error importing Tkinter!")
-    tkinter = None
-
-
 class SBC09Periphery:
     TITLE = "DragonPy - Buggy machine language monitor and rudimentary O.S. version 1.0"
     INITAL_INPUT = (
@@ -77,7 +70,9 @@ class SBC09Periphery:
         try:
             char = self.user_input_queue.get(block=False)
         except queue.Empty:
+            self.cpu.idle_detector.input_polled(cpu_cycles, empty=True)
             return 0x0
+        self.cpu.idle_detector.input_polled(cpu_cycles, empty=False)
 
         value = ord(char)
         log.error("%04x| (%i) read from ACIA-data, send back %r $%x",
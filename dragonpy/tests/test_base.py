@@ -17,12 +17,15 @@ import queue
 import sys
 import tempfile
 import time
+import unittest
 
 from dragonlib.tests.test_base import BaseTestCase
 from MC6809.components.cpu6809 import CPU
 
+from dragonpy import constants
 from dragonpy.components.memory import Memory
 from dragonpy.core.machine import Machine
+from dragonpy.core.session import Session
 from dragonpy.Dragon32.config import Dragon32Cfg
 from dragonpy.Dragon32.periphery_dragon import Dragon32PeripheryUnittest
 from dragonpy.sbc09.config import SBC09Cfg
@@ -381,7 +384,7 @@ class Test6809_Dragon32_Base(BaseCPUTestCase):
             ))
 
             # Check if machine is ready
-            output = cls.periphery.striped_output()[:5]
+            output = cls.periphery.screen.get_written_lines()[:5]
             assert output == [
                 '(C) 1982 DRAGON DATA LTD',
                 '16K BASIC INTERPRETER 1.0',
@@ -406,10 +409,12 @@ class Test6809_Dragon32_Base(BaseCPUTestCase):
         self.periphery.setUp()
 #        print "self.__init_state:", ;print_cpu_state_data(self.__init_state)
         self.cpu.set_state(self.__init_state)
+        self.periphery.screen.load(self.cpu.memory)  # The display RAM was restored directly
 #        print "self.cpu.get_state():", ;print_cpu_state_data(self.cpu.get_state())
 
     def _run_until_OK(self, OK_count=1, max_ops=5000):
         old_cycles = self.cpu.cycles
+        screen = self.periphery.screen
         existing_OK_count = 0
         for op_call_count in range(max_ops):
             try:
@@ -417,14 +422,13 @@ class Test6809_Dragon32_Base(BaseCPUTestCase):
             except Exception as err:
                 log.critical("Execute Error: %s", err)
                 cycles = self.cpu.cycles - old_cycles
-                return op_call_count, cycles, self.periphery.striped_output()
+                return op_call_count, cycles, screen.get_written_lines()
 
-            output_lines = self.periphery.output_lines
-            if output_lines[-1] == "OK":
+            if screen.last_line == "OK":
                 existing_OK_count += 1
             if existing_OK_count >= OK_count:
                 cycles = self.cpu.cycles - old_cycles
-                return op_call_count, cycles, self.periphery.striped_output()
+                return op_call_count, cycles, screen.get_written_lines()
 
         msg = "ERROR: Abort after %i op calls (%i cycles)" % (
             op_call_count, (self.cpu.cycles - old_cycles)
@@ -447,3 +451,33 @@ class Test6809_Dragon32_Base(BaseCPUTestCase):
             op_call_count, (self.cpu.cycles - old_cycles)
         )
         raise self.failureException(msg)
+
+# -----------------------------------------------------------------------------
+
+
+class BaseSessionTestCase(unittest.TestCase):
+    """
+    Headless sessions with a boot state cache in a temporary directory.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.temp_dir = tempfile.TemporaryDirectory(prefix="DragonPy_")
+        cls.cache_path = cls.temp_dir.name
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        super().tearDown()
+
+    def get_session(self, machine_name=constants.SBC09, **kwargs):
+        return Session(machine_name, cache_path=self.cache_path, **kwargs)
@@ -0,0 +1,72 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+
+from dragonpy import constants
+from dragonpy.core import batch
+
+
+class BatchTestCase(unittest.TestCase):
+    """
+    sbc09 is the only machine with a included ROM, but it has no BASIC:
+    Use the monitor command "r" (display registers) instead of "RUN"
+    """
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="DragonPy_")
+        self.cache_path = os.path.join(self.temp_dir.name, "cache")
+        self.basic_path = os.path.join(self.temp_dir.name, "basic")
+        os.makedirs(os.path.join(self.basic_path, "sub"))
+        self.filepaths = []
+        for filename in ("sub/b.bas", "a.bas", "not_basic.txt"):
+            filepath = os.path.join(self.basic_path, filename)
+            with open(filepath, "w") as f:
+                f.write('10 PRINT "HELLO"\n')
+            self.filepaths.append(filepath)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def test_iter_basic_files(self):
+        self.assertEqual(
+            list(batch.iter_basic_files([self.basic_path, self.filepaths[2]])),
+            [self.filepaths[1], self.filepaths[0], self.filepaths[2]],
+        )
+
+    def test_run_program(self):
+        batch.init_worker(constants.SBC09, cfg_dict=None, cache_path=self.cache_path)
+        self.assertEqual(len(os.listdir(self.cache_path)), 1)
+
+        result = batch.run_program(self.filepaths[0], max_cycles=100000, run_command="r\r", done_pattern="P=0400")
+        self.assertTrue(result["completed"])
+        self.assertIsNone(result["error"])
+        self.assertIn("X=0000 Y=0000", result["screen"])
+        self.assertLess(result["cycles"], 100000)
+
+        result = batch.run_program(self.filepaths[1], max_cycles=10000, run_command="r\r", done_pattern="never")
+        self.assertFalse(result["completed"])
+        self.assertGreaterEqual(result["cycles"], 10000)
+
+        result = batch.run_program("/does/not/exist.bas")
+        self.assertFalse(result["completed"])
+        self.assertIn("FileNotFoundError", result["error"])
+
+    def test_run_batch(self):
+        results = list(batch.run_batch(
+            constants.SBC09, self.filepaths[:2], max_cycles=100000, workers=2, cache_path=self.cache_path,
+            run_command="r\r", done_pattern="P=0400",
+        ))
+        self.assertEqual(len(os.listdir(self.cache_path)), 1)  # The workers used the given cache path
+        self.assertEqual([result["filepath"] for result in results], self.filepaths[:2])
+        self.assertEqual([result["completed"] for result in results], [True, True])
@@ -0,0 +1,101 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import queue
+import tempfile
+import unittest
+from unittest import mock
+
+from dragonpy.core import boot_cache
+from dragonpy.core.machine import Machine
+from dragonpy.sbc09.config import SBC09Cfg
+from dragonpy.sbc09.periphery import SBC09PeripheryUnittest
+from dragonpy.tests.test_base import BaseCPUTestCase
+from dragonpy.tests.test_save_state import change_state
+
+
+class BootCacheTestCase(unittest.TestCase):
+    def get_machine(self, **cfg_dict):
+        cfg = SBC09Cfg({**BaseCPUTestCase.UNITTEST_CFG_DICT, **cfg_dict})
+        machine = Machine(
+            cfg,
+            periphery_class=SBC09PeripheryUnittest,
+            display_callback=queue.Queue(),
+            user_input_queue=queue.Queue(),
+        )
+        machine.periphery.setUp()
+        return machine
+
+    def test_boot(self):
+        with tempfile.TemporaryDirectory(prefix="DragonPy_") as cache_path:
+            machine = self.get_machine()
+            self.assertFalse(boot_cache.boot(machine, cache_path=cache_path))
+            self.assertEqual(machine.periphery.output, "Welcome to BUGGY version 1.0\r\n")
+            self.assertEqual(machine.cpu.program_counter.value, machine.cfg.STARTUP_END_ADDR)
+            booted_state = machine.cpu.get_state()
+
+            filepath = boot_cache.get_cache_filepath(machine.cfg, cache_path)
+            self.assertEqual(os.listdir(cache_path), [os.path.basename(filepath)])
+
+            machine = self.get_machine()
+            self.assertTrue(boot_cache.boot(machine, cache_path=cache_path))
+            self.assertEqual(machine.periphery.output, "")  # ROM code was not executed
+            self.assertEqual(machine.cpu.get_state(), booted_state)
+
+            # A broken cache file will be replaced:
+            with open(filepath, "wb") as f:
+                f.write(b"foobar")
+            machine = self.get_machine()
+            self.assertFalse(boot_cache.boot(machine, cache_path=cache_path))
+            self.assertEqual(machine.cpu.get_state(), booted_state)
+            self.assertTrue(boot_cache.boot(self.get_machine(), cache_path=cache_path))
+
+            # A cache file with a broken device state will be deleted before the cold boot:
+            machine = self.get_machine()
+            cold_boot_state = machine.save_state()
+            with open(filepath, "rb") as f:
+                cached_state = f.read()
+            with open(filepath, "wb") as f:
+                f.write(change_state(cached_state, events={"foo": 1}))
+            with mock.patch.object(boot_cache, "cold_boot", side_effect=RuntimeError("stop")):
+                logging.disable(logging.CRITICAL)
+                try:
+                    self.assertFalse(boot_cache.boot(machine, cache_path=cache_path))
+                finally:
+                    logging.disable(logging.NOTSET)
+            self.assertEqual(os.listdir(cache_path), [])
+            self.assertEqual(machine.save_state(), cold_boot_state)
+
+    def test_boot_fails(self):
+        machine = self.get_machine()
+        machine.cfg.STARTUP_END_ADDR = 0xffff  # Never reached: the reset vector
+        start_state = machine.save_state()
+        with tempfile.TemporaryDirectory(prefix="DragonPy_") as cache_path:
+            logging.disable(logging.CRITICAL)
+            try:
+                with mock.patch.object(boot_cache, "BOOT_MAX_OPS", 1000):
+                    self.assertFalse(boot_cache.boot(machine, cache_path=cache_path))
+            finally:
+                logging.disable(logging.NOTSET)
+            self.assertEqual(os.listdir(cache_path), [])
+        self.assertEqual(machine.save_state(), start_state)  # Normal start without the cache
+
+    def test_cache_key(self):
+        cfg = SBC09Cfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        key = boot_cache.get_cache_key(cfg)
+        self.assertEqual(key, boot_cache.get_cache_key(SBC09Cfg(BaseCPUTestCase.UNITTEST_CFG_DICT)))
+
+        cfg.RAM_END = 0x3FFF
+        self.assertNotEqual(boot_cache.get_cache_key(cfg), key)
+
+    def test_disabled(self):
+        machine = self.get_machine(boot_cache=False)
+        self.assertFalse(machine.boot())
+        self.assertEqual(machine.periphery.output, "")
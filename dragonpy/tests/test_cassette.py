@@ -0,0 +1,379 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import contextlib
+import io
+import itertools
+import logging
+import os
+import queue
+import tempfile
+import unittest
+import wave
+
+from MC6809.components.cpu6809 import CPU
+
+from dragonpy.components.memory import Memory
+from dragonpy.Dragon32 import cassette_trap
+from dragonpy.Dragon32.cassette import CPU_CYCLES_PER_SEC, CassetteDeck, CasTape, WaveTape, open_tape
+from dragonpy.Dragon32.MC6821_PIA import PIA
+from dragonpy.tests.test_base import BaseCPUTestCase
+from dragonpy.tests.test_keyboard import PIATestCfg
+from dragonpy.tests.test_memory import MemoryTestCfg
+from PyDC.PyDC import wave2bitstream
+from PyDC.PyDC.configs import Dragon32Config
+
+
+PYDC_TEST_FILES = os.path.join(os.path.dirname(wave2bitstream.__file__), os.pardir, "test_files")
+
+# Leader, sync byte and a filename block of "HELLO", like on a real tape:
+CAS_DATA = b"\x55" * 16 + b"\x3c\x00\x05HELLO\x15\x55"
+
+
+def decode_levels(levels, framerate):
+    """
+    Decode the level stream like the ROM: Measure the full cycle time between
+    two rising edges, the short cycles are bits "1", the least significant bit first.
+    """
+    bits = []
+    last_rise = None
+    last_level = 0
+    for frame_no, level in enumerate(levels):
+        if level and not last_level:
+            if last_rise is not None:
+                hz = framerate / (frame_no - last_rise)
+                bits.append(1 if hz > 1600 else 0)
+            last_rise = frame_no
+        last_level = level
+    return bits
+
+
+def cas_block(block_type, data):
+    """ A block with leader and sync byte, as written by the ROM """
+    checksum = cassette_trap.block_checksum(block_type, data)
+    return b"\x55" * 16 + bytes((0x3c, block_type, len(data))) + data + bytes((checksum, 0x55))
+
+
+def bits2bytes(bits):
+    return bytes(
+        sum(bit << index for index, bit in enumerate(bits[start:start + 8]))
+        for start in range(0, len(bits) - 7, 8)
+    )
+
+
+class CassetteTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="DragonPy_")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def create_file(self, filename, data):
+        filepath = os.path.join(self.temp_dir.name, filename)
+        with open(filepath, "wb") as f:
+            f.write(data)
+        return filepath
+
+    def create_wav(self, filename, samplewidth, frames):
+        filepath = os.path.join(self.temp_dir.name, filename)
+        with wave.open(filepath, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(samplewidth)
+            wav.setframerate(22050)
+            wav.writeframes(frames)
+        return filepath
+
+    def test_wave_16bit(self):
+        values = (0, 1000, 32767, -1, -32768, 256, 0)
+        frames = b"".join(value.to_bytes(2, "little", signed=True) for value in values)
+        tape = WaveTape(self.create_wav("test.wav", 2, frames))
+        self.assertEqual((tape.framerate, tape.frame_count), (22050, len(values)))
+        self.assertEqual([tape.get_level(frame_no) for frame_no in range(9)], [0, 1, 1, 0, 0, 1, 0, 0, 0])
+        tape.close()
+
+    def test_wave_8bit(self):
+        tape = WaveTape(self.create_wav("test.wav", 1, bytes((0x80, 0xff, 0x81, 0x7f, 0x00))))
+        self.assertEqual([tape.get_level(frame_no) for frame_no in range(5)], [0, 1, 1, 0, 0])
+        tape.close()
+
+    def test_no_wave(self):
+        with self.assertRaises(ValueError):
+            WaveTape(self.create_file("test.wav", b"RIFF\x00\x00\x00\x00AVI "))
+        with self.assertRaises(ValueError):
+            open_tape(self.create_file("test.mp3", b""))
+
+    def test_cas_synthesis(self):
+        tape = CasTape(self.create_file("test.cas", CAS_DATA))
+        tape.CHUNK_SIZE = 3  # Many chunks
+        levels = bytes(tape.get_level(frame_no) for frame_no in range(len(CAS_DATA) * 8 * 20 + 100))
+        self.assertEqual(levels[-100:], bytes(100))  # End of tape
+
+        bits = decode_levels(levels, tape.framerate)
+        self.assertEqual(bits2bytes(bits), CAS_DATA[:-1])
+
+        self.assertEqual(tape.get_level(0), 1)  # Rewound
+        self.assertEqual(tape.chunk_start, 0)
+        tape.close()
+
+    def test_deck(self):
+        deck = CassetteDeck()
+        deck.insert(CasTape(self.create_file("test.cas", CAS_DATA)))
+        self.assertEqual(deck.read_bit(100), 0)  # Motor off
+
+        deck.set_motor(1000, 0x3c)
+        cycles = 1000 + (CPU_CYCLES_PER_SEC // 22050 + 1) * 5  # 5th frame
+        self.assertEqual(deck.get_frame(cycles), 5)
+        deck.set_motor(cycles, 0x34)
+        self.assertEqual(deck.get_frame(50000), 5)  # The tape stopped
+
+        deck.set_motor(100000, 0x3c)
+        self.assertEqual(deck.get_frame(100000), 5)  # ...and moves on at the same position
+        state = deck.get_state()
+
+        deck.rewind()
+        self.assertEqual(deck.get_frame(100000), 0)
+        deck.set_state(state)
+        self.assertEqual(deck.get_frame(100000), 5)
+        deck.eject()
+        self.assertIsNone(deck.tape)
+
+
+class PIACassetteTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="DragonPy_")
+        cfg = PIATestCfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        self.memory = Memory(cfg)
+        self.cpu = CPU(self.memory, cfg)
+        self.pia = PIA(cfg, self.cpu, self.memory, queue.Queue())
+
+        filepath = os.path.join(self.temp_dir.name, "test.cas")
+        with open(filepath, "wb") as f:
+            f.write(CAS_DATA)
+        self.pia.cassette.insert(CasTape(filepath))
+
+    def tearDown(self):
+        self.pia.cassette.eject()
+        self.temp_dir.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def test_cload_signal(self):
+        self.assertEqual(self.memory.read_byte(0xff20), 0)  # Motor off: No signal
+
+        self.memory.write_byte(0xff21, 0x3c)  # Motor on, like the ROM
+        self.assertTrue(self.pia.cassette.motor)
+
+        # Sample the input bit like the ROM: Every few CPU cycles
+        levels = []
+        for __ in range(len(CAS_DATA) * 8 * 20 * 40):
+            self.cpu.cycles += 40 - 1
+            levels.append(self.memory.read_byte(0xff20) & 0x01)
+        bits = decode_levels(levels, framerate=CPU_CYCLES_PER_SEC / 40)
+        self.assertEqual(bits2bytes(bits), CAS_DATA[:-1])
+
+        self.memory.write_byte(0xff21, 0x34)  # Motor off
+        self.assertFalse(self.pia.cassette.motor)
+        self.assertEqual(self.memory.read_byte(0xff21), 0x34)
+
+        self.memory.write_byte(0xff21, 0xfc)  # The IRQ flags are read only
+        self.assertEqual(self.memory.read_byte(0xff21), 0x3c)
+
+    def test_state(self):
+        self.memory.write_byte(0xff21, 0x3c)
+        state = self.pia.get_state()
+        self.pia.reset()
+        self.assertFalse(self.pia.cassette.motor)
+        self.assertEqual(self.memory.read_byte(0xff21), 0x00)
+        self.pia.set_state(state)
+        self.assertTrue(self.pia.cassette.motor)
+        self.assertEqual(self.memory.read_byte(0xff21), 0x3c)
+
+
+class TrapTestCfg(MemoryTestCfg):
+    # The "ROM routines" of the test: LDA #$99 ; RTS
+    CASSETTE_READ_LEADER_ADDR = 0x8000
+    CASSETTE_READ_BLOCK_ADDR = 0x8010
+    CASSETTE_WRITE_LEADER_ADDR = 0x8020
+    CASSETTE_WRITE_BLOCK_ADDR = 0x8030
+
+
+class CassetteTrapTestCase(unittest.TestCase):
+    FILENAME_BLOCK = b"HELLO   " + bytes((0x02, 0x00, 0x00, 0x40, 0x00, 0x40, 0x00))  # Binary file
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="DragonPy_")
+        self.cfg = TrapTestCfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        self.memory = Memory(self.cfg)
+        self.cpu = CPU(self.memory, self.cfg)
+        for address in range(0x8000, 0x8040, 0x10):
+            self.memory.load(address, b"\x86\x99\x39")
+        self.trap = cassette_trap.CassetteTrap(self.cfg, self.cpu, self.memory)
+
+        self.cas_filepath = os.path.join(self.temp_dir.name, "test.cas")
+        with open(self.cas_filepath, "wb") as f:
+            f.write(cas_block(0x00, self.FILENAME_BLOCK) + cas_block(0x01, b"\x12\x34\x56") + cas_block(0xff, b""))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def call(self, address):
+        """ JSR to the address, like the BASIC ROM """
+        self.memory.load(0x4000, bytes((0xbd, address >> 8, address & 0xff, 0x12)))  # JSR address ; NOP
+        self.cpu.system_stack_pointer.set(0x3000)
+        self.cpu.program_counter.set(0x4000)
+        for __ in range(100):
+            self.cpu.get_and_call_next_op()
+            if self.cpu.program_counter.value == 0x4003:
+                return self.cpu.accu_a.value
+        self.fail("No return from subroutine")
+
+    def test_cload(self):
+        self.trap.insert(self.cas_filepath)
+        self.assertEqual(self.trap.blocks_left, 3)
+        self.memory.poke_word(cassette_trap.CBUFAD_ADDR, 0x1000)
+
+        self.cpu.I = 0
+        self.call(self.cfg.CASSETTE_READ_LEADER_ADDR)
+        self.assertEqual(self.cpu.I, 1)  # Interrupts masked, like the ROM
+
+        self.assertEqual(self.call(self.cfg.CASSETTE_READ_BLOCK_ADDR), cassette_trap.STATUS_OK)
+        self.assertEqual(self.memory.read_block(0x1000, 0x100f), self.FILENAME_BLOCK)
+
+        self.assertEqual(self.call(self.cfg.CASSETTE_READ_BLOCK_ADDR), cassette_trap.STATUS_OK)
+        self.assertEqual(self.cpu.Z, 1)
+        self.assertEqual(self.memory.read_block(0x1000, 0x1003), b"\x12\x34\x56")
+        self.assertEqual(self.cpu.index_x.value, 0x1003)
+        self.assertEqual(
+            self.memory.read_block(cassette_trap.BLKTYP_ADDR, cassette_trap.CSRERR_ADDR + 1),
+            b"\x01\x03\x10\x00\xa0\x00",  # type, length, buffer address, checksum, status
+        )
+
+        self.call(self.cfg.CASSETTE_READ_BLOCK_ADDR)
+        self.assertEqual(self.memory.peek(cassette_trap.BLKTYP_ADDR), 0xff)
+
+        # All blocks read: The ROM routines are called
+        self.assertEqual(self.call(self.cfg.CASSETTE_READ_LEADER_ADDR), 0x99)
+        self.assertEqual(self.call(self.cfg.CASSETTE_READ_BLOCK_ADDR), 0x99)
+
+        self.trap.rewind()
+        self.assertEqual(self.trap.blocks_left, 3)
+
+    def test_no_ram(self):
+        self.trap.insert(self.cas_filepath)
+        self.memory.poke_word(cassette_trap.CBUFAD_ADDR, 0x9000)  # ROM
+        self.assertEqual(self.call(self.cfg.CASSETTE_READ_BLOCK_ADDR), cassette_trap.STATUS_NO_RAM)
+        self.assertEqual(self.cpu.Z, 0)
+        self.assertEqual(self.memory.peek(cassette_trap.CSRERR_ADDR), cassette_trap.STATUS_NO_RAM)
+
+    def test_only_opcode_fetch(self):
+        self.trap.insert(self.cas_filepath)
+        self.assertEqual(self.memory.read_byte(self.cfg.CASSETTE_READ_BLOCK_ADDR), 0x86)  # Data read
+        self.assertEqual(self.trap.blocks_left, 3)
+
+    def test_bad_tape(self):
+        silent_filepath = os.path.join(self.temp_dir.name, "silent.wav")
+        with wave.open(silent_filepath, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(22050)
+            wav.writeframes(bytes(2 * 22050))
+        no_wave_filepath = os.path.join(self.temp_dir.name, "no_wave.wav")
+        with open(no_wave_filepath, "wb") as f:
+            f.write(b"RIFF\x00\x00\x00\x00AVI ")
+        empty_filepath = os.path.join(self.temp_dir.name, "empty.cas")
+        open(empty_filepath, "wb").close()
+
+        for filepath in (silent_filepath, no_wave_filepath, empty_filepath):
+            with self.subTest(filepath=filepath), contextlib.redirect_stdout(io.StringIO()):
+                with self.assertRaises(ValueError):
+                    self.trap.insert(filepath)
+
+    def test_no_tape(self):
+        self.assertEqual(self.call(self.cfg.CASSETTE_READ_BLOCK_ADDR), 0x99)
+        self.assertEqual(self.call(self.cfg.CASSETTE_WRITE_BLOCK_ADDR), 0x99)  # CSAVE is not captured
+
+    def test_csave(self):
+        save_filepath = os.path.join(self.temp_dir.name, "saved.cas")
+        self.trap.save_to(save_filepath)
+
+        def write_block(block_type, data):
+            self.memory.write_block(0x1000, data)
+            self.memory.poke(cassette_trap.BLKTYP_ADDR, block_type)
+            self.memory.poke(cassette_trap.BLKLEN_ADDR, len(data))
+            self.memory.poke_word(cassette_trap.CBUFAD_ADDR, 0x1000)
+            self.call(self.cfg.CASSETTE_WRITE_BLOCK_ADDR)
+
+        self.call(self.cfg.CASSETTE_WRITE_LEADER_ADDR)
+        write_block(0x00, self.FILENAME_BLOCK)
+        write_block(0x01, b"\x12\x34\x56")
+        self.assertFalse(os.path.exists(save_filepath))
+        write_block(0xff, b"")
+        self.assertEqual(self.memory.peek(cassette_trap.CCKSUM_ADDR), 0xff)
+
+        # Load the saved tape:
+        self.trap.insert(save_filepath)
+        self.assertEqual(
+            [(block_type, data) for file_obj, block_type, data in self.trap.tape.blocks],
+            [(0x00, self.FILENAME_BLOCK), (0x01, b"\x12\x34\x56"), (0xff, b"")],
+        )
+        self.assertEqual(self.trap.tape.files[0].filename, "HELLO")
+
+
+class Wave2BitstreamTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def get_bitstream(self, filename, use_numpy, avg_count=0):
+        cfg = Dragon32Config()
+        cfg.AVG_COUNT = avg_count
+        filepath = os.path.join(PYDC_TEST_FILES, filename)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return wave2bitstream.Wave2Bitstream(filepath, cfg, use_numpy=use_numpy)
+
+    def get_bits(self, filename, use_numpy, avg_count=0):
+        bitstream = self.get_bitstream(filename, use_numpy, avg_count)
+        with contextlib.redirect_stdout(io.StringIO()):
+            bitstream.sync(32)
+            bits = list(itertools.islice(bitstream, 500))
+            bitstream.sync(32)  # Consumes half sinus cycles between two bits
+            bits += list(bitstream)
+        return bits
+
+    def test_8bit_wave(self):
+        bits = self.get_bits("HelloWorld1 xroar.wav", use_numpy=False)
+        self.assertTrue(any(b'"HELLO WORLD!"' in bits2bytes(bits[offset:]) for offset in range(8)))
+
+        bitstream = self.get_bitstream("HelloWorld1 xroar.wav", use_numpy=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            statistics = bitstream._get_statistics(128)
+        self.assertEqual(statistics, {10: 17, 11: 44, 12: 4, 19: 5, 20: 44, 21: 15})
+
+    @unittest.skipIf(wave2bitstream.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        for filename, avg_count in (("HelloWorld1 xroar.wav", 0), ("LineNumber Test 01.wav", 2)):
+            with self.subTest(filename=filename, avg_count=avg_count):
+                self.assertEqual(
+                    self.get_bits(filename, use_numpy=True, avg_count=avg_count),
+                    self.get_bits(filename, use_numpy=False, avg_count=avg_count),
+                )
+
+        bitstream = self.get_bitstream("HelloWorld1 xroar.wav", use_numpy=True)
+        bitstream.half_sinus = True
+        with contextlib.redirect_stdout(io.StringIO()):
+            statistics = bitstream._get_statistics()
+        bitstream = self.get_bitstream("HelloWorld1 xroar.wav", use_numpy=False)
+        bitstream.half_sinus = True
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(statistics, bitstream._get_statistics())
@@ -0,0 +1,110 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import queue
+import unittest
+from unittest import mock
+
+from dragonpy.core.fast_type import FastType
+from dragonpy.core.idle import IdleDetector
+from dragonpy.tests.test_base import BaseSessionTestCase
+
+
+class FakeMachine:
+    """
+    Consumes one key per poll, every CHUNK_CYCLES.
+    With `busy` set: Never polls the input, e.g.: a running BASIC program.
+    """
+
+    def __init__(self):
+        self.cpu = mock.Mock(cycles=0, running=True)
+        self.user_input_queue = queue.Queue()
+        self.idle_detector = IdleDetector()
+        self.busy = False
+        self.received = ""
+
+    def run(self, max_cycles, until):
+        for __ in range(IdleDetector.MIN_POLLS):
+            self.cpu.cycles += 100
+            if self.busy:
+                continue
+            try:
+                char = self.user_input_queue.get_nowait()
+            except queue.Empty:
+                self.idle_detector.input_polled(self.cpu.cycles, empty=True)
+            else:
+                self.received += char
+                self.idle_detector.input_polled(self.cpu.cycles, empty=False)
+
+
+class FastTypeTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.machine = FakeMachine()
+        self.fast_type = FastType(self.machine, self.add_input, max_wait_cycles=10000)
+        self.typed = []
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def add_input(self, txt):
+        self.typed.append(txt)
+        for char in txt:
+            self.machine.user_input_queue.put(char)
+
+    def test_line_by_line(self):
+        results = []
+        self.fast_type.type("10 A\n20 B\n", on_done=results.append)
+        self.fast_type.type("RUN\n", on_done=results.append, wait_idle=False)
+        self.assertEqual(self.fast_type.line_count, 3)
+
+        self.fast_type.step()  # The machine is not idle yet
+        self.assertEqual(self.typed, [])
+
+        self.fast_type.run_until_done()
+        self.assertEqual(self.typed, ["10 A\r", "20 B\r", "RUN\r"])
+        self.assertEqual(self.machine.received, "10 A\r20 B\rRUN\r")
+        self.assertEqual(results, [True, True])
+        self.assertFalse(self.fast_type.active)
+
+    def test_backpressure(self):
+        self.fast_type.type("1\n2\n")
+        self.machine.run(None, None)  # idle
+        self.fast_type.step()
+        self.assertEqual(self.typed, ["1\r"])
+        self.machine.busy = True
+        self.machine.run(None, None)
+        self.fast_type.step()
+        self.assertEqual(self.typed, ["1\r"])  # Waits for the machine
+
+        self.machine.busy = False
+        self.fast_type.run_until_done()
+        self.assertEqual(self.machine.received, "1\r2\r")
+
+    def test_cancel(self):
+        results = []
+        self.machine.busy = True
+        self.fast_type.type("1\n2\n", on_done=results.append)
+        self.fast_type.run_until_done()
+        self.assertEqual(results, [False])
+        self.assertEqual(self.typed, [])
+        self.assertGreater(self.machine.cpu.cycles, 10000)
+
+    def test_empty_text(self):
+        results = []
+        self.fast_type.type("", on_done=results.append)
+        self.assertEqual(results, [True])
+        self.assertFalse(self.fast_type.active)
+
+
+class SessionFastTypeTestCase(BaseSessionTestCase):
+    def test_sbc09_monitor(self):
+        session = self.get_session()
+        self.assertTrue(session.fast_type("r\nr\nr\n"))
+        self.assertEqual(session.get_screen_text().count("P=0400"), 3)
@@ -0,0 +1,50 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import time
+
+from dragonpy.tests.test_base import BaseSessionTestCase
+
+
+class IdleTestCase(BaseSessionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = self.get_session()
+        self.machine = self.session.machine
+
+    def test_skip_idle(self):
+        # The sbc09 monitor polls the ACIA data register:
+        start_time = time.perf_counter()
+        self.machine.run(max_cycles=10000000, skip_idle=True)
+        self.assertLess(time.perf_counter() - start_time, 1)
+        self.assertGreater(self.machine.idle_cycles, 9900000)
+
+        # Input is processed normally:
+        idle_cycles = self.machine.idle_cycles
+        self.session.type("r\n")
+        self.machine.run(max_cycles=100000, skip_idle=True)
+        self.assertIn("P=0400", self.session.get_screen_text())
+        self.assertTrue(self.session.input_consumed())
+        self.assertGreater(self.machine.idle_cycles, idle_cycles)  # Idle again after the output
+
+    def test_device_events(self):
+        calls = []
+        scheduler = self.machine.scheduler
+        scheduler.add_event("test.tick", calls.append)
+        start_cycles = self.session.cycles
+        scheduler.schedule("test.tick", start_cycles + 10000, period=10000)
+
+        self.machine.run(max_cycles=1000000, skip_idle=True)
+        self.assertGreater(self.machine.idle_cycles, 0)
+        # Every event is dispatched at its exact cycles:
+        self.assertEqual(calls, list(range(start_cycles + 10000, self.session.cycles + 1, 10000)))
+
+    def test_without_skip_idle(self):
+        self.machine.run(max_cycles=100000)
+        self.assertTrue(self.machine.idle_detector.idle)
+        self.assertEqual(self.machine.idle_cycles, 0)
@@ -0,0 +1,84 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    Guard the import time: `python -X importtime` lists all imported modules.
+    The headless core and the CLI must not import tkinter or the big
+    machine specific tables.
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import subprocess
+import sys
+import unittest
+
+from dragonpy import constants
+from dragonpy.core.configs import machine_dict
+
+
+def get_import_times(module_name):
+    """
+    Import the module in a fresh interpreter.
+    Returns a dict: imported module name -> cumulative import time in microseconds
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        __, cumulative, name = line.split("|")
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    def assert_not_imported(self, module_name, forbidden):
+        import_times = get_import_times(module_name)
+        self.assertIn(module_name, import_times)
+        imported = sorted(
+            name for name in import_times
+            if any(name == prefix or name.startswith(f"{prefix}.") or name.endswith(prefix) for prefix in forbidden)
+        )
+        self.assertEqual(imported, [], f"'import {module_name}' imports: {imported}")
+
+    def test_dragonpy(self):
+        self.assert_not_imported(
+            "dragonpy",
+            forbidden=(
+                "tkinter", "mem_info", "dragonpy.core.machine",
+                "dragonpy.Dragon32", "dragonpy.Dragon64", "dragonpy.CoCo", "dragonpy.sbc09",
+                "dragonpy.Simple6809", "dragonpy.Multicomp6809", "dragonpy.vectrex",
+            ),
+        )
+
+    def test_headless_core(self):
+        self.assert_not_imported("dragonpy.core.session", forbidden=("tkinter", "mem_info", "dragon_font"))
+
+    def test_cli(self):
+        self.assert_not_imported("dragonpy.cli_app", forbidden=("tkinter", "mem_info", "dragon_font"))
+
+
+class MachineDictTestCase(unittest.TestCase):
+    def test_lazy_entry_points(self):
+        self.assertEqual(
+            sorted(machine_dict),
+            sorted((
+                constants.DRAGON32, constants.DRAGON64, constants.COCO2B, constants.SBC09,
+                constants.SIMPLE6809, constants.MULTICOMP6809, constants.VECTREX,
+            )),
+        )
+        self.assertEqual(machine_dict.DEFAULT, constants.DRAGON32)
+
+        run_func, ConfigClass = machine_dict[constants.SBC09]
+        self.assertEqual(run_func.__name__, "run_sbc09")
+        self.assertEqual(ConfigClass.CONFIG_NAME, constants.SBC09)
+        self.assertIs(machine_dict[constants.SBC09][1], ConfigClass)
@@ -0,0 +1,77 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import contextlib
+import io
+import os
+from pathlib import Path
+from unittest import mock
+
+from dragonpy.cli_app import replay as replay_cli
+from dragonpy.core import session as session_module
+from dragonpy.core.input_record import InputRecording
+from dragonpy.core.session import Session
+from dragonpy.tests.test_base import BaseSessionTestCase
+
+
+class InputRecordTestCase(BaseSessionTestCase):
+    def record_session(self):
+        session = self.get_session(record=True)
+        # Irregular run chunks, like a GUI with a wall clock based speed limit:
+        for chunk_cycles in (1234, 50000, 777):
+            session.run(max_cycles=chunk_cycles)
+        session.type("r\r")
+        self.assertIsNotNone(session.run_until_text("P=0400", max_cycles=500000))
+        session.run(max_cycles=3333)
+        session.type("ss\r")
+        session.run(max_cycles=200000)
+        return session.get_recording()
+
+    def test_replay(self):
+        recording = self.record_session()
+        self.assertEqual(len(recording.events), 5)
+        self.assertEqual([event[2] for event in recording.events], list("r\rss\r"))
+
+        session = Session.replay(recording)
+        self.assertEqual(session.cycles, recording.end_cycles)
+        self.assertEqual(session.screen_hash(), recording.screen_hash)
+        self.assertIn("P=0400", session.get_screen_text())
+        self.assertTrue(session.user_input_queue.finished)
+
+        # Other run chunks result in the same machine state:
+        chunked = Session.replay(recording, run=False)
+        while chunked.cycles < recording.end_cycles:
+            chunked.run_until_cycles(min(chunked.cycles + 4321, recording.end_cycles))
+        self.assertEqual(chunked.cycles, recording.end_cycles)
+        self.assertEqual(chunked.screen_hash(), recording.screen_hash)
+        self.assertEqual(chunked.snapshot(), session.snapshot())
+
+    def test_save_load(self):
+        recording = self.record_session()
+        filepath = os.path.join(self.temp_dir.name, "session.json")
+        recording.save(filepath)
+        self.assertEqual(InputRecording.load(filepath), recording)
+
+    def test_cli_replay_zero_duration(self):
+        filepath = os.path.join(self.temp_dir.name, "empty.json")
+        self.get_session(record=True).get_recording().save(filepath)
+
+        def replay_headless(recording, cfg_dict=None):
+            session, cycles, duration = session_module.replay_headless(recording, cfg_dict=cfg_dict)
+            return session, cycles, 0.0  # A too short recording for the timer
+
+        stdout = io.StringIO()
+        with mock.patch.object(replay_cli, "replay_headless", replay_headless), contextlib.redirect_stdout(stdout):
+            replay_cli.replay(Path(filepath), verbosity=0)
+        self.assertIn("0 input events, 0 cycles in 0.00 sec.\n", stdout.getvalue())
+        self.assertNotIn("MHz", stdout.getvalue())
+
+    def test_not_recording(self):
+        session = self.get_session()
+        with self.assertRaises(RuntimeError):
+            session.get_recording()
@@ -0,0 +1,205 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import queue
+import unittest
+
+from MC6809.components.cpu6809 import CPU
+
+from dragonpy import constants
+from dragonpy.CoCo.config import CoCo2bCfg
+from dragonpy.components.memory import Memory
+from dragonpy.core.idle import IdleDetector
+from dragonpy.core.session import Session
+from dragonpy.Dragon32.keyboard_map import COCO_KEYMAP, DRAGON_KEYMAP, KeyMatrix, get_dragon_keymatrix_pia_result
+from dragonpy.Dragon32.MC6821_PIA import PIA
+from dragonpy.tests.test_base import BaseCPUTestCase
+from dragonpy.tests.test_memory import MemoryTestCfg
+
+
+class PIATestCfg(MemoryTestCfg):
+    PIA0B_KEYBOARD_START = 0x00
+    KEYMAP = DRAGON_KEYMAP
+
+
+class CoCoPIATestCfg(MemoryTestCfg):
+    PIA0B_KEYBOARD_START = 0xfe  # The CoCo scan starts with the column 0 strobe
+    KEYMAP = COCO_KEYMAP
+
+
+class KeyMatrixTestCase(unittest.TestCase):
+    def test_tables_match_single_key_results(self):
+        matrix = KeyMatrix(DRAGON_KEYMAP)
+        for inkey in ("A", "Z", "0", "@", "\r", " ", "!"):
+            matrix.key_down(inkey)
+            for pia0b in range(0x100):
+                self.assertEqual(matrix.read(pia0b), get_dragon_keymatrix_pia_result(inkey, pia0b))
+            matrix.key_up(inkey)
+            self.assertEqual(matrix.read(0x00), 0xff)
+
+    def test_simultaneous_keys(self):
+        matrix = KeyMatrix(COCO_KEYMAP)
+        matrix.key_down("A")
+        matrix.key_down("B")
+        both = matrix.table
+        matrix.key_up("A")
+        self.assertEqual(matrix.pressed_keys, ["B"])
+        matrix.key_down("A")
+        self.assertIs(matrix.table, both)  # Cached: No new table for a known combination
+
+    def test_unknown_key(self):
+        logging.disable(logging.CRITICAL)
+        try:
+            matrix = KeyMatrix(DRAGON_KEYMAP)
+            self.assertFalse(matrix.key_down("\x00"))
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(matrix.pressed_keys, [])
+
+
+class PIAKeyboardTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        cfg = PIATestCfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        self.memory = Memory(cfg)
+        self.cpu = CPU(self.memory, cfg)
+        self.cpu.idle_detector = IdleDetector()
+        self.user_input_queue = queue.Queue()
+        self.pia = PIA(cfg, self.cpu, self.memory, self.user_input_queue)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def scan(self):
+        """ Like the ROM: Start a keyboard scan and return the rows of all columns """
+        self.memory.write_byte(0xff02, 0x00)
+        self.memory.read_byte(0xff00)
+        return [self.pia.key_matrix.read(0xff ^ (1 << column)) for column in range(8)]
+
+    def test_typed_key(self):
+        empty = self.scan()
+        self.user_input_queue.put("A")
+        pressed = self.scan()
+        self.assertNotEqual(pressed, empty)
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["A"])
+        self.assertEqual(self.scan(), empty)  # Released with the next scan
+
+    def test_other_row_without_gap(self):
+        for inkey in "AP":  # "A": row 2, "P": row 4
+            self.user_input_queue.put(inkey)
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["A"])
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["P"])
+
+    def test_same_row_gap(self):
+        for inkey in "AB":  # Both in row 2
+            self.user_input_queue.put(inkey)
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["A"])
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, [])
+        self.assertEqual(self.pia.pending_key, "B")
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["B"])
+
+    def test_held_key(self):
+        self.pia.key_down("Q")
+        self.user_input_queue.put("A")
+        self.scan()
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["Q"])  # Typed keys don't release held keys
+        self.pia.key_up("Q")
+        self.assertEqual(self.pia.key_matrix.read(0x00), 0xff)
+
+    def test_state(self):
+        for inkey in "AB":
+            self.user_input_queue.put(inkey)
+        self.scan()
+        state = self.pia.get_state()
+        self.pia.internal_reset()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, [])
+
+        self.pia.set_state(state)
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["A"])
+        self.scan()
+        self.assertEqual(self.pia.pending_key, "B")
+
+    def test_strobe_reread(self):
+        self.user_input_queue.put("A")
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["A"])
+        self.memory.read_byte(0xff00)  # Same strobe, no new scan: The key stays pressed
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["A"])
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, [])
+
+
+class CoCoPIAKeyboardTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        cfg = CoCoPIATestCfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        self.memory = Memory(cfg)
+        self.cpu = CPU(self.memory, cfg)
+        self.cpu.idle_detector = IdleDetector()
+        self.user_input_queue = queue.Queue()
+        self.pia = PIA(cfg, self.cpu, self.memory, self.user_input_queue)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def scan(self, debounce_column=None):
+        """
+        Like the CoCo ROM: Strobe all columns, starting with column 0.
+        Re-read one column after a key change (debounce).
+        """
+        for column in range(8):
+            self.memory.write_byte(0xff02, 0xff ^ (1 << column))
+            self.memory.read_byte(0xff00)
+            if column == debounce_column:
+                self.memory.read_byte(0xff00)
+
+    def test_column_0_reread(self):
+        for inkey in "HX":  # Both in column 0, in different rows
+            self.user_input_queue.put(inkey)
+        self.scan(debounce_column=0)
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["H"])  # The debounce read didn't type "X"
+        self.scan(debounce_column=0)
+        self.assertEqual(self.pia.key_matrix.pressed_keys, ["X"])
+        self.scan()
+        self.assertEqual(self.pia.key_matrix.pressed_keys, [])
+        self.assertTrue(self.user_input_queue.empty())
+
+
+class CoCoTypingTestCase(unittest.TestCase):
+    """
+    Type into the CoCo Color BASIC: Needs the CoCo ROMs.
+    """
+    @classmethod
+    def setUpClass(cls):
+        for rom in CoCo2bCfg.DEFAULT_ROMS:
+            # No downloads in tests, see: dragonpy.tests.utils.no_http_requests()
+            if not (os.path.isfile(rom.rom_path) or os.path.isfile(rom.archive_path)):
+                raise unittest.SkipTest(f"CoCo ROM {rom.FILENAME!r} not in {rom.ROM_PATH!r}")
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.session = Session(constants.COCO2B)
+        self.assertIsNotNone(self.session.run_until_text(r"(?m)^OK$", max_cycles=20000000))
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_type_line(self):
+        self.session.clear_screen()
+        # Doubled keys, keys in column 0 and in the same row:
+        self.session.type('PRINT "HH@@PX08 ABBA"\r')
+        self.assertIsNotNone(self.session.run_until_text(r"(?m)^HH@@PX08 ABBA$", max_cycles=20000000))
+        self.assertIn('PRINT "HH@@PX08 ABBA"', self.session.get_screen_lines())
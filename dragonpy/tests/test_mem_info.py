@@ -0,0 +1,66 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from MC6809.core.memory_info import BaseMemoryInfo
+
+from dragonpy.core import mem_info_index
+from dragonpy.Dragon32.mem_info import DragonMemInfo
+from dragonpy.Dragon64.mem_info import Dragon64MemInfo
+from dragonpy.sbc09.mem_info import SBC09MemInfo
+from dragonpy.Simple6809.mem_info import Simple6809MemInfo
+from dragonpy.vectrex.mem_info import VectrexMemInfo
+
+
+class MemInfoIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="DragonPy_")
+        patches = (
+            mock.patch.object(mem_info_index, "MEM_INFO_CACHE_PATH", self.temp_dir.name),
+            mock.patch.object(mem_info_index, "_tables", {}),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def test_same_as_linear_scan(self):
+        for MemInfoClass in (DragonMemInfo, Dragon64MemInfo, SBC09MemInfo, Simple6809MemInfo, VectrexMemInfo):
+            with self.subTest(MemInfoClass.__name__):
+                mem_info = MemInfoClass(mock.Mock())
+                addresses = set()
+                for start, end, __ in MemInfoClass.MEM_INFO:
+                    addresses.update((start - 1, start, end, end + 1))
+                for address in sorted(addresses):
+                    if 0 <= address <= 0xffff:
+                        self.assertEqual(
+                            mem_info.get_shortest(address),
+                            BaseMemoryInfo.get_shortest(mem_info, address),
+                        )
+
+    def test_disk_cache(self):
+        table = mem_info_index.get_shortest_table(SBC09MemInfo.MEM_INFO)
+        filepath = mem_info_index.get_cache_filepath(SBC09MemInfo.MEM_INFO)
+        self.assertTrue(os.path.isfile(filepath))
+
+        with mock.patch.object(mem_info_index, "build_shortest_table") as build:
+            self.assertEqual(mem_info_index.get_shortest_table(SBC09MemInfo.MEM_INFO), table)
+            build.assert_not_called()
+
+        with open(filepath, "wb") as f:
+            f.write(b"corrupt")
+        self.assertEqual(mem_info_index.get_shortest_table(SBC09MemInfo.MEM_INFO), table)
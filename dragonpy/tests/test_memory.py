@@ -0,0 +1,214 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import unittest
+from unittest import mock
+
+from MC6809.components.cpu6809 import CPU
+
+from dragonpy.components.memory import MAIN_BANK, PAGE_IO, PAGE_RAM, PAGE_ROM, Memory
+from dragonpy.Dragon32.MC6883_SAM import SAM, UPPER_RAM_BANK
+from dragonpy.tests.test_base import BaseCPUTestCase
+from dragonpy.tests.test_config import TestCfg
+
+
+class MemoryTestCfg(TestCfg):
+    ROM_START = 0x8000
+    ROM_END = 0xFF7F  # $ff00 page is only partly ROM
+
+    UPPER_RAM_SIZE = 0x8000
+
+
+class BaseMemoryTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        cfg = MemoryTestCfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        self.memory = Memory(cfg)
+        self.cpu = CPU(self.memory, cfg)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+
+class MemoryPageTableTestCase(BaseMemoryTestCase):
+    def test_page_types(self):
+        self.assertEqual(self.memory.page_types[0x00], PAGE_RAM)
+        self.assertEqual(self.memory.page_types[0x7f], PAGE_RAM)
+        self.assertEqual(self.memory.page_types[0x80], PAGE_ROM)
+        self.assertEqual(self.memory.page_types[0xfe], PAGE_ROM)
+        self.assertEqual(self.memory.page_types[0xff], PAGE_IO)
+
+        self.memory.add_read_byte_callback(lambda cycles, op_address, address: 0x12, 0x0400)
+        self.assertEqual(self.memory.page_types[0x04], PAGE_IO)
+        self.assertEqual(self.memory.page_types[0x05], PAGE_RAM)
+
+    def test_ram(self):
+        self.memory.write_byte(0x1234, 0xab)
+        self.assertEqual(self.memory.read_byte(0x1234), 0xab)
+        self.assertEqual(self.memory._mem[0x1234], 0xab)
+        self.assertEqual(self.cpu.cycles, 2)
+
+        self.memory.write_word(0x2000, 0x1234)
+        self.assertEqual(self.memory.read_word(0x2000), 0x1234)
+
+    def test_outside_address(self):
+        with mock.patch("dragonpy.components.memory.log") as log_mock:
+            self.assertEqual(self.memory.read_byte(0x10000), 0x00)
+            self.memory.write_byte(0x10000, 0x12)
+        self.assertEqual(log_mock.warning.call_count, 2)
+
+    def test_rom_write_ignored(self):
+        self.memory.load(0x8000, [0x01, 0x02])
+        self.memory.write_byte(0x8000, 0xff)
+        self.assertEqual(self.memory.read_byte(0x8000), 0x01)
+
+        # partly ROM page:
+        self.memory.write_byte(0xff7f, 0xff)
+        self.assertEqual(self.memory.read_byte(0xff7f), 0x00)
+        self.memory.write_byte(0xff80, 0xff)
+        self.assertEqual(self.memory.read_byte(0xff80), 0xff)
+
+    def test_hooked_page(self):
+        calls = []
+
+        def read_callback(cpu_cycles, op_address, address):
+            calls.append(("read", address))
+            return 0x42
+
+        def write_middleware(cpu_cycles, op_address, address, value):
+            calls.append(("write", address, value))
+            return value + 1
+
+        self.memory.add_read_byte_callback(read_callback, 0x0400)
+        self.memory.add_write_byte_middleware(write_middleware, 0x0401, 0x0402)
+
+        self.assertEqual(self.memory.read_byte(0x0400), 0x42)
+        self.memory.write_byte(0x0401, 0x10)
+        self.assertEqual(self.memory.read_byte(0x0401), 0x11)  # same page, not hooked for read
+        self.memory.write_byte(0x0403, 0x20)  # same page, not hooked for write
+        self.assertEqual(self.memory.read_byte(0x0403), 0x20)
+
+        self.assertEqual(calls, [("read", 0x0400), ("write", 0x0401, 0x10)])
+
+
+class MemoryBlockAccessTestCase(BaseMemoryTestCase):
+    def test_no_side_effects(self):
+        calls = []
+
+        def read_callback(cpu_cycles, op_address, address):
+            calls.append(address)
+            return 0x42
+
+        self.memory.add_read_byte_callback(read_callback, 0xff80, 0xffff)
+        self.memory.poke(0xff80, 0x12)
+        self.memory.poke_word(0xff81, 0x3456)
+        self.assertEqual(self.memory.peek(0xff80), 0x12)
+        self.assertEqual(self.memory.peek_word(0xff81), 0x3456)
+        self.assertEqual(self.memory.read_block(0xff80, 0xff84), b"\x12\x34\x56\x00")
+        self.assertEqual(self.memory.get(0xff80, 0xff82), [0x12, 0x34])
+        self.assertEqual(calls, [])
+        self.assertEqual(self.cpu.cycles, 0)
+
+    def test_write_block_over_pages(self):
+        data = bytes(range(256)) * 3
+        self.memory.write_block(0x10f0, data)
+        self.assertEqual(self.memory.read_block(0x10f0, 0x10f0 + len(data)), data)
+        self.assertEqual(self.memory._mem[0x10f0:0x10f0 + len(data)].tobytes(), data)
+
+        # ROM write protection is bypassed:
+        self.memory.load(0xfffe, [0xab, 0xcd])
+        self.assertEqual(self.memory.read_word(0xfffe), 0xabcd)
+
+    def test_fill_and_copy(self):
+        self.memory.fill(0x0200, 0x0400, 0xaa)
+        self.assertEqual(self.memory.read_block(0x01ff, 0x0401), b"\x00" + b"\xaa" * 0x200 + b"\x00")
+
+        self.memory.write_block(0x1000, b"ABCDEF")
+        self.memory.copy(0x1000, 0x1004, 0x1002)  # overlapping
+        self.assertEqual(self.memory.read_block(0x1000, 0x1006), b"ABABCD")
+
+    def test_errors(self):
+        with self.assertRaises(OverflowError):
+            self.memory.load(0x1000, [0x01, 0x100])
+        with self.assertRaises(IndexError):
+            self.memory.write_block(0xffff, b"\x01\x02")
+        with self.assertRaises(IndexError):
+            self.memory.read_block(0xfff0, 0x10001)
+
+    def test_get_dump(self):
+        self.memory.write_block(0x0010, b"\x01\xff")
+        self.assertEqual(
+            self.memory.get_dump(0x0010, 0x0012),
+            [
+                "$0010: $01 (dez: 1)      | >>mem info not active<<",
+                "$0011: $ff (dez: 255)    | >>mem info not active<<",
+            ],
+        )
+
+
+class MemoryBankTestCase(BaseMemoryTestCase):
+    def test_map_bank(self):
+        self.memory.add_bank("bank", 0x1000)
+        self.memory.write_byte(0x1000, 0x01)
+        self.memory.load(0x8000, [0x02])
+
+        self.memory.map_bank(0x1000, 0x1fff, "bank", bank_offset=0x0000)
+        self.memory.map_bank(0x8000, 0x80ff, "bank", bank_offset=0x0100)
+        self.assertEqual(self.memory.page_types[0x80], PAGE_RAM)
+        self.assertEqual(self.memory.read_byte(0x1000), 0x00)
+        self.assertEqual(self.memory.read_byte(0x8000), 0x00)
+        self.memory.write_byte(0x1000, 0x11)
+        self.memory.write_byte(0x8000, 0x22)
+        self.assertEqual(self.memory.read_block(0x8000, 0x8001), b"\x22")
+        self.assertEqual(self.memory.peek_bank("bank", 0x0000), 0x11)
+        self.assertEqual(self.memory.peek_bank("bank", 0x0100), 0x22)
+
+        self.memory.map_bank(0x1000, 0x1fff)
+        self.memory.map_bank(0x8000, 0x80ff)
+        self.assertEqual(self.memory.page_types[0x80], PAGE_ROM)
+        self.assertEqual(self.memory.read_byte(0x1000), 0x01)
+        self.assertEqual(self.memory.read_byte(0x8000), 0x02)
+        self.memory.write_byte(0x8000, 0x33)  # ROM write protection is active again
+        self.assertEqual(self.memory.read_byte(0x8000), 0x02)
+
+    def test_sam_dragon64_banking(self):
+        sam = SAM(self.memory.cfg, mock.Mock(), self.memory)
+        self.memory.write_byte(0x0000, 0x01)
+        self.memory.load(0x8000, [0x02])
+        self.memory.load(0xbffe, [0xab, 0xcd])
+
+        self.memory.write_byte(0xffd5, 0)  # set page bit: upper 32KB RAM at $0000
+        self.assertEqual(sam.page_bit, 1)
+        self.assertEqual(self.memory.read_byte(0x0000), 0x00)
+        self.memory.write_byte(0x0000, 0x03)
+        self.assertEqual(self.memory.peek_bank(UPPER_RAM_BANK, 0x0000), 0x03)
+
+        self.memory.write_byte(0xffdf, 0)  # set map type: all RAM
+        self.assertEqual(sam.map_type, 1)
+        self.assertEqual(self.memory.read_byte(0x0000), 0x01)
+        self.assertEqual(self.memory.read_byte(0x8000), 0x03)
+        self.memory.write_byte(0x8000, 0x04)
+        self.assertEqual(self.memory.peek_bank(UPPER_RAM_BANK, 0x0000), 0x04)
+        self.assertEqual(self.memory.peek_bank(MAIN_BANK, 0x8000), 0x02)
+        self.assertEqual(self.memory.read_word(0xfffe), 0xabcd)  # vectors are always from ROM
+
+        sam.reset()
+        self.assertEqual(sam.register, 0x0000)
+        self.assertEqual(self.memory.read_byte(0x0000), 0x01)
+        self.assertEqual(self.memory.read_byte(0x8000), 0x02)
+
+    def test_sam_register(self):
+        sam = SAM(self.memory.cfg, mock.Mock(), self.memory)
+        self.memory.write_byte(0xffc1, 0)  # V0
+        self.memory.write_byte(0xffc5, 0)  # V2
+        self.memory.write_byte(0xffc9, 0)  # F1
+        self.assertEqual(sam.vdg_mode, 0b101)
+        self.assertEqual(sam.display_offset, 0x0400)
+        self.memory.write_byte(0xffc4, 0)  # V2
+        self.assertEqual(sam.vdg_mode, 0b001)
@@ -0,0 +1,76 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from dragonpy.core.frame_clock import FRAME_CYCLES
+from dragonpy.core.rewind import SNAPSHOT_OVERHEAD, RewindBuffer
+from dragonpy.tests.test_base import BaseSessionTestCase
+
+
+class RewindTestCase(BaseSessionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = self.get_session()
+        self.machine = self.session.machine
+        self.rewind_buffer = RewindBuffer(self.machine, interval_frames=1)
+
+    def run_frames(self, count):
+        states = []
+        for __ in range(count):
+            self.rewind_buffer.snapshot()
+            states.append(self.machine.save_state())
+            self.machine.run_frame()
+        return states
+
+    def test_update(self):
+        self.assertTrue(self.rewind_buffer.update())  # The first snapshot
+        self.assertFalse(self.rewind_buffer.update())
+        self.machine.run(max_cycles=FRAME_CYCLES // 2)
+        self.assertFalse(self.rewind_buffer.update())
+        self.machine.run(max_cycles=FRAME_CYCLES // 2)
+        self.assertTrue(self.rewind_buffer.update())
+        self.assertEqual(len(self.rewind_buffer), 2)
+
+    def test_rewind(self):
+        states = []
+        for no in range(5):
+            self.session.cpu.memory.write_block(0x2000, b"frame %i" % no)
+            self.session.type("r\n")
+            states += self.run_frames(2)
+        self.assertEqual(len(self.rewind_buffer), 10)
+
+        cycles = self.rewind_buffer.rewind(steps=3)
+        self.assertEqual(self.machine.save_state(), states[7])
+        self.assertEqual(cycles, self.session.cycles)
+        self.assertEqual(self.session.read_memory(0x2000, 0x2007), b"frame 3")
+        self.assertEqual(len(self.rewind_buffer), 8)
+
+        self.rewind_buffer.rewind(steps=1)  # The same snapshot again
+        self.assertEqual(self.machine.save_state(), states[7])
+
+        self.rewind_buffer.rewind(steps=100)  # Only back to the oldest snapshot
+        self.assertEqual(self.machine.save_state(), states[0])
+        self.assertEqual(len(self.rewind_buffer), 1)
+
+        # Go on after rewind:
+        self.session.type("r\n")
+        self.assertIsNotNone(self.session.run_until_text("P=0400", max_cycles=FRAME_CYCLES * 10))
+
+    def test_delta_size(self):
+        self.run_frames(10)
+        # Without changes in the memory: only the small header per snapshot
+        self.assertLess(self.rewind_buffer.size, 10 * (SNAPSHOT_OVERHEAD + 1024))
+
+    def test_max_bytes(self):
+        self.rewind_buffer.max_bytes = 5 * SNAPSHOT_OVERHEAD
+        states = self.run_frames(10)
+        self.assertLess(len(self.rewind_buffer), 5)
+        self.assertLessEqual(self.rewind_buffer.size, self.rewind_buffer.max_bytes)
+        oldest = 10 - len(self.rewind_buffer)
+        self.rewind_buffer.rewind(steps=100)
+        self.assertEqual(self.machine.save_state(), states[oldest])
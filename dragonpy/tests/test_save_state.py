@@ -0,0 +1,91 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import json
+import time
+import zlib
+
+from dragonpy.core.save_state import JSON_LENGTH, STATE_HEADER, STATE_MAGIC
+from dragonpy.tests.test_base import Test6809_sbc09_Base
+
+
+def change_state(state, page_data=None, **header_changes):
+    """
+    Returns the save state with changed JSON header entries and/or page data
+    """
+    payload = zlib.decompress(state[STATE_HEADER.size:])
+    (json_length,) = JSON_LENGTH.unpack_from(payload)
+    offset = JSON_LENGTH.size + json_length
+    header = json.loads(payload[JSON_LENGTH.size:offset])
+    header.update(header_changes)
+    if page_data is None:
+        page_data = payload[offset:]
+    json_header = json.dumps(header).encode("utf-8")
+    payload = b"".join((JSON_LENGTH.pack(len(json_header)), json_header, page_data))
+    return state[:STATE_HEADER.size] + zlib.compress(payload)
+
+
+class SaveStateTestCase(Test6809_sbc09_Base):
+    def _run_dump(self):
+        self.periphery.setUp()
+        self.periphery.add_to_input_queue("DE5E2,20\r")
+        __, __, output = self._run_until_newlines(newline_count=3, max_ops=100000)
+        return self.cpu.cycles, output
+
+    def test_round_trip(self):
+        self.cpu.memory.write_block(0x2000, b"DragonPy")
+
+        start_time = time.perf_counter()
+        state = self.machine.save_state()
+        self.assertLess(time.perf_counter() - start_time, 0.5)
+        self.assertTrue(state.startswith(STATE_MAGIC))
+        self.assertLess(len(state), 0x4000)  # ROM and zero pages are not stored
+
+        registers = self.cpu.get_state()
+        first_run = self._run_dump()
+
+        self.cpu.memory.fill(0x0000, 0xe000, 0xff)  # Destroy the RAM
+        self.cpu.program_counter.set(0x0000)
+
+        start_time = time.perf_counter()
+        self.machine.load_state(state)
+        self.assertLess(time.perf_counter() - start_time, 0.5)
+        self.assertEqual(self.cpu.get_state(), registers)
+        self.assertEqual(self.cpu.memory.read_block(0x2000, 0x2008), b"DragonPy")
+
+        self.assertEqual(self._run_dump(), first_run)
+
+    def test_invalid_data(self):
+        with self.assertRaisesRegex(ValueError, "not a DragonPy save state"):
+            self.machine.load_state(b"foobar")
+
+        with self.assertRaisesRegex(ValueError, "not a DragonPy save state"):
+            self.machine.load_state(STATE_MAGIC + b"\x00")  # truncated header
+
+        self.cpu.memory.write_block(0x2000, b"DragonPy")
+        state = self.machine.save_state()
+        with self.assertRaisesRegex(ValueError, "corrupt"):
+            self.machine.load_state(state[:-10])
+
+        self.cpu.memory.write_block(0x2000, b"Changed!")
+        self.cpu.program_counter.set(0x1234)
+        current_state = self.machine.save_state()
+        broken_states = (
+            state[:STATE_HEADER.size] + zlib.compress(b"\x00"),  # truncated JSON length
+            change_state(state, page_data=b"\x00" * 10),  # wrong payload length
+            change_state(state, cpu={"pc": 0}),  # missing CPU registers
+            change_state(state, pages=[["main", 0x1234]]),  # unknown page
+            change_state(state, pages=None),
+        )
+        for broken_state in broken_states:
+            with self.assertRaisesRegex(ValueError, "corrupt"):
+                self.machine.load_state(broken_state)
+        self.assertEqual(self.machine.save_state(), current_state)  # The machine is unchanged
+
+        with self.assertRaisesRegex(ValueError, "device state"):
+            self.machine.load_state(change_state(state, events={"foo": 1}))
@@ -0,0 +1,84 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import unittest
+from unittest import mock
+
+from dragonpy.core.scheduler import EventScheduler
+from dragonpy.tests.test_base import Test6809_sbc09_Base
+from dragonpy.vectrex.MOS6522 import MOS6522VIA
+
+
+class MachineSchedulerTestCase(Test6809_sbc09_Base):
+    def test_run_dispatch(self):
+        calls = []
+        scheduler = self.machine.scheduler
+        scheduler.add_event("test.tick", calls.append)
+        start_cycles = self.cpu.cycles
+        scheduler.schedule("test.tick", start_cycles + 1000, period=1000)
+
+        self.machine.run(max_cycles=10500)
+        # All due events are called once, with their exact cycles:
+        self.assertEqual(calls, list(range(start_cycles + 1000, self.cpu.cycles + 1, 1000)))
+        self.assertGreaterEqual(len(calls), 10)
+
+    def test_save_state(self):
+        scheduler = self.machine.scheduler
+        scheduler.add_event("test.timer", mock.Mock())
+        scheduler.schedule("test.timer", self.cpu.cycles + 5000)
+        state = self.machine.save_state()
+
+        scheduler.cancel("test.timer")
+        self.machine.load_state(state)
+        self.assertEqual(scheduler.remaining_cycles("test.timer", self.cpu.cycles), 5000)
+
+
+class MOS6522TimerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cpu = mock.Mock(cycles=1000, scheduler=EventScheduler())
+        self.via = MOS6522VIA(mock.Mock(), self.cpu, mock.Mock())
+        self.via.write8(0xd00e, 0xff)  # enable all interrupts
+
+    def run_cycles(self, cycles):
+        self.cpu.cycles += cycles
+        self.cpu.scheduler.run_due(self.cpu.cycles)
+
+    def test_t1_one_shot(self):
+        self.via.write8(0xd004, 0x00)
+        self.via.write8(0xd005, 0x01)  # start T1 with $0100
+        self.run_cycles(0x40)
+        self.assertEqual(self.via.read8(0xd005), 0x00)
+        self.assertEqual(self.via.read8(0xd00d) & 0x40, 0x00)
+        self.cpu.irq.assert_not_called()
+
+        self.run_cycles(0xc1)
+        self.assertEqual(self.via.read8(0xd00d), 0xc0)  # T1 flag + IRQ
+        self.cpu.irq.assert_called_once_with()
+
+        self.run_cycles(0x1000)  # one shot: no second IRQ
+        self.cpu.irq.assert_called_once_with()
+
+    def test_t1_free_run(self):
+        self.via.write8(0xd00b, 0x40)  # ACR: T1 free-run mode
+        self.via.write8(0xd004, 0x0f)
+        self.via.write8(0xd005, 0x00)  # start T1 with $000f
+        self.run_cycles(16 * 5)
+        self.assertEqual(self.cpu.irq.call_count, 5)
+
+    def test_t2(self):
+        self.via.write8(0xd008, 0x20)
+        self.via.write8(0xd009, 0x00)  # start T2 with $0020
+        self.via.update_counters()
+        self.assertEqual(self.via.via_t2c, 0x20)
+        self.run_cycles(0x10)
+        self.assertEqual(self.via.read8(0xd009), 0x00)
+        self.run_cycles(0x11)
+        self.assertEqual(self.via.read8(0xd00d), 0xa0)  # T2 flag + IRQ
+
+        self.via.reset()
+        self.assertFalse(self.cpu.scheduler.is_pending(MOS6522VIA.T2_EVENT))
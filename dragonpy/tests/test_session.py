@@ -0,0 +1,82 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+from dragonpy import constants
+from dragonpy.core.frame_clock import FRAME_CYCLES
+from dragonpy.core.session import run_headless
+from dragonpy.tests.test_base import BaseSessionTestCase
+
+
+class SessionTestCase(BaseSessionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = self.get_session()
+
+    def test_booted(self):
+        self.assertEqual(self.session.program_counter, self.session.cfg.STARTUP_END_ADDR)
+
+    def test_no_terminal_screenshot(self):
+        with self.assertRaises(RuntimeError):
+            self.session.save_screenshot("not_saved.png")
+
+    def test_run_until_text(self):
+        self.session.type("r\n")
+        match = self.session.run_until_text(r"P=([0-9A-F]{4})", max_cycles=1000000)
+        self.assertIsNotNone(match)
+        self.assertEqual(match.group(1), "0400")
+        self.assertIn("X=0000 Y=0000", self.session.get_screen_text())
+
+        self.assertIsNone(self.session.run_until_text("never printed", max_cycles=10000))
+
+    def test_run_max_cycles(self):
+        start_cycles = self.session.cycles
+        self.assertFalse(self.session.run(max_cycles=10000))
+        cycles = self.session.cycles - start_cycles
+        self.assertGreaterEqual(cycles, 10000)
+        self.assertLess(cycles, 10000 + 100 * 20)  # max. one burst more
+
+    def test_run_frame(self):
+        machine = self.session.machine
+        start_cycles = self.session.cycles
+        for __ in range(10):
+            machine.run_frame()
+        cycles = self.session.cycles - start_cycles
+        # The overshoot of every frame is subtracted from the next one:
+        self.assertGreaterEqual(cycles, 10 * FRAME_CYCLES)
+        self.assertLess(cycles, 10 * FRAME_CYCLES + 100 * 20)
+
+    def test_run_until_pc(self):
+        self.session.run(max_cycles=1000)
+        self.assertTrue(self.session.run_until_pc(self.session.cfg.STARTUP_END_ADDR, max_cycles=100000))
+        self.assertEqual(self.session.program_counter, self.session.cfg.STARTUP_END_ADDR)
+
+        self.assertFalse(self.session.run_until_pc(0x7000, max_cycles=10000))
+
+    def test_memory_and_snapshot(self):
+        self.session.memory.write_block(0x2000, b"\x12\x34")
+        self.assertEqual(self.session.read_memory(0x2000, 0x2002), b"\x12\x34")
+        self.assertEqual(self.session.peek_word(0x2000), 0x1234)
+
+        snapshot = self.session.snapshot()
+        cycles = self.session.cycles
+        self.session.type("r\n")
+        self.session.run(max_cycles=100000)
+        self.session.memory.poke(0x2000, 0xff)
+
+        self.session.restore(snapshot)
+        self.assertEqual(self.session.cycles, cycles)
+        self.assertEqual(self.session.peek(0x2000), 0x12)
+        self.assertTrue(self.session.input_consumed())
+
+    def test_run_headless(self):
+        matched, screen_text = run_headless(
+            constants.SBC09, cfg_dict={}, txt="r\n", until="P=0400", max_cycles=1000000,
+            cache_path=self.cache_path,
+        )
+        self.assertTrue(matched)
+        self.assertIn("X=0000", screen_text)
@@ -0,0 +1,289 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import queue
+import struct
+import tempfile
+import unittest
+
+from MC6809.components.cpu6809 import CPU
+
+from dragonpy.components.memory import Memory
+from dragonpy.core.scheduler import EventScheduler
+from dragonpy.Dragon32 import vdg
+from dragonpy.Dragon32.dragon_charmap import get_charmap_dict
+from dragonpy.Dragon32.dragon_font import CHARS_DICT
+from dragonpy.Dragon32.MC6821_PIA import PIA
+from dragonpy.Dragon32.MC6883_SAM import SAM
+from dragonpy.Dragon32.vdg_screen import VDGScreen
+from dragonpy.tests.test_base import BaseCPUTestCase
+from dragonpy.tests.test_keyboard import PIATestCfg
+from dragonpy.tests.test_memory import MemoryTestCfg
+
+
+GREEN, YELLOW, BLUE, RED, BUFF, CYAN, MAGENTA, ORANGE = vdg.PALETTE
+
+
+class VDGRendererTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        cfg = PIATestCfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        self.memory = Memory(cfg)
+        self.cpu = CPU(self.memory, cfg)
+        self.cpu.scheduler = EventScheduler()
+        self.sam = SAM(cfg, self.cpu, self.memory)
+        self.pia = PIA(cfg, self.cpu, self.memory, queue.Queue())
+        self.renderer = vdg.VDGRenderer(CHARS_DICT, get_charmap_dict())
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def set_sam_bits(self, first_bit, count, value):
+        """ Like the ROM: write to the even (clear) or odd (set) SAM address of every bit """
+        for bit in range(count):
+            address = 0xffc0 + (first_bit + bit) * 2 + ((value >> bit) & 1)
+            self.memory.write_byte(address, 0x00)
+
+    def set_mode(self, sam_mode, vdg_bits, display_offset):
+        self.set_sam_bits(0, 3, sam_mode)  # V0-V2
+        self.set_sam_bits(3, 7, display_offset // 512)  # F0-F6
+        self.memory.write_byte(0xff22, vdg_bits)
+
+    def update(self):
+        return self.renderer.update(self.memory, self.sam.display_offset, self.sam.vdg_mode, self.pia.vdg_mode_bits)
+
+    def test_registers(self):
+        self.set_mode(6, 0xf8, display_offset=0x0e00)  # PMODE 4, SCREEN 1,1
+        self.assertEqual(self.sam.vdg_mode, 6)
+        self.assertEqual(self.sam.display_offset, 0x0e00)
+        self.assertEqual(self.pia.vdg_mode_bits, 0xf8)
+        self.assertEqual(vdg.get_mode_name(self.pia.vdg_mode_bits), "RG6")
+
+        self.memory.write_byte(0xff22, 0x07)  # The other PIA bits are not VDG pins
+        self.assertEqual(self.pia.vdg_mode_bits, 0x00)
+
+    def test_text_mode(self):
+        self.set_mode(0, 0x00, display_offset=0x0400)
+        self.memory.write_byte(0x0400, 0x41)  # "A" top left
+        self.assertEqual(self.update(), [(0, 192, 0, 256)])
+
+        dark, bright = vdg.ALPHA_COLORS[0]
+        self.assertEqual(self.renderer.get_pixel(0, 0), bright)  # Background
+        self.assertEqual(self.renderer.get_pixel(4, 3), dark)  # Top of the "A"
+
+        self.memory.write_byte(0x0400 + 15 * 32 + 31, 0x42)  # Bottom right
+        self.assertEqual(self.update(), [(180, 192, 248, 256)])  # Only the changed cell
+        self.assertEqual(self.update(), [])
+
+        # All cells between the first and the last changed one:
+        self.memory.write_byte(0x0400 + 32 * 2 + 3, 0x43)
+        self.memory.write_byte(0x0400 + 32 * 2 + 5, 0x44)
+        self.assertEqual(self.update(), [(24, 36, 24, 48)])
+        self.assertEqual(self.renderer.get_pixel(4, 24 + 3), bright)  # Unchanged first cell
+
+    def test_changed_cells(self):
+        self.set_mode(0, 0x00, display_offset=0x0400)
+        self.memory.write_block(0x0400, bytes(range(0x40, 0x60)) * 16)
+        self.update()
+        full_renderer = vdg.VDGRenderer(CHARS_DICT, get_charmap_dict())
+
+        self.memory.write_byte(0x0400 + 32 * 5 + 10, 0x80)
+        self.memory.write_byte(0x0400 + 32 * 6 + 20, 0x81)
+        self.memory.write_byte(0x0400 + 32 * 9 + 31, 0x82)
+        self.assertEqual(self.update(), [(60, 84, 80, 168), (108, 120, 248, 256)])
+        full_renderer.update(self.memory, 0x0400, 0, 0)
+        self.assertEqual(self.renderer.get_ppm(), full_renderer.get_ppm())
+
+        self.assertEqual(
+            self.renderer.get_ppm(60, 84, 80, 168),
+            b"P6 88 24 255\n" + b"".join(
+                bytes(self.renderer.framebuffer[line * vdg.LINE_SIZE + 80 * 3:line * vdg.LINE_SIZE + 168 * 3])
+                for line in range(60, 84)
+            ),
+        )
+
+    def test_css_changes_colors(self):
+        self.set_mode(0, 0x00, display_offset=0x0400)
+        self.update()
+        self.memory.write_byte(0xff22, vdg.VDG_CSS)
+        self.assertEqual(self.update(), [(0, 192, 0, 256)])
+        self.assertEqual(self.renderer.get_pixel(0, 0), vdg.ALPHA_COLORS[1][0])  # Background of the inverted "@"
+
+    def test_semigraphics(self):
+        self.set_mode(0, 0x00, display_offset=0x0400)
+        self.memory.write_byte(0x0400, 0b10111001)  # SG4: red, upper left and lower right
+        self.update()
+        self.assertEqual(self.renderer.get_pixel(0, 0), RED)
+        self.assertEqual(self.renderer.get_pixel(4, 0), vdg.BLACK)
+        self.assertEqual(self.renderer.get_pixel(0, 6), vdg.BLACK)
+        self.assertEqual(self.renderer.get_pixel(7, 11), RED)
+
+        self.memory.write_byte(0xff22, vdg.VDG_GM0 | vdg.VDG_CSS)  # SG6, color set 1
+        self.memory.write_byte(0x0400, 0b11000100)  # orange, middle right block
+        self.update()
+        self.assertEqual(self.renderer.get_pixel(4, 3), vdg.BLACK)
+        self.assertEqual(self.renderer.get_pixel(4, 4), ORANGE)
+        self.assertEqual(self.renderer.get_pixel(0, 4), vdg.BLACK)
+        self.assertEqual(self.renderer.get_pixel(4, 8), vdg.BLACK)
+
+    def test_semigraphics_8(self):
+        # SAM graphics mode with VDG text mode: Every memory row is displayed 3 scanlines
+        self.set_mode(2, 0x00, display_offset=0x0400)
+        self.memory.write_block(0x0400, b"\x80" * 32 * 64)  # SG4: black
+        self.memory.write_byte(0x0400 + 32 * 4, 0b10001000)  # 5th memory row: green, left top block
+        self.update()
+        self.assertEqual(self.renderer.get_pixel(0, 11), vdg.BLACK)
+        self.assertEqual(self.renderer.get_pixel(0, 12), GREEN)
+        self.assertEqual(self.renderer.get_pixel(0, 14), GREEN)
+        self.assertEqual(self.renderer.get_pixel(0, 15), vdg.BLACK)
+
+    def test_pmode_4(self):
+        self.set_mode(6, 0xf0, display_offset=0x0e00)
+        self.memory.write_byte(0x0e00 + 32 * 100 + 1, 0b10000001)
+        self.assertEqual(self.update(), [(0, 192, 0, 256)])
+        self.assertEqual(self.renderer.get_pixel(7, 100), vdg.BLACK)
+        self.assertEqual(self.renderer.get_pixel(8, 100), GREEN)
+        self.assertEqual(self.renderer.get_pixel(15, 100), GREEN)
+        self.assertEqual(self.renderer.get_pixel(8, 101), vdg.BLACK)
+
+        self.memory.write_byte(0x0e00 + 32 * 50, 0xff)
+        self.memory.write_byte(0x0e00 + 32 * 51 + 2, 0xff)
+        self.assertEqual(self.update(), [(50, 52, 0, 24)])  # Adjacent rows in one batch
+
+    def test_pmode_3(self):
+        self.set_mode(6, 0xe8, display_offset=0x0e00)  # CG6, color set 1
+        self.memory.write_byte(0x0e00 + 32 * 191, 0b00011011)
+        self.update()
+        self.assertEqual(
+            [self.renderer.get_pixel(x, 191) for x in range(0, 8, 2)],
+            [BUFF, CYAN, MAGENTA, ORANGE],
+        )
+
+    def test_pmode_0(self):
+        self.set_mode(3, 0xb0, display_offset=0x0e00)  # RG2: 16 bytes per row, 2 scanlines per row
+        self.memory.write_byte(0x0e00 + 16, 0x80)  # 2nd memory row
+        self.update()
+        self.assertEqual(self.renderer.get_pixel(0, 1), vdg.BLACK)
+        self.assertEqual(self.renderer.get_pixel(0, 2), GREEN)
+        self.assertEqual(self.renderer.get_pixel(1, 3), GREEN)
+        self.assertEqual(self.renderer.get_pixel(2, 2), vdg.BLACK)
+
+    def test_display_offset(self):
+        self.set_mode(0, 0x00, display_offset=0x0400)
+        self.update()
+        self.assertFalse(self.renderer.has_changes(self.memory, 0x0400, 0, 0x00))
+        self.assertTrue(self.renderer.has_changes(self.memory, 0x0600, 0, 0x00))
+
+        self.memory.write_byte(0x0600, 0x80)  # SG4: black
+        self.set_sam_bits(3, 7, 0x0600 // 512)
+        self.assertEqual(self.update(), [(0, 192, 0, 256)])
+        self.assertEqual(self.renderer.get_pixel(0, 0), vdg.BLACK)
+
+    def test_build_tables(self):
+        self.renderer.build_tables()
+        tables = dict(self.renderer._tables)
+        self.assertEqual(len(tables), 4 + 16)  # SG4/SG6 and all graphics modes, in both color sets
+
+        # No table is built while running:
+        for sam_mode, vdg_bits in ((0, 0x00), (0, vdg.VDG_GM0 | vdg.VDG_CSS), (6, 0xf8), (3, 0xb0)):
+            self.set_mode(sam_mode, vdg_bits, display_offset=0x0e00)
+            self.update()
+        self.assertEqual(self.renderer._tables, tables)
+
+    def test_ppm(self):
+        self.update()
+        ppm = self.renderer.get_ppm(12, 24)
+        header = b"P6 256 12 255\n"
+        self.assertTrue(ppm.startswith(header))
+        self.assertEqual(len(ppm), len(header) + 256 * 12 * 3)
+
+
+class VDGScreenTestCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        cfg = MemoryTestCfg(BaseCPUTestCase.UNITTEST_CFG_DICT)
+        self.memory = Memory(cfg)
+        self.cpu = CPU(self.memory, cfg)
+        self.screen = VDGScreen()
+        self.memory.add_write_byte_middleware(self.screen.display_callback, 0x0400, 0x0600)
+        self.screen.clear(self.memory)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def write_text(self, address, txt):
+        for offset, char in enumerate(txt):
+            self.memory.write_byte(address + offset, ord(char) | 0x40)  # Normal (not inverted) chars
+
+    def test_text(self):
+        self.write_text(0x0400 + 32 * 3 + 2, "PRINT 6*7")
+        self.write_text(0x0400 + 32 * 4, "42")
+        self.write_text(0x0400 + 32 * 5, "OK")
+        lines = self.screen.get_lines()
+        self.assertEqual(len(lines), 16)
+        self.assertEqual(lines[3:6], ["  PRINT 6*7", "42", "OK"])
+        self.assertEqual(self.screen.get_written_lines(), ["PRINT 6*7", "42", "OK"])
+        self.assertEqual(self.screen.last_line, "OK")
+
+        self.screen.reset_written()
+        self.assertEqual(self.screen.get_written_lines(), [])
+        self.assertEqual(self.screen.last_line, "")
+
+        self.memory.write_byte(0x0600, 0x41)  # Behind the display RAM: ignored
+        self.assertEqual(self.screen.get_bytes(), self.memory.read_block(0x0400, 0x0600))
+
+    def test_written_cells(self):
+        self.memory.fill(0x0400, 0x0420, 0x41)  # Old content, not via the middleware
+        self.screen.load(self.memory)
+        self.write_text(0x0400 + 4, "NEW")
+        self.assertEqual(self.screen.get_lines()[0], "AAAANEW" + "A" * 25)
+        self.assertEqual(self.screen.get_written_lines(), ["NEW"])
+
+        # Copy a complete row, like scrolling: That's not a single "OK" line
+        self.write_text(0x0400 + 32, "OK" + " " * 30)
+        self.assertEqual(self.screen.last_line, "OK" + " " * 30)
+        self.assertEqual(self.screen.get_written_lines(), ["NEW", "OK"])
+
+    def test_load(self):
+        self.memory.fill(0x0400, 0x0420, 0x41)  # Not via the middleware
+        self.assertEqual(self.screen.get_lines()[0], "")
+        self.screen.load(self.memory)
+        self.assertEqual(self.screen.get_lines()[0], "A" * 32)
+
+    def test_screen_hash(self):
+        empty_hash = self.screen.screen_hash()
+        self.write_text(0x0400, "HELLO")
+        self.assertNotEqual(self.screen.screen_hash(), empty_hash)
+        self.screen.clear(self.memory)
+        self.assertEqual(self.screen.screen_hash(), empty_hash)
+
+    def test_screenshot(self):
+        self.write_text(0x0400, "HELLO")
+        with tempfile.TemporaryDirectory(prefix="DragonPy_") as temp_dir:
+            png_filepath = os.path.join(temp_dir, "screen.png")
+            self.screen.save_screenshot(png_filepath)
+            with open(png_filepath, "rb") as f:
+                png = f.read()
+            ppm_filepath = os.path.join(temp_dir, "screen.ppm")
+            self.screen.save_screenshot(ppm_filepath)
+            with open(ppm_filepath, "rb") as f:
+                ppm = f.read()
+
+        self.assertEqual(png[:8], b"\x89PNG\r\n\x1a\n")
+        self.assertEqual(struct.unpack(">II", png[16:24]), (256, 192))
+
+        # The same pixels as the display renderer:
+        renderer = vdg.VDGRenderer(CHARS_DICT, get_charmap_dict())
+        renderer.update(self.memory, 0x0400, 0, 0)
+        self.assertEqual(ppm, renderer.get_ppm())
+
+        dark, bright = vdg.ALPHA_COLORS[0]
+        self.assertEqual(renderer.get_pixel(0, 0), bright)
+        self.assertEqual(renderer.get_pixel(2, 5), dark)  # Left side of the "H"
@@ -0,0 +1,54 @@
+"""
+    DragonPy - Dragon 32 emulator in Python
+    =======================================
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from dragonpy.core.warp import STOP_CYCLES, STOP_KEY_PRESS, STOP_KEYBOARD_SCAN, STOP_SCREEN_CHANGE, Warp
+from dragonpy.tests.test_base import BaseSessionTestCase
+
+
+class WarpTestCase(BaseSessionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = self.get_session()
+        self.machine = self.session.machine
+
+    def test_keyboard_scan(self):
+        self.session.type("r\n")
+        warp = Warp(self.machine, stop_address=self.session.cfg.STARTUP_END_ADDR)
+        while warp.run(max_duration=0.1):
+            pass
+        self.assertEqual(warp.stop_reason, STOP_KEYBOARD_SCAN)
+        self.assertTrue(self.session.input_consumed())
+        self.assertIn("P=0400", self.session.get_screen_text())
+        self.assertEqual(self.session.program_counter, self.session.cfg.STARTUP_END_ADDR)
+
+    def test_max_cycles(self):
+        warp = Warp(self.machine, max_cycles=50000)
+        while warp.run(max_duration=0.1):
+            pass
+        self.assertEqual(warp.stop_reason, STOP_CYCLES)
+        self.assertGreaterEqual(warp.cycles, 50000)
+
+    def test_screen_change(self):
+        screen = self.session.screen
+        output_len = screen.output_len
+        warp = Warp(self.machine, screen_changed=lambda: screen.output_len != output_len)
+        self.assertTrue(warp.run(max_duration=0.05))  # Waits for input: no output
+
+        self.session.type("r\n")
+        while warp.run(max_duration=0.1):
+            pass
+        self.assertEqual(warp.stop_reason, STOP_SCREEN_CHANGE)
+
+    def test_stop(self):
+        warp = Warp(self.machine)
+        warp.stop(STOP_KEY_PRESS)
+        start_cycles = self.session.cycles
+        self.assertFalse(warp.run())
+        self.assertEqual(self.session.cycles, start_cycles)
+        self.assertEqual(warp.stop_reason, STOP_KEY_PRESS)
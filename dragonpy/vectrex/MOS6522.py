@@ -43,12 +43,40 @@ class MOS6522VIA:
 
     $D000 - $D7FF 6522 interface adapter
     $D800 - $DFFF 6522 / RAM ?!?
-    """
 
-    def __init__(self, cfg, memory):
+    The timers T1 and T2 are not decremented on every CPU cycle:
+    Their expiry is a event in the device event scheduler
+    (see: dragonpy.core.scheduler) and the counter values are
+    calculated from the remaining CPU cycles.
+    """
+    T1_EVENT = "via.t1"
+    T2_EVENT = "via.t2"
+
+    # Attributes (all int values) stored in save states:
+    STATE_ATTRIBUTES = (
+        "snd_select",
+        "via_ora", "via_orb", "via_ddra", "via_ddrb",
+        "via_t1on", "via_t1int", "via_t1c", "via_t1ll", "via_t1lh", "via_t1pb7",
+        "via_t2on", "via_t2int", "via_t2c", "via_t2ll",
+        "via_sr", "via_srb", "via_src", "via_srclk",
+        "via_acr", "via_pcr", "via_ifr", "via_ier",
+        "via_ca2", "via_cb2h", "via_cb2s",
+        "alg_rsh", "alg_xsh", "alg_ysh", "alg_zsh",
+        "alg_jch0", "alg_jch1", "alg_jch2", "alg_jch3", "alg_jsh",
+        "alg_compare", "alg_dx", "alg_dy", "alg_curr_x", "alg_curr_y", "alg_vectoring",
+        "vector_draw_cnt", "vector_erse_cnt",
+        "fcycles", "t2shift",
+    )
+
+    def __init__(self, cfg, cpu, memory):
         self.cfg = cfg
+        self.cpu = cpu
         self.memory = memory
 
+        self.scheduler = cpu.scheduler
+        self.scheduler.add_event(self.T1_EVENT, self.t1_expired)
+        self.scheduler.add_event(self.T2_EVENT, self.t2_expired)
+
         self.memory.add_read_byte_callback(
             callback_func=self.read_byte,
             start_addr=0xd000,
@@ -119,6 +147,65 @@ class MOS6522VIA:
         self.fcycles = FCYCLES_INIT
         self.t2shift = 0
 
+        self.scheduler.cancel(self.T1_EVENT)
+        self.scheduler.cancel(self.T2_EVENT)
+
+    def get_state(self):
+        self.update_counters()
+        state = {name: getattr(self, name) for name in self.STATE_ATTRIBUTES}
+        state["snd_regs"] = [self.snd_regs[i] for i in range(16)]
+        return state
+
+    def set_state(self, state):
+        for name in self.STATE_ATTRIBUTES:
+            setattr(self, name, state[name])
+        self.snd_regs = dict(enumerate(state["snd_regs"]))
+
+    def int_update(self):
+        if ((self.via_ifr & 0x7f) & (self.via_ier & 0x7f)):
+            self.via_ifr |= 0x80
+        else:
+            self.via_ifr &= 0x7f
+
+    def update_counters(self):
+        """
+        Calculate the current timer counter values from the pending timer events
+        """
+        cycles = self.cpu.cycles
+        remaining = self.scheduler.remaining_cycles(self.T1_EVENT, cycles)
+        if remaining is not None:
+            self.via_t1c = (remaining - 1) & 0xffff
+        remaining = self.scheduler.remaining_cycles(self.T2_EVENT, cycles)
+        if remaining is not None:
+            self.via_t2c = (remaining - 1) & 0xffff
+
+    def t1_expired(self, event_cycles):
+        if self.via_acr & 0x40:
+            # free-run mode: reload the counter from the latches
+            self.via_ifr |= 0x40
+            self.int_update()
+            self.via_t1pb7 = 0x80 - self.via_t1pb7
+            self.via_t1c = (self.via_t1lh << 8) | self.via_t1ll
+            self.scheduler.schedule(self.T1_EVENT, event_cycles + self.via_t1c + 1)
+        else:
+            self.via_t1c = 0xffff
+            if self.via_t1int:
+                self.via_ifr |= 0x40
+                self.int_update()
+                self.via_t1pb7 = 0x80
+                self.via_t1int = 0
+        if self.via_ifr & 0x80:
+            self.cpu.irq()
+
+    def t2_expired(self, event_cycles):
+        self.via_t2c = 0xffff
+        if self.via_t2int:
+            self.via_ifr |= 0x20
+            self.int_update()
+            self.via_t2int = 0
+        if self.via_ifr & 0x80:
+            self.cpu.irq()
+
     def read_byte(self, cpu_cycles, op_address, address):
         result = self.read8(address)
         log.error("%04x| TODO: 6522 read byte from $%04x - Send $%02x back", op_address, address, result)
@@ -168,6 +255,8 @@ class MOS6522VIA:
 
     def read8(self, address):
         switch_addr = address & 0xf
+        if switch_addr in (0x4, 0x5, 0x8, 0x9):
+            self.update_counters()
         if switch_addr == 0x0:
             if self.via_acr & 0x80:
                 data = (self.via_orb & 0x5F) | self.via_t1pb7 | self.alg_compare
@@ -262,6 +351,7 @@ class MOS6522VIA:
         elif switch_addr == 0x5:
             self.via_t1lh = data
             self.via_t1c = (self.via_t1lh << 8) | self.via_t1ll
+            self.scheduler.schedule(self.T1_EVENT, self.cpu.cycles + self.via_t1c + 1)
             self.via_ifr &= 0xbf
             self.via_t1on = 1
             self.via_t1int = 1
@@ -278,6 +368,11 @@ class MOS6522VIA:
             self.via_t2ll = data
         elif switch_addr == 0x9:
             self.via_t2c = (data << 8) | self.via_t2ll
+            if self.via_acr & 0x20:
+                # pulse counting mode: The counter is not decremented by the CPU clock
+                self.scheduler.cancel(self.T2_EVENT)
+            else:
+                self.scheduler.schedule(self.T2_EVENT, self.cpu.cycles + self.via_t2c + 1)
             self.via_ifr &= 0xdf
             self.via_t2on = 1
             self.via_t2int = 1
@@ -14,7 +14,6 @@ import logging
 
 from dragonpy import constants
 from dragonpy.core.configs import BaseConfig
-from dragonpy.vectrex.mem_info import VectrexMemInfo
 from dragonpy.vectrex.vectrex_rom import VectrexRom
 
 
@@ -64,6 +63,8 @@ class VectrexCfg(BaseConfig):
         # TODO:
         # http://www.playvectrex.com/designit/chrissalo/appendixa.htm#Other
         if self.verbosity <= logging.ERROR:
+            from dragonpy.vectrex.mem_info import VectrexMemInfo  # Big tables: import only if used
+
             self.mem_info = VectrexMemInfo(log.debug)
 
 
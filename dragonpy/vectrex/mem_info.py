@@ -9,14 +9,15 @@
 
 import logging
 
-from MC6809.core.memory_info import BaseMemoryInfo
 from MC6809.utils.humanize import nice_hex
 
+from dragonpy.core.mem_info_index import IndexedMemoryInfo
+
 
 log = logging.getLogger(__name__)
 
 
-class VectrexMemInfo(BaseMemoryInfo):
+class VectrexMemInfo(IndexedMemoryInfo):
     MEM_INFO = (
         # TODO: Add info from:
         # * http://www.playvectrex.com/designit/chrissalo/appendixa.htm#Other
@@ -27,7 +27,7 @@ class VectrexPeripheryBase(PeripheryBase):
     def __init__(self, cfg, cpu, memory, display_queue=None, user_input_queue=None):
         super().__init__(cfg, cpu, memory, display_queue, user_input_queue)
 
-        self.via = MOS6522VIA(cfg, memory)
+        self.via = MOS6522VIA(cfg, cpu, memory)
 
         # $0000 - $7FFF Cartridge ROM
         self.memory.add_read_byte_callback(self.cartridge_rom, 0xC000)
@@ -35,6 +35,12 @@ class VectrexPeripheryBase(PeripheryBase):
 
         self.running = True
 
+    def get_state(self):
+        return {"via": self.via.get_state()}
+
+    def set_state(self, state):
+        self.via.set_state(state["via"])
+
     def cartridge_rom(self, cpu_cycles, op_address, address):
         log.error("%04x| TODO: $0000 - $7FFF Cartridge ROM. Send 0x00 back", op_address)
         return 0x00
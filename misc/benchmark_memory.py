@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+    Micro benchmark for dragonpy.components.memory.Memory
+
+    Measures the raw read_byte()/write_byte() dispatch speed and the
+    cycles/sec of a small 6809 copy loop that runs from RAM, with a
+    Dragon 32 like memory layout: A text screen write middleware and
+    I/O callbacks at $ff00-$ffff.
+
+    e.g.:
+        python3 -m misc.benchmark_memory --loops 5
+
+    :created: 2026 by the DragonPy team
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import argparse
+import logging
+import time
+
+from MC6809.components.cpu6809 import CPU
+
+from dragonpy.components.memory import Memory
+from dragonpy.core.configs import BaseConfig
+
+
+CFG_DICT = {
+    "verbosity": None,
+    "trace": None,
+}
+
+# $1000: LDX #$2000
+# $1003: LDA ,X
+# $1005: STA ,X+
+# $1007: CMPX #$7000
+# $100A: BNE $1003
+# $100C: BRA $1000
+COPY_LOOP = (
+    0x8E, 0x20, 0x00,
+    0xA6, 0x84,
+    0xA7, 0x80,
+    0x8C, 0x70, 0x00,
+    0x26, 0xF7,
+    0x20, 0xF2,
+)
+COPY_LOOP_START = 0x1000
+
+
+class BenchmarkCfg(BaseConfig):
+    RAM_START = 0x0000
+    RAM_END = 0x7FFF
+    ROM_START = 0x8000
+    ROM_END = 0xFEFF
+    RESET_VECTOR = 0xFFFE
+    DEFAULT_ROMS = None
+
+
+def dummy_read(cpu_cycles, op_address, address):
+    return 0x7E
+
+
+def dummy_write(cpu_cycles, op_address, address, value):
+    pass
+
+
+def dummy_middleware(cpu_cycles, op_address, address, value):
+    return value
+
+
+def get_memory():
+    cfg = BenchmarkCfg(CFG_DICT)
+    memory = Memory(cfg)
+    # Dragon 32 like periphery hooks:
+    memory.add_write_byte_middleware(dummy_middleware, 0x0400, 0x05ff)  # text screen
+    memory.add_read_byte_callback(dummy_read, 0xff00, 0xffef)
+    memory.add_write_byte_callback(dummy_write, 0xff00, 0xffff)
+    cpu = CPU(memory, cfg)
+    return memory, cpu
+
+
+def bench_read(memory, count):
+    read_byte = memory.read_byte
+    start_time = time.perf_counter()
+    for address in range(count):
+        read_byte(address & 0x7fff)
+    return time.perf_counter() - start_time
+
+
+def bench_write(memory, count):
+    write_byte = memory.write_byte
+    start_time = time.perf_counter()
+    for address in range(count):
+        write_byte(address & 0x7fff, 0x55)
+    return time.perf_counter() - start_time
+
+
+def bench_cpu(memory, cpu, op_count):
+    memory.load(COPY_LOOP_START, COPY_LOOP)
+    cpu.cycles = 0
+    start_time = time.perf_counter()
+    cpu.test_run2(COPY_LOOP_START, op_count)
+    duration = time.perf_counter() - start_time
+    return duration, cpu.cycles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DragonPy Memory micro benchmark")
+    parser.add_argument("--loops", type=int, default=3, help="Repeat every benchmark x times (best is used)")
+    parser.add_argument("--count", type=int, default=1000000, help="read/write_byte() calls per loop")
+    parser.add_argument("--ops", type=int, default=200000, help="CPU op calls per loop")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)  # Memory init logs with log.critical()
+
+    memory, cpu = get_memory()
+
+    read = min(bench_read(memory, args.count) for _ in range(args.loops))
+    print(f"read_byte()  x {args.count}: {read:.3f} sec")
+
+    write = min(bench_write(memory, args.count) for _ in range(args.loops))
+    print(f"write_byte() x {args.count}: {write:.3f} sec")
+
+    results = [bench_cpu(memory, cpu, args.ops) for _ in range(args.loops)]
+    duration, cycles = min(results)
+    print(f"CPU copy loop: {cycles} cycles in {duration:.3f} sec = {cycles / duration:,.0f} cycles/sec")
+
+
+if __name__ == "__main__":
+    main()